@@ -0,0 +1,405 @@
+"""인터랙션 부하 생성기: 가짜 인터랙션으로 명령어 흐름을 동시에 실행
+
+Discord에 연결하지 않고 `CreateCommand`와 `ManageCommand`에 가짜
+`ApplicationContext`/`Interaction`을 넘겨, 사용자마다
+`/create` → 필드 추가 → 저장 → 완료 → `/list` → `/load` → 전송 흐름을 실행합니다.
+응답, 후속 메시지, 채널 전송은 호출만 기록하는 스텁이 받습니다.
+
+핸들러별 지연 시간 분포, 이벤트 루프가 막힌 시간, 메모리 증가량을 보고하므로
+동기 디스크 쓰기나 초안이 무한히 쌓이는 문제를 배포 전에 확인할 수 있습니다.
+
+    python -m benchmarks.load --users 2000 --concurrency 200 --fields 5
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Awaitable
+
+# benchmarks.suite를 포함해 utils를 불러오는 모듈은 SERI_DATA_DIR을 설정한 뒤(main())
+# 함수 안에서 불러옴 (utils.constants가 불러올 때 DATA_DIR을 정하므로)
+
+USER_BASE = 200000000000000000
+
+
+def current_rss_mb() -> float | None:
+    """현재 RSS (MB, Linux 외에는 최대 RSS)"""
+    from benchmarks.suite import peak_rss_mb
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+
+class CallLog:
+    """스텁 호출 기록 (호출 수만 세어 기록 자체가 메모리를 늘리지 않게 함)"""
+
+    def __init__(self, api_latency: float):
+        self.api_latency = api_latency
+        self.calls: Counter[str] = Counter()
+
+    async def record(self, name: str) -> None:
+        """호출 기록 및 API 지연 흉내"""
+        self.calls[name] += 1
+        if self.api_latency:
+            await asyncio.sleep(self.api_latency)
+
+
+class FakeResponse:
+    """`InteractionResponse` 스텁"""
+
+    def __init__(self, interaction: FakeInteraction):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self, name: str, kwargs: dict[str, Any]) -> None:
+        if self._done:
+            raise RuntimeError(f"이미 응답한 인터랙션에 {name} 호출")
+        self._done = True
+        self._interaction.last_view = kwargs.get("view", self._interaction.last_view)
+        await self._interaction.log.record(f"response.{name}")
+
+    async def send_message(self, content: str | None = None, **kwargs: Any) -> None:
+        await self._respond("send_message", kwargs)
+
+    async def edit_message(self, **kwargs: Any) -> None:
+        await self._respond("edit_message", kwargs)
+
+    async def defer(self, **kwargs: Any) -> None:
+        await self._respond("defer", kwargs)
+
+    async def send_modal(self, modal: Any) -> None:
+        self._interaction.last_modal = modal
+        await self._respond("send_modal", {})
+
+
+class FakeFollowup:
+    """`Webhook` 후속 메시지 스텁"""
+
+    def __init__(self, interaction: FakeInteraction):
+        self._interaction = interaction
+
+    async def send(self, content: str | None = None, **kwargs: Any) -> None:
+        self._interaction.last_view = kwargs.get("view", self._interaction.last_view)
+        await self._interaction.log.record("followup.send")
+
+
+class FakeChannel:
+    """채널 스텁"""
+
+    def __init__(self, log: CallLog):
+        self.log = log
+        self.id = 1
+
+    async def send(self, content: str | None = None, **kwargs: Any) -> None:
+        await self.log.record("channel.send")
+
+
+class FakeInteraction:
+    """`Interaction` 스텁"""
+
+    def __init__(self, user_id: int, log: CallLog, channel: FakeChannel):
+        self.user = types.SimpleNamespace(id=user_id, mention=f"<@{user_id}>")
+        self.log = log
+        self.channel = channel
+        self.guild = None
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.last_view: Any = None
+        self.last_modal: Any = None
+
+    async def edit_original_response(self, **kwargs: Any) -> None:
+        await self.log.record("edit_original_response")
+
+
+class FakeContext:
+    """`ApplicationContext` 스텁"""
+
+    def __init__(self, interaction: FakeInteraction):
+        self.interaction = interaction
+        self.user = interaction.user
+        self.guild = None
+        self.channel = interaction.channel
+        self.response = interaction.response
+        self.followup = interaction.followup
+
+    async def respond(self, content: str | None = None, **kwargs: Any) -> None:
+        if self.response.is_done():
+            await self.followup.send(content, **kwargs)
+        else:
+            await self.response.send_message(content, **kwargs)
+
+    async def defer(self, **kwargs: Any) -> None:
+        await self.response.defer(**kwargs)
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정
+
+    짧은 간격으로 잠들었다 깨어나며 예정보다 늦은 만큼을 루프가 막힌
+    시간으로 기록합니다.
+
+    Args:
+        interval: 측정 간격 (초)
+        threshold: 막힘으로 셀 최소 지연 (초)
+    """
+
+    def __init__(self, interval: float = 0.005, threshold: float = 0.02):
+        self.interval = interval
+        self.threshold = threshold
+        self.lags: list[float] = []
+        self.blocked = 0.0
+        self.stalls = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self.lags.append(lag)
+            if lag >= self.threshold:
+                self.blocked += lag
+                self.stalls += 1
+
+
+class LoadRunner:
+    """사용자 흐름 실행 및 단계별 지연 시간 수집"""
+
+    def __init__(self, bot: Any, args: argparse.Namespace):
+        from commands.create import CreateCommand
+        from commands.manage import ManageCommand
+
+        self.bot = bot
+        self.args = args
+        self.create = CreateCommand(bot)
+        self.manage = ManageCommand(bot)
+        self.log = CallLog(args.api_latency / 1000)
+        self.channel = FakeChannel(self.log)
+        self.latencies: defaultdict[str, list[float]] = defaultdict(list)
+        self.errors: Counter[str] = Counter()
+
+    def _interaction(self, user_id: int) -> FakeInteraction:
+        return FakeInteraction(user_id, self.log, self.channel)
+
+    async def _step(self, name: str, handler: Awaitable[Any]) -> None:
+        """핸들러 하나 실행 및 지연 시간 기록"""
+        started = time.perf_counter()
+        await handler
+        self.latencies[name].append(time.perf_counter() - started)
+
+    async def _think(self, rng: random.Random) -> None:
+        """사용자 입력 사이의 대기"""
+        if self.args.think:
+            await asyncio.sleep(rng.uniform(0, self.args.think / 1000))
+
+    @staticmethod
+    def _fill(modal: Any, *values: str) -> None:
+        """모달 입력값 채우기"""
+        for item, value in zip(modal.children, values):
+            item.value = value
+
+    async def user_flow(self, index: int) -> None:
+        """사용자 한 명의 전체 흐름"""
+        rng = random.Random(self.args.seed + index)
+        user_id = USER_BASE + index
+        embed_name = f"load-{index}"
+
+        # /create → 첫 모달
+        ctx = FakeContext(self._interaction(user_id))
+        await self._step("/create", self.create.create_embed.callback(self.create, ctx, False))
+        modal = ctx.interaction.last_modal
+        self._fill(modal, f"부하 테스트 {index}", "부하 테스트 설명입니다. " * rng.randint(1, 20), "BLUE")
+        interaction = self._interaction(user_id)
+        await self._step("create_modal", modal.callback(interaction))
+        builder = interaction.last_view
+
+        # 필드 추가 (버튼 → 모달 제출)
+        for n in range(self.args.fields):
+            await self._think(rng)
+            interaction = self._interaction(user_id)
+            await self._step("add_field_button", builder.add_field_button.callback(interaction))
+            modal = interaction.last_modal
+            self._fill(modal, f"필드 {n}", "내용 " * rng.randint(1, 50), "yes" if n % 2 else "no")
+            await self._step("add_field", modal.callback(self._interaction(user_id)))
+
+        # 저장 (버튼 → 이름 모달 제출)
+        await self._think(rng)
+        interaction = self._interaction(user_id)
+        await self._step("save_button", builder.save_button.callback(interaction))
+        modal = interaction.last_modal
+        self._fill(modal, embed_name)
+        await self._step("save", modal.callback(self._interaction(user_id)))
+
+        await self._think(rng)
+        await self._step("done", builder.done_button.callback(self._interaction(user_id)))
+
+        # /list → /load → 전송
+        await self._think(rng)
+        ctx = FakeContext(self._interaction(user_id))
+        await self._step("/list", self.manage.list_embeds.callback(self.manage, ctx))
+
+        await self._think(rng)
+        ctx = FakeContext(self._interaction(user_id))
+        await self._step("/load", self.manage.load_embed.callback(self.manage, ctx, embed_name))
+        loaded = ctx.interaction.last_view
+        if loaded is None:
+            self.errors["load_missing"] += 1
+            return
+
+        await self._step("send", loaded.send_button.callback(self._interaction(user_id)))
+
+    async def run(self) -> float:
+        """모든 사용자 흐름 실행
+
+        Returns:
+            전체 실행 시간 (초)
+        """
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+
+        async def guarded(index: int) -> None:
+            async with semaphore:
+                try:
+                    await self.user_flow(index)
+                except Exception as e:
+                    self.errors[type(e).__name__] += 1
+                    if self.errors[type(e).__name__] == 1:
+                        logging.getLogger(__name__).warning(f"사용자 흐름 오류: {e!r}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(guarded(index) for index in range(self.args.users)))
+        return time.perf_counter() - started
+
+
+def print_latencies(latencies: dict[str, list[float]]) -> None:
+    """단계별 지연 시간 분포 출력"""
+    from benchmarks.suite import percentile
+
+    print(f"  {'단계':18} {'횟수':>7} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9} {'최대(ms)':>9}")
+    for name, samples in latencies.items():
+        samples = sorted(samples)
+        print(
+            f"  {name:18} {len(samples):7d}"
+            f" {percentile(samples, 0.50) * 1000:9.3f}"
+            f" {percentile(samples, 0.90) * 1000:9.3f}"
+            f" {percentile(samples, 0.99) * 1000:9.3f}"
+            f" {samples[-1] * 1000:9.3f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """봇을 만들고 부하 실행"""
+    from benchmarks.suite import percentile
+    from main import Seri
+    from utils.constants import BUILDER_RENDER_DELAY, DATA_DIR
+
+    if DATA_DIR.resolve() != Path(os.environ["SERI_DATA_DIR"]).resolve():
+        raise RuntimeError(f"데이터 디렉토리가 임시 디렉토리가 아닙니다: {DATA_DIR}")
+
+    # 사용자 흐름마다 남는 정보 로그는 측정에 방해가 되므로 끔
+    logging.disable(logging.INFO)
+
+    bot = Seri()
+    await bot.data_manager.load_data()
+    await bot.draft_store.start()
+
+    runner = LoadRunner(bot, args)
+    monitor = LoopMonitor(threshold=args.stall_ms / 1000)
+
+    gc.collect()
+    rss_before = current_rss_mb()
+    monitor.start()
+    elapsed = await runner.run()
+    # 디바운스된 빌더 메시지 수정이 끝날 때까지 대기
+    await asyncio.sleep(BUILDER_RENDER_DELAY + 0.2)
+    await monitor.stop()
+    gc.collect()
+    rss_after = current_rss_mb()
+
+    flows = args.users - sum(runner.errors.values())
+    print(f"사용자 {args.users}명 (동시 {args.concurrency}명, 필드 {args.fields}개, 저장소 {args.backend})")
+    print(f"전체 {elapsed:.2f}초, 완료 흐름 초당 {flows / elapsed:.1f}개")
+    print("\n핸들러 지연 시간")
+    print_latencies(runner.latencies)
+
+    lags = sorted(monitor.lags) or [0.0]
+    print("\n이벤트 루프")
+    print(
+        f"  지연 p50 {percentile(lags, 0.50) * 1000:.2f}ms, p99 {percentile(lags, 0.99) * 1000:.2f}ms,"
+        f" 최대 {lags[-1] * 1000:.2f}ms"
+    )
+    print(f"  {args.stall_ms}ms 이상 막힘: {monitor.stalls}회, 합계 {monitor.blocked * 1000:.1f}ms")
+
+    print("\n메모리")
+    if rss_before is not None and rss_after is not None:
+        growth = rss_after - rss_before
+        print(f"  RSS {rss_before:.1f}MB → {rss_after:.1f}MB (+{growth:.1f}MB, 사용자당 {growth * 1024 / args.users:.1f}KB)")
+    draft_stats = bot.draft_store.get_stats()
+    print(
+        f"  남은 초안 {draft_stats['drafts']}개 ({draft_stats['draft_bytes'] / 1024:.0f}KB),"
+        f" 빌더 세션 {len(runner.create._sessions)}개"
+    )
+    print(f"  실행 중인 태스크 {len(asyncio.all_tasks()) - 1}개")
+
+    print("\n스텁 호출")
+    for name, count in sorted(runner.log.calls.items()):
+        print(f"  {name:24} {count}")
+    if runner.errors:
+        print("\n오류")
+        for name, count in runner.errors.items():
+            print(f"  {name:24} {count}")
+
+    runner.create.cog_unload()
+    await bot.close()
+
+
+def main() -> None:
+    """부하 생성기 실행"""
+    parser = argparse.ArgumentParser(description="인터랙션 부하 생성기")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200, help="동시에 흐름을 진행하는 사용자 수")
+    parser.add_argument("--fields", type=int, default=5, help="사용자당 추가할 필드 수")
+    parser.add_argument("--backend", default="json", help="저장소 백엔드 (json, sqlite, sharded)")
+    parser.add_argument("--api-latency", type=float, default=20.0, help="스텁 API 호출 지연 (ms, 0이면 핸들러가 양보하지 않음)")
+    parser.add_argument("--think", type=float, default=0.0, help="사용자 입력 사이 최대 대기 (ms)")
+    parser.add_argument("--stall-ms", type=float, default=20.0, help="루프 막힘으로 셀 최소 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 실제 data 디렉토리를 건드리지 않도록 utils와 main을 불러오기 전에 설정
+        os.environ["SERI_DATA_DIR"] = tmp
+        os.environ["SERI_STORAGE"] = args.backend
+        if sys.platform == "win32":
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""메모리 벤치마크: 임베드 딕셔너리 vs EmbedDocument
+
+    python -m benchmarks.memory --embeds 100000
+"""
+from __future__ import annotations
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.startup import make_embed
+from utils.embed_document import EmbedDocument
+
+
+def measure(build: Callable[[], list[Any]]) -> int:
+    """생성된 객체 목록이 유지하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="임베드 메모리 벤치마크")
+    parser.add_argument("--embeds", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    def corpus() -> list[dict[str, Any]]:
+        # 매번 같은 내용을 새로 만들어 문자열 공유가 결과에 섞이지 않게 함
+        rng = random.Random(args.seed)
+        return [make_embed(rng, i) for i in range(args.embeds)]
+
+    cases = {
+        "dict (이전 형식, 모든 키)": corpus,
+        "dict (to_dict, 빈 값 생략)": lambda: [EmbedDocument.from_dict(d).to_dict() for d in corpus()],
+        "EmbedDocument": lambda: [EmbedDocument.from_dict(d) for d in corpus()],
+    }
+
+    print(f"임베드 {args.embeds}개")
+    baseline = None
+    for label, build in cases.items():
+        total = measure(build)
+        baseline = baseline or total
+        print(
+            f"{label:28} {total / 1024 / 1024:8.1f}MB"
+            f"  {total / args.embeds:7.0f}B/임베드  ({total / baseline:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""시작 시간 벤치마크: JSON 저장 파일 vs 바이너리 스냅샷
+
+    python -m benchmarks.startup --users 100000
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from utils.snapshot import SnapshotReader, json_to_snapshot
+
+
+def make_embed(rng: random.Random, index: int) -> dict[str, Any]:
+    """합성 임베드 데이터 생성"""
+    return {
+        "title": f"공지 {index}",
+        "description": "서버 공지사항입니다. " * rng.randint(1, 8),
+        "color": rng.randint(0, 0xFFFFFF),
+        "fields": [
+            {"name": f"필드 {n}", "value": "내용 " * rng.randint(1, 10), "inline": bool(n % 2)}
+            for n in range(rng.randint(0, 5))
+        ],
+        "author": None,
+        "footer": None,
+        "image": None,
+        "thumbnail": None,
+    }
+
+
+def make_store(users: int, embeds_per_user: int, seed: int = 0) -> dict[str, dict[str, Any]]:
+    """합성 저장소 생성"""
+    rng = random.Random(seed)
+    return {
+        str(100000000000000000 + user): {
+            f"embed-{n}": make_embed(rng, n)
+            for n in range(rng.randint(1, embeds_per_user))
+        }
+        for user in range(users)
+    }
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--embeds-per-user", type=int, default=5)
+    args = parser.parse_args()
+
+    store = make_store(args.users, args.embeds_per_user)
+    probe = int(next(iter(store)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "embeds.json"
+        snapshot_path = Path(tmp) / "embeds.snap"
+
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(store, f, indent=2, ensure_ascii=False)
+        del store
+        json_to_snapshot(json_path, snapshot_path)
+
+        started = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as f:
+            json.load(f)
+        json_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        reader = SnapshotReader(snapshot_path)
+        open_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        reader.get(probe)
+        decode_ms = (time.perf_counter() - started) * 1000
+        reader.close()
+
+        print(f"사용자: {args.users}명")
+        print(f"JSON 크기: {json_path.stat().st_size / 1024 / 1024:.1f}MB, "
+              f"스냅샷 크기: {snapshot_path.stat().st_size / 1024 / 1024:.1f}MB")
+        print(f"json.load 전체: {json_ms:.1f}ms")
+        print(f"스냅샷 열기: {open_ms:.3f}ms, 사용자 1명 디코딩: {decode_ms:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""벤치마크 모음: 저장소, 렌더링, 직렬화 핵심 경로
+
+Discord에 연결하지 않고 합성 저장소를 만들어 측정합니다. 백엔드와 크기마다
+준비와 측정을 별도 프로세스에서 실행하므로 최대 RSS가 서로 섞이지 않습니다.
+
+    python -m benchmarks.suite --sizes 1k,100k --backends json,sqlite,sharded
+    python -m benchmarks.suite --save-baseline     # 결과를 기준값으로 저장
+    python -m benchmarks.suite --check             # 기준값보다 느려지면 종료 코드 1
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.startup import make_embed
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+BACKENDS = ("json", "sqlite", "sharded")
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+USER_BASE = 100000000000000000
+
+# 보고서에 표시하는 순서
+OPERATIONS = (
+    "load_data",
+    "get_embed",
+    "list_embeds",
+    "save_embed",
+    "render",
+    "export_json",
+    "save_data",
+)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """정렬된 표본의 백분위수"""
+    return samples[min(len(samples) - 1, round(q * (len(samples) - 1)))]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """측정 시간(초) 목록 요약
+
+    Returns:
+        초당 처리 수, p50/p99 지연 시간 (ms), 표본 수
+    """
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "ops_per_sec": len(samples) / total if total > 0 else float("inf"),
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "count": len(samples),
+    }
+
+
+def peak_rss_mb() -> float | None:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def write_legacy_store(path: Path, users: int, embeds_per_user: int, seed: int) -> int:
+    """이전 형식 embeds.json을 사용자 단위로 기록 (전체를 메모리에 만들지 않음)
+
+    Returns:
+        기록한 임베드 수
+    """
+    rng = random.Random(seed)
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for user in range(users):
+            embeds = {f"embed-{n}": make_embed(rng, n) for n in range(rng.randint(1, embeds_per_user))}
+            count += len(embeds)
+            if user:
+                f.write(",")
+            f.write(f'"{USER_BASE + user}":{json.dumps(embeds, ensure_ascii=False)}')
+        f.write("}")
+    return count
+
+
+async def prepare(backend: str, users: int, embeds_per_user: int, seed: int) -> dict[str, Any]:
+    """합성 저장소를 만들고 백엔드 형식으로 이전"""
+    from utils.constants import DATA_DIR
+    from utils.data_manager import create_data_manager
+
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    embeds = write_legacy_store(DATA_DIR / "embeds.json", users, embeds_per_user, seed)
+
+    # 첫 로드에서 이전하고, 저장으로 백엔드 형식(스냅샷, DB, 샤드)을 완성
+    data_manager = create_data_manager(None, backend)
+    await data_manager.load_data()
+    await data_manager.save_data()
+    await data_manager.close()
+    return {"embeds": embeds}
+
+
+async def measure(backend: str, users: int, ops: int, seed: int) -> dict[str, Any]:
+    """준비된 저장소에서 핵심 경로 측정"""
+    from utils.data_manager import create_data_manager
+    from utils.embed_renderer import EmbedRenderer
+
+    rng = random.Random(seed + 1)
+    results: dict[str, dict[str, float]] = {}
+    perf = time.perf_counter
+
+    data_manager = create_data_manager(None, backend)
+    started = perf()
+    await data_manager.load_data()
+    results["load_data"] = summarize([perf() - started])
+
+    user_ids = [USER_BASE + rng.randrange(users) for _ in range(ops)]
+
+    samples = []
+    documents = []
+    for user_id in user_ids:
+        started = perf()
+        embed_data = await data_manager.get_embed(user_id, "embed-0")
+        samples.append(perf() - started)
+        documents.append(embed_data)
+    results["get_embed"] = summarize(samples)
+
+    samples = []
+    for user_id in user_ids:
+        started = perf()
+        await data_manager.list_embeds(user_id)
+        samples.append(perf() - started)
+    results["list_embeds"] = summarize(samples)
+
+    samples = []
+    for index, (user_id, embed_data) in enumerate(zip(user_ids, documents)):
+        embed_data = embed_data.copy()
+        embed_data.title = f"벤치마크 {index}"
+        started = perf()
+        await data_manager.save_embed(user_id, f"bench-{index}", embed_data)
+        samples.append(perf() - started)
+    results["save_embed"] = summarize(samples)
+
+    renderer = EmbedRenderer()
+    samples = []
+    for embed_data in documents:
+        started = perf()
+        renderer.render(embed_data)
+        samples.append(perf() - started)
+    results["render"] = summarize(samples)
+
+    # JSON 내보내기 버튼과 같은 직렬화
+    samples = []
+    for embed_data in documents:
+        started = perf()
+        json.dumps(embed_data.to_dict(), indent=2, ensure_ascii=False)
+        samples.append(perf() - started)
+    results["export_json"] = summarize(samples)
+
+    started = perf()
+    await data_manager.save_data()
+    results["save_data"] = summarize([perf() - started])
+
+    await data_manager.close()
+    return {"ops": results, "peak_rss_mb": peak_rss_mb()}
+
+
+def run_worker(mode: str, backend: str, users: int, args: argparse.Namespace, data_dir: Path) -> dict[str, Any]:
+    """별도 프로세스에서 준비 또는 측정 실행"""
+    command = [
+        sys.executable, "-m", "benchmarks.suite",
+        "--worker", mode,
+        "--backends", backend,
+        "--users", str(users),
+        "--ops", str(args.ops),
+        "--embeds-per-user", str(args.embeds_per_user),
+        "--seed", str(args.seed),
+    ]
+    env = {**os.environ, "SERI_DATA_DIR": str(data_dir)}
+    proc = subprocess.run(
+        command,
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{mode} 실패 ({backend}, {users}명):\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any] | None, threshold: float) -> list[str]:
+    """기준값 대비 회귀 목록"""
+    if baseline is None:
+        return []
+    regressions = []
+    for op, metrics in result["ops"].items():
+        base = baseline["ops"].get(op)
+        if base is None:
+            continue
+        if metrics["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{op}: 초당 처리 {base['ops_per_sec']:.0f} → {metrics['ops_per_sec']:.0f}")
+        if metrics["p99_ms"] > base["p99_ms"] * (1 + threshold) and metrics["p99_ms"] - base["p99_ms"] > 0.05:
+            regressions.append(f"{op}: p99 {base['p99_ms']:.3f}ms → {metrics['p99_ms']:.3f}ms")
+    rss, base_rss = result.get("peak_rss_mb"), baseline.get("peak_rss_mb")
+    if rss and base_rss and rss > base_rss * (1 + threshold):
+        regressions.append(f"최대 RSS {base_rss:.0f}MB → {rss:.0f}MB")
+    return regressions
+
+
+def print_report(key: str, result: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """측정 결과 표 출력"""
+    print(f"\n[{key}] 임베드 {result['embeds']}개")
+    print(f"  {'작업':14} {'초당 처리':>12} {'p50(ms)':>10} {'p99(ms)':>10} {'기준 대비':>10}")
+    for op in OPERATIONS:
+        metrics = result["ops"][op]
+        change = ""
+        if baseline is not None and op in baseline["ops"]:
+            change = f"{metrics['ops_per_sec'] / baseline['ops'][op]['ops_per_sec'] - 1:+.0%}"
+        print(
+            f"  {op:14} {metrics['ops_per_sec']:12.1f} {metrics['p50_ms']:10.3f}"
+            f" {metrics['p99_ms']:10.3f} {change:>10}"
+        )
+    rss = result.get("peak_rss_mb")
+    if rss is not None:
+        base_rss = baseline.get("peak_rss_mb") if baseline else None
+        suffix = f" (기준 {base_rss:.0f}MB)" if base_rss else ""
+        print(f"  최대 RSS: {rss:.0f}MB{suffix}")
+
+
+def main() -> None:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="저장소/렌더링/직렬화 벤치마크")
+    parser.add_argument("--sizes", default="1k,100k", help=f"사용자 수 ({', '.join(SIZES)})")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--ops", type=int, default=2000, help="작업별 측정 횟수")
+    parser.add_argument("--embeds-per-user", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 파일에 저장")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 보는 변화 비율")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--worker", choices=("prepare", "measure"), help=argparse.SUPPRESS)
+    parser.add_argument("--users", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker == "prepare":
+        print(json.dumps(asyncio.run(prepare(args.backends, args.users, args.embeds_per_user, args.seed))))
+        return
+    if args.worker == "measure":
+        print(json.dumps(asyncio.run(measure(args.backends, args.users, args.ops, args.seed))))
+        return
+
+    baselines: dict[str, Any] = {}
+    if args.baseline.exists():
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    results: dict[str, Any] = {}
+    regressions: list[str] = []
+    for size in args.sizes.split(","):
+        users = SIZES[size.strip().lower()]
+        for backend in args.backends.split(","):
+            key = f"{backend}/{size}"
+            with tempfile.TemporaryDirectory() as tmp:
+                prepared = run_worker("prepare", backend, users, args, Path(tmp))
+                result = run_worker("measure", backend, users, args, Path(tmp))
+            result["embeds"] = prepared["embeds"]
+            results[key] = result
+
+            baseline = baselines.get(key)
+            print_report(key, result, baseline)
+            regressions += [f"{key} {line}" for line in compare(result, baseline, args.threshold)]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        baselines.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, ensure_ascii=False)
+        print(f"\n기준값 저장: {args.baseline}")
+
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (허용 {args.threshold:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
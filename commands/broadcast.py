@@ -0,0 +1,180 @@
+"""임베드 브로드캐스트 명령어"""
+from __future__ import annotations
+import logging
+import re
+import time
+import discord
+from discord.ext import commands
+
+from utils.autocomplete import embed_name_autocomplete
+from utils.broadcast import BroadcastResult, Broadcaster
+from utils.constants import BROADCAST_MAX_CHANNELS, BROADCAST_PROGRESS_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# 채널 멘션(<#id>) 또는 ID
+CHANNEL_ID_PATTERN = re.compile(r"<#(\d+)>|(\d{15,20})")
+
+
+class BroadcastCommand(commands.Cog):
+    """임베드 브로드캐스트 명령어"""
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+        # 채널별 속도 제한을 모든 브로드캐스트가 공유
+        self.broadcaster = Broadcaster()
+
+    def _resolve_channels(
+        self,
+        user: discord.abc.User,
+        raw: str
+    ) -> tuple[list[discord.abc.Messageable], list[str]]:
+        """입력 문자열에서 전송 가능한 채널 찾기
+
+        서버가 달라도 되지만, 사용자가 해당 채널에 메시지를 보낼 권한이
+        있어야 합니다.
+
+        Args:
+            user: 명령어 사용자
+            raw: 채널 멘션 또는 ID 목록
+
+        Returns:
+            (전송할 채널 목록, 사용할 수 없는 채널 설명 목록)
+        """
+        channels: list[discord.abc.Messageable] = []
+        rejected: list[str] = []
+        seen: set[int] = set()
+
+        for match in CHANNEL_ID_PATTERN.finditer(raw):
+            channel_id = int(match.group(1) or match.group(2))
+            if channel_id in seen:
+                continue
+            seen.add(channel_id)
+
+            channel = self.bot.get_channel(channel_id)
+            if not isinstance(channel, discord.abc.Messageable) or isinstance(channel, discord.abc.PrivateChannel):
+                rejected.append(f"`{channel_id}`: 채널을 찾을 수 없음")
+                continue
+
+            member = channel.guild.get_member(user.id)
+            if member is None or not channel.permissions_for(member).send_messages:
+                rejected.append(f"{channel.mention}: 전송 권한 없음")
+                continue
+
+            channels.append(channel)
+
+        return channels, rejected
+
+    @staticmethod
+    def _progress_embed(name: str, done: int, total: int) -> discord.Embed:
+        """진행 상황 임베드"""
+        return discord.Embed(
+            title=f"'{name}' 브로드캐스트 중",
+            description=f"{done}/{total} 채널 처리됨",
+            color=0x3498DB
+        )
+
+    @staticmethod
+    def _summary_embed(name: str, results: list[BroadcastResult], rejected: list[str]) -> discord.Embed:
+        """채널별 결과 요약 임베드"""
+        succeeded = sum(1 for result in results if result.ok)
+        failed = len(results) - succeeded + len(rejected)
+
+        lines = [
+            f"✅ {result.channel.mention}" if result.ok
+            else f"❌ {result.channel.mention}: {result.error}"
+            for result in results
+        ]
+        lines.extend(f"❌ {line}" for line in rejected)
+
+        # 임베드 설명 길이 제한 (4096자)
+        description = ""
+        for position, line in enumerate(lines):
+            if len(description) + len(line) + 40 > 4096:
+                description += f"... 외 {len(lines) - position}개"
+                break
+            description += line + "\n"
+
+        embed = discord.Embed(
+            title=f"'{name}' 브로드캐스트 결과",
+            description=description,
+            color=0x2ECC71 if failed == 0 else 0xF39C12
+        )
+        embed.add_field(name="성공", value=str(succeeded), inline=True)
+        embed.add_field(name="실패", value=str(failed), inline=True)
+        return embed
+
+    @discord.slash_command(name="broadcast", description="저장된 임베드를 여러 채널에 전송합니다")
+    @discord.option("name", str, description="전송할 임베드 이름", autocomplete=embed_name_autocomplete)
+    @discord.option("channels", str, description="채널 멘션 또는 ID (공백이나 쉼표로 구분, 다른 서버 채널 가능)")
+    async def broadcast(self, ctx: discord.ApplicationContext, name: str, channels: str) -> None:
+        """임베드 브로드캐스트"""
+        if not self.bot.data_manager:
+            embed = discord.Embed(
+                description="데이터 관리자가 초기화되지 않았습니다.",
+                color=0xE74C3C
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        embed_data = await self.bot.data_manager.get_embed(ctx.user.id, name)
+        if not embed_data:
+            embed = discord.Embed(
+                description=f"'{name}'이라는 임베드를 찾을 수 없습니다.",
+                color=0xE74C3C
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        targets, rejected = self._resolve_channels(ctx.user, channels)
+        if len(targets) > BROADCAST_MAX_CHANNELS:
+            embed = discord.Embed(
+                description=f"한 번에 최대 {BROADCAST_MAX_CHANNELS}개 채널까지 전송할 수 있습니다.",
+                color=0xE74C3C
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        if not targets:
+            embed = discord.Embed(
+                title="전송할 채널이 없습니다",
+                description="\n".join(rejected)[:4096] or "채널 멘션 또는 ID를 입력하세요.",
+                color=0xE74C3C
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        await ctx.respond(embed=self._progress_embed(name, 0, len(targets)), ephemeral=True)
+
+        last_update = time.monotonic()
+
+        async def report(done: int, total: int) -> None:
+            nonlocal last_update
+            # 진행 메시지 수정도 API 호출이므로 간격을 두고 갱신
+            now = time.monotonic()
+            if done == total or now - last_update < BROADCAST_PROGRESS_INTERVAL:
+                return
+            last_update = now
+            await ctx.interaction.edit_original_response(embed=self._progress_embed(name, done, total))
+
+        embed = self.bot.embed_renderer.render(embed_data)
+        results = await self.broadcaster.broadcast(targets, report, embed=embed)
+
+        succeeded = sum(1 for result in results if result.ok)
+        logger.info(f"브로드캐스트 완료: {ctx.user.id} '{name}' {succeeded}/{len(results)}")
+
+        summary = self._summary_embed(name, results, rejected)
+        try:
+            await ctx.interaction.edit_original_response(embed=summary)
+        except discord.HTTPException as e:
+            # 전송이 인터랙션 토큰 유효 시간(15분)을 넘기면 응답을 수정할 수 없으므로 DM으로 전달
+            logger.warning(f"브로드캐스트 결과 표시 실패 ({ctx.user.id}): {e}")
+            try:
+                await ctx.user.send(embed=summary)
+            except discord.HTTPException as e:
+                logger.warning(f"브로드캐스트 결과 DM 전송 실패 ({ctx.user.id}): {e}")
+
+
+def setup(bot: discord.Bot):
+    """명령어 로드"""
+    bot.add_cog(BroadcastCommand(bot))
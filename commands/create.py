@@ -1,16 +1,45 @@
 """임베드 생성 명령어"""
 from __future__ import annotations
+import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 import discord
 from discord.ext import commands
 
-from utils.constants import EMBED_COLORS, MAX_EMBED_FIELDS
+from utils.constants import (
+    BUILDER_RENDER_DELAY,
+    DRAFT_TTL,
+    EMBED_COLORS,
+    INTERACTION_TOKEN_TTL,
+    MAX_EMBED_NAME_LENGTH,
+    MAX_EMBED_TOTAL_LENGTH,
+)
+from utils.embed_document import EmbedBudget, EmbedDocument, EmbedField, EmbedValidationError
 
 logger = logging.getLogger(__name__)
 
 
+def parse_color(value: str) -> int:
+    """색상 이름 또는 16진수 문자열 파싱
+
+    Args:
+        value: 색상 이름 (RED, BLUE 등) 또는 16진수 (0xFF0000, #FF0000, FF0000)
+
+    Returns:
+        색상 값 (범위는 검사하지 않음)
+
+    Raises:
+        ValueError: 색상 이름도 16진수도 아닌 경우
+    """
+    value = value.strip().upper()
+    if value in EMBED_COLORS:
+        return EMBED_COLORS[value]
+    return int(value.removeprefix("#"), 16)
+
+
 class EmbedCreateModal(discord.ui.Modal):
     """임베드 생성 모달"""
 
@@ -35,7 +64,8 @@ class EmbedCreateModal(discord.ui.Modal):
                 placeholder="임베드의 주요 내용을 입력하세요",
                 required=True,
                 style=discord.InputTextStyle.long,
-                max_length=4096
+                # 모달 입력란은 최대 4000자 (임베드 설명 제한 4096자보다 작음)
+                max_length=4000
             )
         )
         
@@ -58,7 +88,8 @@ class CreateEmbedButton(discord.ui.View):
     """임베드 생성 버튼 View"""
 
     def __init__(self, callback):
-        super().__init__(timeout=None)
+        # 초안이 만료되면 버튼도 더 이상 쓸 수 없음
+        super().__init__(timeout=DRAFT_TTL)
         self.callback_func = callback
 
     @discord.ui.button(label="제목 추가", style=discord.ButtonStyle.secondary)
@@ -143,9 +174,9 @@ class CreateEmbedButton(discord.ui.View):
         modal.callback = modal_callback
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(label="미리보기", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="미리보기 끄기", style=discord.ButtonStyle.primary)
     async def preview_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """미리보기 버튼"""
+        """미리보기 표시 전환 버튼"""
         await self.callback_func(interaction, {"action": "preview"})
 
     @discord.ui.button(label="저장", style=discord.ButtonStyle.success)
@@ -159,27 +190,164 @@ class CreateEmbedButton(discord.ui.View):
         await self.callback_func(interaction, {"action": "done"})
 
 
+class BuilderSession:
+    """사용자별 빌더 메시지 상태
+
+    빌더 메시지는 하나만 두고, 액션마다 받은 인터랙션의 원본 응답 수정으로
+    갱신합니다. 가장 최근 인터랙션의 토큰만 사용하므로 15분 토큰 만료와
+    무관하게 편집을 이어갈 수 있습니다.
+
+    Args:
+        view: 빌더 메시지에 붙은 버튼 View
+        budget: 초안의 글자 수 누적 합계 (초안 변경은 모두 이를 통해 적용)
+    """
+
+    __slots__ = ("view", "budget", "interaction", "notice", "show_preview", "updated", "task")
+
+    def __init__(self, view: CreateEmbedButton, budget: EmbedBudget):
+        self.view = view
+        self.budget = budget
+        self.interaction: discord.Interaction | None = None
+        self.notice: str | None = None
+        self.show_preview = True
+        self.updated = time.monotonic()
+        self.task: asyncio.Task | None = None
+
+
 class CreateCommand(commands.Cog):
     """임베드 생성 명령어"""
 
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.user_embeds: dict[int, dict] = {}
+        self.drafts = bot.draft_store
+
+        # 사용자 ID -> 빌더 세션, 오래 사용하지 않은 순
+        self._sessions: OrderedDict[int, BuilderSession] = OrderedDict()
+        self.renders = 0
+        self.coalesced = 0
+
+    def cog_unload(self) -> None:
+        """대기 중인 메시지 수정 취소"""
+        for session in self._sessions.values():
+            if session.task and not session.task.done():
+                session.task.cancel()
+        self._sessions.clear()
+
+    async def _respond_expired(self, interaction: discord.Interaction) -> None:
+        """만료된 초안 안내"""
+        embed = discord.Embed(
+            description="작성 중이던 임베드가 만료되었습니다. `/create` 명령어로 다시 시작해주세요.",
+            color=0xE74C3C
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def _open_session(self, user_id: int, interaction: discord.Interaction, draft: EmbedDocument) -> BuilderSession:
+        """새 빌더 세션 시작 (이전 세션은 폐기)"""
+        self._close_session(user_id)
+        self._prune_sessions()
+        session = BuilderSession(CreateEmbedButton(self._handle_builder_action), EmbedBudget(draft))
+        session.interaction = interaction
+        self._sessions[user_id] = session
+        return session
+
+    def _close_session(self, user_id: int) -> None:
+        """빌더 세션 종료 및 대기 중인 수정 취소"""
+        session = self._sessions.pop(user_id, None)
+        if session is not None and session.task and not session.task.done():
+            session.task.cancel()
+
+    def _prune_sessions(self) -> None:
+        """토큰이 만료된 세션 정리"""
+        deadline = time.monotonic() - INTERACTION_TOKEN_TTL
+        while self._sessions:
+            user_id, session = next(iter(self._sessions.items()))
+            if session.updated >= deadline:
+                break
+            self._close_session(user_id)
+
+    def _builder_message(self, user_id: int, session: BuilderSession, description: str | None = None) -> dict:
+        """빌더 메시지 내용 (빌더 임베드 + 미리보기)
+
+        Returns:
+            `embeds`, `view` 키워드 인자
+        """
+        embed = discord.Embed(
+            title="임베드 빌더",
+            description=description or "아래 버튼을 사용하여 임베드를 커스터마이징하세요.",
+            color=0x3498DB
+        )
+        summary = f"{self._get_embed_summary(user_id)}\n글자 수: {session.budget.total}/{MAX_EMBED_TOTAL_LENGTH}"
+        embed.add_field(name="현재 설정", value=summary, inline=False)
+        if session.notice:
+            embed.add_field(name="알림", value=session.notice, inline=False)
+            session.notice = None
+
+        embeds = [embed]
+        draft = self.drafts.get(user_id)
+        if session.show_preview and draft is not None and (draft.title or draft.description or draft.fields):
+            preview = self.bot.embed_renderer.render(draft)
+            # 6000자 제한은 메시지의 임베드 합계에 적용되므로 빌더 임베드 길이만큼 여유를 둠
+            if len(embed) + len(preview) <= MAX_EMBED_TOTAL_LENGTH:
+                embeds.append(preview)
+            else:
+                embed.add_field(
+                    name="미리보기",
+                    value="빌더 메시지와 함께 표시하기에는 너무 길어 생략했습니다. 완료 후 확인할 수 있습니다.",
+                    inline=False
+                )
+
+        session.view.preview_button.label = "미리보기 끄기" if session.show_preview else "미리보기 켜기"
+        return {"embeds": embeds, "view": session.view}
+
+    def _schedule_render(self, user_id: int, session: BuilderSession, interaction: discord.Interaction) -> None:
+        """빌더 메시지 수정 예약
+
+        대기 중인 수정이 있으면 그 수정에 합쳐지고, 가장 최근 인터랙션으로
+        한 번만 수정합니다.
+        """
+        session.interaction = interaction
+        session.updated = time.monotonic()
+        self._sessions.move_to_end(user_id)
+
+        if session.task is not None and not session.task.done():
+            self.coalesced += 1
+            return
+        session.task = asyncio.create_task(self._render_later(user_id, session))
+
+    async def _render_later(self, user_id: int, session: BuilderSession) -> None:
+        """대기 후 빌더 메시지 수정"""
+        await asyncio.sleep(BUILDER_RENDER_DELAY)
+        # 이후 액션은 새 수정을 예약하도록 내용을 만들기 전에 해제
+        session.task = None
+        interaction = session.interaction
+        if interaction is None or self._sessions.get(user_id) is not session:
+            return
+
+        try:
+            await interaction.edit_original_response(**self._builder_message(user_id, session))
+            self.renders += 1
+        except discord.HTTPException as e:
+            logger.warning(f"빌더 메시지 수정 실패 ({user_id}): {e}")
 
     @discord.slash_command(name="create", description="새로운 임베드를 생성합니다")
-    async def create_embed(self, ctx: discord.ApplicationContext) -> None:
+    @discord.option("new", bool, description="작성 중인 임베드를 버리고 새로 시작", required=False, default=False)
+    async def create_embed(self, ctx: discord.ApplicationContext, new: bool) -> None:
         """임베드 생성 명령어"""
+        # 첫 모달까지 작성한 초안이 있으면 이어서 작업
+        draft = self.drafts.get(ctx.user.id)
+        if not new and draft is not None and draft.description:
+            session = self._open_session(ctx.user.id, ctx.interaction, draft)
+            message = self._builder_message(
+                ctx.user.id,
+                session,
+                "작성 중이던 임베드를 이어서 편집합니다. 새로 시작하려면 `/create new:True`를 사용하세요."
+            )
+            await ctx.respond(**message, ephemeral=True)
+            return
+
         # 사용자의 임베드 초기화
-        self.user_embeds[ctx.user.id] = {
-            "title": None,
-            "description": None,
-            "color": 0x3498DB,
-            "fields": [],
-            "author": None,
-            "footer": None,
-            "image": None,
-            "thumbnail": None
-        }
+        self._close_session(ctx.user.id)
+        self.drafts.put(ctx.user.id, EmbedDocument())
 
         # 첫 번째 모달 표시
         modal = EmbedCreateModal(self._handle_initial_modal)
@@ -188,93 +356,73 @@ class CreateCommand(commands.Cog):
     async def _handle_initial_modal(self, interaction: discord.Interaction, items) -> None:
         """초기 모달 처리"""
         user_id = interaction.user.id
+        embed_data = self.drafts.get(user_id)
         
-        if user_id not in self.user_embeds:
-            await interaction.response.defer()
+        if embed_data is None:
+            await self._respond_expired(interaction)
             return
         
-        embed_data = self.user_embeds[user_id]
-        
-        # 모달 입력값 처리
-        title = items[0].value if items[0].value else None
-        description = items[1].value
+        # 모달 입력값 처리 (제한값은 모달 길이 제한과 같지만 한 번 더 확인)
+        session = self._open_session(user_id, interaction, embed_data)
         color_str = items[2].value if len(items) > 2 and items[2].value else "BLUE"
-        
-        embed_data["title"] = title
-        embed_data["description"] = description
-        
-        # 색상 파싱
-        if color_str.upper() in EMBED_COLORS:
-            embed_data["color"] = EMBED_COLORS[color_str.upper()]
-        else:
-            try:
-                embed_data["color"] = int(color_str.replace("0x", ""), 16)
-            except ValueError:
-                embed_data["color"] = 0x3498DB
+        try:
+            session.budget.set_text("title", items[0].value or None)
+            session.budget.set_text("description", items[1].value)
+        except EmbedValidationError as e:
+            session.notice = str(e)
 
-        # 빌더 View 표시
-        view = CreateEmbedButton(self._handle_builder_action)
-        
-        embed = discord.Embed(
-            title="임베드 빌더",
-            description="아래 버튼을 사용하여 임베드를 커스터마이징하세요.",
-            color=0x3498DB
-        )
-        embed.add_field(name="현재 설정", value=self._get_embed_summary(user_id), inline=False)
-        
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        try:
+            session.budget.set_color(parse_color(color_str))
+        except (ValueError, EmbedValidationError):
+            session.budget.set_color(0x3498DB)
+        self.drafts.put(user_id, embed_data, session.budget.total)
+
+        # 빌더 메시지 표시 (이후 액션은 이 메시지를 수정)
+        await interaction.response.send_message(**self._builder_message(user_id, session), ephemeral=True)
 
     async def _handle_builder_action(self, interaction: discord.Interaction, action_data: dict) -> None:
         """빌더 액션 처리"""
         user_id = interaction.user.id
+        embed_data = self.drafts.get(user_id)
         
-        if user_id not in self.user_embeds:
-            await interaction.response.defer()
+        if embed_data is None:
+            self._close_session(user_id)
+            await self._respond_expired(interaction)
             return
-        
-        embed_data = self.user_embeds[user_id]
-        action = action_data.get("action")
 
-        if action == "set_title":
-            embed_data["title"] = action_data.get("value")
-            await interaction.response.defer()
+        session = self._sessions.get(user_id)
+        if session is None or session.budget.document is not embed_data:
+            # 세션이 정리된 뒤의 버튼 입력이면 이 메시지를 빌더로 다시 사용
+            session = self._open_session(user_id, interaction, embed_data)
 
-        elif action == "add_field":
-            if len(embed_data["fields"]) >= 25:
-                embed = discord.Embed(
-                    description="최대 25개의 필드만 추가할 수 있습니다.",
-                    color=0xE74C3C
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            
-            field = {
-                "name": action_data.get("name"),
-                "value": action_data.get("value"),
-                "inline": action_data.get("inline", False)
-            }
-            embed_data["fields"].append(field)
-            await interaction.response.defer()
-
-        elif action == "set_color":
-            color_str = action_data.get("value", "").upper()
-            if color_str in EMBED_COLORS:
-                embed_data["color"] = EMBED_COLORS[color_str]
-            else:
+        action = action_data.get("action")
+
+        # 제한값을 넘는 변경은 초안에 적용하지 않고 빌더 메시지에 알림으로 표시
+        try:
+            if action == "set_title":
+                session.budget.set_text("title", action_data.get("value"))
+                self.drafts.put(user_id, embed_data, session.budget.total)
+
+            elif action == "add_field":
+                session.budget.add_field(EmbedField(
+                    action_data.get("name"),
+                    action_data.get("value"),
+                    action_data.get("inline", False)
+                ))
+                self.drafts.put(user_id, embed_data, session.budget.total)
+
+            elif action == "set_color":
                 try:
-                    embed_data["color"] = int(color_str.replace("0x", ""), 16)
+                    color = parse_color(action_data.get("value", ""))
                 except ValueError:
-                    await interaction.response.send_message(
-                        "유효하지 않은 색상입니다.",
-                        ephemeral=True
-                    )
-                    return
-            await interaction.response.defer()
-
-        elif action == "preview":
-            preview_embed = self._create_embed(embed_data)
-            await interaction.response.send_message(embed=preview_embed, ephemeral=True)
-            return
+                    raise EmbedValidationError("유효하지 않은 색상입니다.") from None
+                session.budget.set_color(color)
+                self.drafts.put(user_id, embed_data, session.budget.total)
+        except EmbedValidationError as e:
+            session.notice = str(e)
+
+        if action == "preview":
+            session.show_preview = not session.show_preview
 
         elif action == "save":
             modal = discord.ui.Modal(title="임베드 저장")
@@ -283,7 +431,7 @@ class CreateCommand(commands.Cog):
                     label="임베드 이름",
                     placeholder="저장할 임베드의 이름을 입력하세요",
                     required=True,
-                    max_length=50
+                    max_length=MAX_EMBED_NAME_LENGTH
                 )
             )
             
@@ -291,94 +439,71 @@ class CreateCommand(commands.Cog):
                 embed_name = modal.children[0].value
                 
                 if self.bot.data_manager:
-                    self.bot.data_manager.save_embed(user_id, embed_name, embed_data)
-                    
-                    embed = discord.Embed(
-                        description=f"'{embed_name}'으로 저장되었습니다.",
-                        color=0x2ECC71
-                    )
-                    await save_interaction.response.send_message(embed=embed, ephemeral=True)
+                    try:
+                        await self.bot.data_manager.save_embed(user_id, embed_name, embed_data)
+                    except EmbedValidationError as e:
+                        session.notice = f"저장할 수 없습니다: {e}"
+                    else:
+                        session.notice = f"'{embed_name}'으로 저장되었습니다."
+
+                await save_interaction.response.defer()
+                self._schedule_render(user_id, session, save_interaction)
             
             modal.callback = save_modal_callback
             await interaction.response.send_modal(modal)
             return
 
         elif action == "done":
-            # 최종 임베드 표시
-            final_embed = self._create_embed(embed_data)
-            
+            # 빌더 메시지를 최종 임베드로 바로 교체
+            final_embed = self.bot.embed_renderer.render(embed_data)
             send_view = SendEmbedView(final_embed, embed_data)
             embed = discord.Embed(
                 description="임베드 생성이 완료되었습니다. 아래에서 임베드를 전송하거나 JSON으로 내보낼 수 있습니다.",
                 color=0x2ECC71
             )
-            await interaction.response.send_message(embed=embed, view=send_view, ephemeral=True)
-            
-            if user_id in self.user_embeds:
-                del self.user_embeds[user_id]
-            return
+            # 두 임베드의 합계가 제한을 넘으면 완료 안내는 본문으로 보냄
+            if len(embed) + len(final_embed) <= MAX_EMBED_TOTAL_LENGTH:
+                message = {"embeds": [embed, final_embed]}
+            else:
+                message = {"content": embed.description, "embeds": [final_embed]}
 
-        # 상태 업데이트 메시지
-        view = CreateEmbedButton(self._handle_builder_action)
-        embed = discord.Embed(
-            title="임베드 빌더",
-            description="아래 버튼을 사용하여 임베드를 계속 커스터마이징하세요.",
-            color=0x3498DB
-        )
-        embed.add_field(name="현재 설정", value=self._get_embed_summary(user_id), inline=False)
-        
-        # 이전 메시지 수정 (defer 후 불가능하므로 새 메시지)
-        if action != "preview" and action != "save" and action != "done":
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+            try:
+                await interaction.response.edit_message(**message, view=send_view)
+            except discord.HTTPException as e:
+                # 수정에 실패하면 초안과 세션을 남겨 다시 시도할 수 있게 함
+                logger.warning(f"최종 임베드 표시 실패 ({user_id}): {e}")
+                session.notice = "최종 임베드를 표시하지 못했습니다. 다시 시도해주세요."
+                if not interaction.response.is_done():
+                    await interaction.response.defer()
+                self._schedule_render(user_id, session, interaction)
+                return
 
-    def _create_embed(self, embed_data: dict) -> discord.Embed:
-        """임베드 객체 생성"""
-        embed = discord.Embed(
-            title=embed_data.get("title"),
-            description=embed_data.get("description"),
-            color=embed_data.get("color", 0x3498DB)
-        )
-        
-        for field in embed_data.get("fields", []):
-            embed.add_field(
-                name=field.get("name"),
-                value=field.get("value"),
-                inline=field.get("inline", False)
-            )
-        
-        if embed_data.get("author"):
-            embed.set_author(name=embed_data["author"])
-        
-        if embed_data.get("footer"):
-            embed.set_footer(text=embed_data["footer"])
-        
-        if embed_data.get("image"):
-            embed.set_image(url=embed_data["image"])
-        
-        if embed_data.get("thumbnail"):
-            embed.set_thumbnail(url=embed_data["thumbnail"])
-        
-        return embed
+            self._close_session(user_id)
+            self.drafts.pop(user_id)
+            return
+
+        # 응답은 즉시 확인하고, 메시지 수정은 연속 액션을 모아 한 번에 처리
+        await interaction.response.defer()
+        self._schedule_render(user_id, session, interaction)
 
     def _get_embed_summary(self, user_id: int) -> str:
         """임베드 요약 정보"""
-        if user_id not in self.user_embeds:
+        data = self.drafts.get(user_id)
+        if data is None:
             return "임베드 정보 없음"
         
-        data = self.user_embeds[user_id]
         summary = ""
         
-        if data.get("title"):
-            summary += f"제목: {data['title']}\n"
-        if data.get("description"):
-            summary += f"설명: {data['description'][:50]}...\n"
+        if data.title:
+            summary += f"제목: {data.title}\n"
+        if data.description:
+            summary += f"설명: {data.description[:50]}...\n"
         
-        field_count = len(data.get("fields", []))
+        field_count = len(data.fields)
         if field_count > 0:
             summary += f"필드: {field_count}개\n"
         
-        color = data.get("color", 0x3498DB)
-        summary += f"색상: #{color:06X}"
+        summary += f"색상: #{data.color:06X}"
         
         return summary if summary else "기본 설정 상태"
 
@@ -386,7 +511,7 @@ class CreateCommand(commands.Cog):
 class SendEmbedView(discord.ui.View):
     """임베드 전송 View"""
 
-    def __init__(self, embed: discord.Embed, embed_data: dict):
+    def __init__(self, embed: discord.Embed, embed_data: EmbedDocument):
         super().__init__(timeout=600)
         self.embed = embed
         self.embed_data = embed_data
@@ -411,7 +536,7 @@ class SendEmbedView(discord.ui.View):
     @discord.ui.button(label="JSON 내보내기", style=discord.ButtonStyle.secondary)
     async def export_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         """JSON으로 내보내기"""
-        json_str = json.dumps(self.embed_data, indent=2, ensure_ascii=False)
+        json_str = json.dumps(self.embed_data.to_dict(), indent=2, ensure_ascii=False)
         
         # 너무 길면 파일로 전송
         if len(json_str) > 1900:
@@ -2,18 +2,82 @@
 from __future__ import annotations
 import json
 import logging
+from collections import OrderedDict
 from typing import Optional
 import discord
 from discord.ext import commands
 
+from utils.autocomplete import embed_name_autocomplete
+from utils.constants import LIST_PAGE_CACHE_USERS
+from utils.data_manager import EmbedPage
+from utils.embed_document import EmbedDocument
+
 logger = logging.getLogger(__name__)
 
+SORT_LABELS = {"name": "이름순", "recent": "최근 저장순"}
+
+# 렌더링된 목록 페이지
+RenderedPage = tuple[discord.Embed, EmbedPage]
+
 
 class ManageCommand(commands.Cog):
     """임베드 관리 명령어"""
 
     def __init__(self, bot: discord.Bot):
         self.bot = bot
+        # 사용자 ID -> {(정렬, 커서): 렌더링된 페이지}
+        self._page_cache: OrderedDict[int, dict[tuple[str, str | None], RenderedPage]] = OrderedDict()
+        self._page_invalidations = 0
+
+        if self.bot.data_manager:
+            self.bot.data_manager.add_change_listener(self._invalidate_pages)
+
+    def cog_unload(self) -> None:
+        """변경 리스너 해제"""
+        if self.bot.data_manager:
+            self.bot.data_manager.remove_change_listener(self._invalidate_pages)
+
+    def _invalidate_pages(self, user_id: int) -> None:
+        """사용자의 임베드가 바뀌면 캐시된 페이지 폐기"""
+        self._page_invalidations += 1
+        self._page_cache.pop(user_id, None)
+
+    async def render_page(self, user_id: int, sort: str, cursor: str | None) -> RenderedPage:
+        """목록 페이지 렌더링 (사용자별 캐시)
+
+        Args:
+            user_id: 사용자 ID
+            sort: "name" 또는 "recent"
+            cursor: 페이지 커서 (첫 페이지는 None)
+
+        Returns:
+            (목록 임베드, 페이지)
+        """
+        key = (sort, cursor)
+        user_pages = self._page_cache.get(user_id)
+        if user_pages is not None and key in user_pages:
+            self._page_cache.move_to_end(user_id)
+            return user_pages[key]
+
+        invalidations = self._page_invalidations
+        page = await self.bot.data_manager.list_embeds_page(user_id, sort, cursor)
+
+        embed = discord.Embed(
+            title="저장된 임베드 목록",
+            description="\n".join([f"• {name}" for name in page.names]),
+            color=0x3498DB
+        )
+        embed.set_footer(text=f"총 {page.total}개 · {SORT_LABELS[sort]}")
+        rendered = (embed, page)
+
+        # 조회 중에 변경이 있었으면 오래된 페이지를 캐시하지 않음
+        if invalidations == self._page_invalidations:
+            self._page_cache.setdefault(user_id, {})[key] = rendered
+            self._page_cache.move_to_end(user_id)
+            while len(self._page_cache) > LIST_PAGE_CACHE_USERS:
+                self._page_cache.popitem(last=False)
+
+        return rendered
 
     @discord.slash_command(name="list", description="저장된 임베드 목록을 확인합니다")
     async def list_embeds(self, ctx: discord.ApplicationContext) -> None:
@@ -26,9 +90,10 @@ class ManageCommand(commands.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
             return
         
-        embed_names = self.bot.data_manager.list_embeds(ctx.user.id)
+        view = EmbedListView(self, ctx.user.id)
+        embed = await view.render()
         
-        if not embed_names:
+        if view.page.total == 0:
             embed = discord.Embed(
                 description="저장된 임베드가 없습니다. `/create` 명령어로 새로운 임베드를 만들어보세요.",
                 color=0x3498DB
@@ -36,18 +101,10 @@ class ManageCommand(commands.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
             return
         
-        # 목록 표시
-        view = EmbedListView(self.bot, ctx.user.id, embed_names)
-        embed = discord.Embed(
-            title="저장된 임베드 목록",
-            description="\n".join([f"• {name}" for name in embed_names]),
-            color=0x3498DB
-        )
-        embed.set_footer(text=f"총 {len(embed_names)}개")
-        
         await ctx.respond(embed=embed, view=view, ephemeral=True)
 
     @discord.slash_command(name="load", description="저장된 임베드를 불러옵니다")
+    @discord.option("name", str, description="불러올 임베드 이름", autocomplete=embed_name_autocomplete)
     async def load_embed(self, ctx: discord.ApplicationContext, name: str) -> None:
         """임베드 불러오기"""
         if not self.bot.data_manager:
@@ -58,7 +115,7 @@ class ManageCommand(commands.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
             return
         
-        embed_data = self.bot.data_manager.get_embed(ctx.user.id, name)
+        embed_data = await self.bot.data_manager.get_embed(ctx.user.id, name)
         
         if not embed_data:
             embed = discord.Embed(
@@ -69,8 +126,8 @@ class ManageCommand(commands.Cog):
             return
         
         # 임베드 생성
-        loaded_embed = self._create_embed(embed_data)
-        view = LoadedEmbedView(loaded_embed, embed_data, self.bot, ctx.user.id, name)
+        loaded_embed = self.bot.embed_renderer.render(embed_data)
+        view = LoadedEmbedView(self.bot, ctx.user.id, loaded_embed, embed_data, name)
         
         info_embed = discord.Embed(
             title=f"'{name}' 불러옴",
@@ -81,88 +138,113 @@ class ManageCommand(commands.Cog):
         await ctx.respond(embed=info_embed, ephemeral=True)
         await ctx.followup.send(embed=loaded_embed, view=view, ephemeral=True)
 
-    def _create_embed_from_data(self, embed_data: dict) -> discord.Embed:
-        """임베드 객체 생성"""
-        embed = discord.Embed(
-            title=embed_data.get("title"),
-            description=embed_data.get("description"),
-            color=embed_data.get("color", 0x3498DB)
-        )
-        
-        for field in embed_data.get("fields", []):
-            embed.add_field(
-                name=field.get("name"),
-                value=field.get("value"),
-                inline=field.get("inline", False)
-            )
-        
-        if embed_data.get("author"):
-            embed.set_author(name=embed_data["author"])
-        
-        if embed_data.get("footer"):
-            embed.set_footer(text=embed_data["footer"])
-        
-        if embed_data.get("image"):
-            embed.set_image(url=embed_data["image"])
-        
-        if embed_data.get("thumbnail"):
-            embed.set_thumbnail(url=embed_data["thumbnail"])
-        
-        return embed
-
 
 class EmbedListView(discord.ui.View):
-    """임베드 목록 View"""
+    """페이지 단위 임베드 목록 View"""
 
-    def __init__(self, bot: discord.Bot, user_id: int, embed_names: list[str]):
+    def __init__(self, cog: ManageCommand, user_id: int, sort: str = "name"):
         super().__init__(timeout=600)
-        self.bot = bot
+        self.cog = cog
+        self.bot = cog.bot
         self.user_id = user_id
-        self.embed_names = embed_names
+        self.sort = sort
+        self.cursor: str | None = None
+        self.cursor_history: list[str | None] = []
+        self.page: EmbedPage | None = None
 
-    @discord.ui.button(label="불러오기", style=discord.ButtonStyle.primary)
-    async def load_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
-        """임베드 불러오기"""
-        select = discord.ui.Select(
-            placeholder="불러올 임베드를 선택하세요",
-            options=[
+        self.select = discord.ui.Select(placeholder="불러올 임베드를 선택하세요", row=0)
+        self.select.callback = self._select_callback
+
+    @property
+    def embed_names(self) -> list[str]:
+        """현재 페이지의 임베드 이름"""
+        return self.page.names if self.page else []
+
+    async def render(self) -> discord.Embed:
+        """현재 페이지 렌더링 및 컴포넌트 상태 갱신"""
+        embed, self.page = await self.cog.render_page(self.user_id, self.sort, self.cursor)
+
+        # Select는 옵션이 1개 이상이어야 함
+        if self.page.names:
+            self.select.options = [
                 discord.SelectOption(label=name, value=name)
-                for name in self.embed_names
+                for name in self.page.names
             ]
-        )
+            if self.select not in self.children:
+                self.add_item(self.select)
+        elif self.select in self.children:
+            self.remove_item(self.select)
+
+        self.prev_button.disabled = not self.cursor_history
+        self.next_button.disabled = self.page.next_cursor is None
+        self.sort_button.label = SORT_LABELS["recent" if self.sort == "name" else "name"]
+        return embed
+
+    async def _show(self, interaction: discord.Interaction) -> None:
+        """현재 페이지로 메시지 수정"""
+        embed = await self.render()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary, row=1)
+    async def prev_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """이전 페이지"""
+        if self.cursor_history:
+            self.cursor = self.cursor_history.pop()
+        await self._show(interaction)
+
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.secondary, row=1)
+    async def next_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """다음 페이지"""
+        if self.page and self.page.next_cursor is not None:
+            self.cursor_history.append(self.cursor)
+            self.cursor = self.page.next_cursor
+        await self._show(interaction)
+
+    @discord.ui.button(label="최근 저장순", style=discord.ButtonStyle.primary, row=1)
+    async def sort_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """정렬 기준 변경"""
+        self.sort = "recent" if self.sort == "name" else "name"
+        self.cursor = None
+        self.cursor_history = []
+        await self._show(interaction)
+
+    async def _select_callback(self, select_interaction: discord.Interaction) -> None:
+        """선택한 임베드 불러오기"""
+        selected_name = self.select.values[0]
         
-        async def select_callback(select_interaction: discord.Interaction) -> None:
-            selected_name = select.values[0]
-            
-            if not self.bot.data_manager:
-                embed = discord.Embed(
-                    description="데이터 관리자가 초기화되지 않았습니다.",
-                    color=0xE74C3C
-                )
-                await select_interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            
-            embed_data = self.bot.data_manager.get_embed(self.user_id, selected_name)
-            
-            if embed_data:
-                loaded_embed = self._create_embed_from_data(embed_data)
-                view = LoadedEmbedView(self.bot, self.user_id, loaded_embed, embed_data, selected_name)
-                
-                await select_interaction.response.send_message(
-                    embed=loaded_embed,
-                    view=view,
-                    ephemeral=True
-                )
+        if not self.bot.data_manager:
+            embed = discord.Embed(
+                description="데이터 관리자가 초기화되지 않았습니다.",
+                color=0xE74C3C
+            )
+            await select_interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         
-        select.callback = select_callback
-        view = discord.ui.View()
-        view.add_item(select)
+        embed_data = await self.bot.data_manager.get_embed(self.user_id, selected_name)
         
-        await interaction.response.send_message(view=view, ephemeral=True)
+        if embed_data:
+            loaded_embed = self.bot.embed_renderer.render(embed_data)
+            view = LoadedEmbedView(self.bot, self.user_id, loaded_embed, embed_data, selected_name)
+            
+            await select_interaction.response.send_message(
+                embed=loaded_embed,
+                view=view,
+                ephemeral=True
+            )
+        else:
+            embed = discord.Embed(
+                description=f"'{selected_name}'이라는 임베드를 찾을 수 없습니다.",
+                color=0xE74C3C
+            )
+            await select_interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @discord.ui.button(label="삭제", style=discord.ButtonStyle.danger)
+    @discord.ui.button(label="삭제", style=discord.ButtonStyle.danger, row=1)
     async def delete_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         """임베드 삭제"""
+        if not self.embed_names:
+            await interaction.response.send_message("삭제할 임베드가 없습니다.", ephemeral=True)
+            return
+        
         select = discord.ui.Select(
             placeholder="삭제할 임베드를 선택하세요",
             options=[
@@ -177,7 +259,7 @@ class EmbedListView(discord.ui.View):
             if not self.bot.data_manager:
                 return
             
-            success = self.bot.data_manager.delete_embed(self.user_id, selected_name)
+            success = await self.bot.data_manager.delete_embed(self.user_id, selected_name)
             
             if success:
                 embed = discord.Embed(
@@ -198,28 +280,11 @@ class EmbedListView(discord.ui.View):
         
         await interaction.response.send_message(view=view, ephemeral=True)
 
-    def _create_embed(self, embed_data: dict) -> discord.Embed:
-        """임베드 객체 생성"""
-        embed = discord.Embed(
-            title=embed_data.get("title"),
-            description=embed_data.get("description"),
-            color=embed_data.get("color", 0x3498DB)
-        )
-        
-        for field in embed_data.get("fields", []):
-            embed.add_field(
-                name=field.get("name"),
-                value=field.get("value"),
-                inline=field.get("inline", False)
-            )
-        
-        return embed
-
 
 class LoadedEmbedView(discord.ui.View):
     """불러온 임베드 View"""
 
-    def __init__(self, bot: discord.Bot, user_id: int, embed: discord.Embed, embed_data: dict, name: str):
+    def __init__(self, bot: discord.Bot, user_id: int, embed: discord.Embed, embed_data: EmbedDocument, name: str):
         super().__init__(timeout=600)
         self.bot = bot
         self.user_id = user_id
@@ -247,7 +312,7 @@ class LoadedEmbedView(discord.ui.View):
     @discord.ui.button(label="JSON 내보내기", style=discord.ButtonStyle.secondary)
     async def export_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         """JSON으로 내보내기"""
-        json_str = json.dumps(self.embed_data, indent=2, ensure_ascii=False)
+        json_str = json.dumps(self.embed_data.to_dict(), indent=2, ensure_ascii=False)
         
         if len(json_str) > 1900:
             await interaction.response.send_message(
@@ -0,0 +1,127 @@
+"""느린 핸들러 프로파일링 명령어 (봇 소유자 전용)"""
+from __future__ import annotations
+import logging
+from typing import Optional
+import discord
+from discord.ext import commands
+
+from utils.constants import MAX_EMBED_TOTAL_LENGTH
+
+logger = logging.getLogger(__name__)
+
+# 목록에 표시할 최대 기록 수
+MAX_SLOW_LIST = 10
+# 기록 하나에 표시할 스택 프레임 목록의 최대 길이
+MAX_FRAMES_LENGTH = 500
+
+
+class ProfileCommand(commands.Cog):
+    """느린 핸들러 프로파일링 명령어"""
+
+    profile = discord.SlashCommandGroup(
+        "profile",
+        "느린 핸들러 프로파일링 (봇 소유자 전용)",
+        default_member_permissions=discord.Permissions(administrator=True)
+    )
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+
+    @profile.command(name="on", description="느린 핸들러 프로파일링을 켭니다")
+    @discord.option(
+        "threshold_ms",
+        int,
+        description="프로파일을 남길 최소 처리 시간 (ms)",
+        required=False,
+        default=None,
+        min_value=10
+    )
+    @commands.is_owner()
+    async def profile_on(self, ctx: discord.ApplicationContext, threshold_ms: Optional[int]) -> None:
+        """프로파일링 켜기"""
+        profiler = self.bot.profiler
+        profiler.enable(threshold_ms / 1000 if threshold_ms else None)
+        self.bot.instrument_ui()
+
+        embed = discord.Embed(
+            title="프로파일링 켜짐",
+            description=(
+                f"{profiler.threshold * 1000:.0f}ms 이상 걸린 명령어와 버튼은 "
+                f"`{profiler.directory.name}/` 디렉토리에 프로파일이 기록됩니다."
+            ),
+            color=0x2ECC71
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @profile.command(name="off", description="느린 핸들러 프로파일링을 끕니다")
+    @commands.is_owner()
+    async def profile_off(self, ctx: discord.ApplicationContext) -> None:
+        """프로파일링 끄기"""
+        self.bot.profiler.disable()
+        embed = discord.Embed(
+            description="프로파일링을 껐습니다. 기록된 느린 핸들러는 `/profile slow`로 계속 볼 수 있습니다.",
+            color=0x3498DB
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @profile.command(name="slow", description="최근 가장 느렸던 핸들러를 확인합니다")
+    @discord.option(
+        "count",
+        int,
+        description="표시할 개수",
+        required=False,
+        default=5,
+        min_value=1,
+        max_value=MAX_SLOW_LIST
+    )
+    @commands.is_owner()
+    async def profile_slow(self, ctx: discord.ApplicationContext, count: int) -> None:
+        """느린 핸들러 목록"""
+        profiler = self.bot.profiler
+        records = profiler.slowest(count)
+        state = "켜짐" if profiler.enabled else "꺼짐"
+
+        embed = discord.Embed(
+            title="느린 핸들러",
+            description=(
+                f"프로파일링 {state}, 임계값 {profiler.threshold * 1000:.0f}ms, "
+                f"측정한 핸들러 {profiler.handled}개"
+            ),
+            color=0x3498DB if records else 0x95A5A6
+        )
+        if not records:
+            embed.description += "\n\n임계값을 넘은 핸들러가 없습니다."
+
+        for index, record in enumerate(records, 1):
+            lines = [f"{record.kind} · <t:{int(record.finished_at)}:R>"]
+            if record.samples:
+                idle = record.idle_samples / record.samples
+                lines.append(f"표본 {record.samples}개 (I/O 대기 {idle:.0%})")
+            if record.hot_frames:
+                # 문자열을 자르면 코드 블록이 닫히지 않으므로 프레임 단위로 줄임
+                frames: list[str] = []
+                frames_length = 0
+                for frame, count in record.hot_frames:
+                    line = f"{count:>4} {frame}"[:MAX_FRAMES_LENGTH]
+                    if frames and frames_length + len(line) + 1 > MAX_FRAMES_LENGTH:
+                        break
+                    frames.append(line)
+                    frames_length += len(line) + 1
+                lines.append("```\n" + "\n".join(frames) + "\n```")
+            if record.dump_path is not None:
+                lines.append(f"`{record.dump_path.name}`")
+
+            name = f"{index}. {record.name} ({record.duration * 1000:.0f}ms)"[:256]
+            value = "\n".join(lines)
+            # 임베드 전체 6000자 제한을 넘기 전에 멈추고 생략한 수를 바닥글에 표시
+            if len(embed) + len(name) + len(value) > MAX_EMBED_TOTAL_LENGTH - 64:
+                embed.set_footer(text=f"글자 수 제한으로 {len(records) - index + 1}개 생략")
+                break
+            embed.add_field(name=name, value=value, inline=False)
+
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot: discord.Bot):
+    """명령어 로드"""
+    bot.add_cog(ProfileCommand(bot))
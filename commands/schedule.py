@@ -0,0 +1,132 @@
+"""임베드 예약 전송 명령어"""
+from __future__ import annotations
+import logging
+from typing import Optional
+import discord
+from discord.ext import commands
+
+from utils.autocomplete import embed_name_autocomplete, schedule_autocomplete
+from utils.constants import SCHEDULE_MAX_PER_USER, SCHEDULE_MIN_INTERVAL
+from utils.scheduler import format_run_time, parse_duration, parse_run_time
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleCommand(commands.Cog):
+    """임베드 예약 전송 명령어"""
+
+    schedule = discord.SlashCommandGroup("schedule", "저장된 임베드 예약 전송")
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+
+    @staticmethod
+    def _error_embed(description: str) -> discord.Embed:
+        """오류 임베드"""
+        return discord.Embed(description=description, color=0xE74C3C)
+
+    @schedule.command(name="add", description="임베드를 지정한 시각에 전송하도록 예약합니다")
+    @discord.option("name", str, description="전송할 임베드 이름", autocomplete=embed_name_autocomplete)
+    @discord.option("channel", discord.TextChannel, description="전송할 채널")
+    @discord.option("when", str, description="실행 시각 (예: 2025-01-01 09:00, 09:00, +30m)")
+    @discord.option("every", str, description="반복 간격 (예: 1d, 12h, 30m)", required=False, default=None)
+    async def add_schedule(
+        self,
+        ctx: discord.ApplicationContext,
+        name: str,
+        channel: discord.TextChannel,
+        when: str,
+        every: Optional[str]
+    ) -> None:
+        """예약 추가"""
+        if not self.bot.data_manager:
+            await ctx.respond(embed=self._error_embed("데이터 관리자가 초기화되지 않았습니다."), ephemeral=True)
+            return
+
+        if not await self.bot.data_manager.embed_exists(ctx.user.id, name):
+            await ctx.respond(embed=self._error_embed(f"'{name}'이라는 임베드를 찾을 수 없습니다."), ephemeral=True)
+            return
+
+        member = channel.guild.get_member(ctx.user.id)
+        if member is None or not channel.permissions_for(member).send_messages:
+            await ctx.respond(embed=self._error_embed(f"{channel.mention}에 메시지를 보낼 권한이 없습니다."), ephemeral=True)
+            return
+
+        if self.bot.scheduler.count_for(ctx.user.id) >= SCHEDULE_MAX_PER_USER:
+            await ctx.respond(
+                embed=self._error_embed(f"예약은 최대 {SCHEDULE_MAX_PER_USER}개까지 만들 수 있습니다."),
+                ephemeral=True
+            )
+            return
+
+        try:
+            run_at = parse_run_time(when)
+            interval = parse_duration(every) if every else None
+        except ValueError as e:
+            await ctx.respond(embed=self._error_embed(str(e)), ephemeral=True)
+            return
+
+        if interval is not None and interval < SCHEDULE_MIN_INTERVAL:
+            await ctx.respond(
+                embed=self._error_embed(f"반복 간격은 최소 {SCHEDULE_MIN_INTERVAL // 60}분입니다."),
+                ephemeral=True
+            )
+            return
+
+        schedule = await self.bot.scheduler.add(ctx.user.id, channel.id, name, run_at, interval)
+        logger.info(f"예약 추가: #{schedule.schedule_id} {ctx.user.id} '{name}' -> {channel.id}")
+
+        embed = discord.Embed(
+            title=f"예약 #{schedule.schedule_id} 추가됨",
+            description=f"'{name}' → {channel.mention}",
+            color=0x2ECC71
+        )
+        embed.add_field(name="실행 시각", value=format_run_time(run_at), inline=True)
+        embed.add_field(name="반복", value=every or "없음", inline=True)
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @schedule.command(name="list", description="예약 목록을 확인합니다")
+    async def list_schedules(self, ctx: discord.ApplicationContext) -> None:
+        """예약 목록"""
+        schedules = self.bot.scheduler.list_for(ctx.user.id)
+        if not schedules:
+            embed = discord.Embed(
+                description="예약이 없습니다. `/schedule add` 명령어로 예약을 추가해보세요.",
+                color=0x3498DB
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        lines = []
+        for schedule in schedules:
+            repeat = f" · {schedule.interval // 60}분마다" if schedule.interval else ""
+            lines.append(
+                f"**#{schedule.schedule_id}** '{schedule.embed_name}' → <#{schedule.channel_id}> "
+                f"{format_run_time(schedule.next_run)}{repeat}"
+            )
+
+        embed = discord.Embed(
+            title="예약 목록",
+            description="\n".join(lines),
+            color=0x3498DB
+        )
+        embed.set_footer(text=f"총 {len(schedules)}개")
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @schedule.command(name="remove", description="예약을 삭제합니다")
+    @discord.option("schedule_id", int, description="삭제할 예약", autocomplete=schedule_autocomplete)
+    async def remove_schedule(self, ctx: discord.ApplicationContext, schedule_id: int) -> None:
+        """예약 삭제"""
+        if await self.bot.scheduler.remove(ctx.user.id, schedule_id):
+            embed = discord.Embed(
+                description=f"예약 #{schedule_id}이 삭제되었습니다.",
+                color=0x2ECC71
+            )
+        else:
+            embed = self._error_embed(f"예약 #{schedule_id}을 찾을 수 없습니다.")
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot: discord.Bot):
+    """명령어 로드"""
+    bot.add_cog(ScheduleCommand(bot))
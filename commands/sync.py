@@ -0,0 +1,44 @@
+"""슬래시 명령어 강제 동기화 명령어 (봇 소유자 전용)"""
+from __future__ import annotations
+import logging
+import discord
+from discord.ext import commands
+
+logger = logging.getLogger(__name__)
+
+
+class SyncCommand(commands.Cog):
+    """슬래시 명령어 강제 동기화 명령어"""
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+
+    @discord.slash_command(
+        name="sync",
+        description="슬래시 명령어를 Discord와 다시 동기화합니다 (봇 소유자 전용)",
+        default_member_permissions=discord.Permissions(administrator=True)
+    )
+    @commands.is_owner()
+    async def sync_commands(self, ctx: discord.ApplicationContext) -> None:
+        """명령어 강제 동기화"""
+        await ctx.defer(ephemeral=True)
+        try:
+            await self.bot.command_sync.sync(force=True)
+        except discord.HTTPException as e:
+            logger.error(f"명령어 동기화 실패: {e}")
+            await ctx.respond(
+                embed=discord.Embed(description=f"동기화에 실패했습니다: {e}", color=0xE74C3C),
+                ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(
+            description=f"명령어 {len(self.bot.pending_application_commands)}개를 동기화했습니다.",
+            color=0x2ECC71
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot: discord.Bot):
+    """명령어 로드"""
+    bot.add_cog(SyncCommand(bot))
@@ -0,0 +1,254 @@
+"""임베드 가져오기/내보내기 명령어"""
+from __future__ import annotations
+import io
+import logging
+from typing import AsyncIterator, Optional
+import aiohttp
+import discord
+from discord.ext import commands
+
+from utils.constants import (
+    EXPORT_PART_BYTES,
+    IMPORT_CHUNK_SIZE,
+    IMPORT_MAX_BYTES,
+    IMPORT_MAX_ITEMS,
+    IMPORT_REPORT_LINES,
+    MAX_EMBED_NAME_LENGTH,
+)
+from utils.embed_document import EmbedDocument, EmbedValidationError
+from utils.embed_export import EXPORT_FORMATS, EmbedExporter, ExportPart
+from utils.embed_import import ImportResult, iter_import_items, parse_import_item
+
+logger = logging.getLogger(__name__)
+
+STATUS_LABELS = {"saved": "✅", "skipped": "⏭️", "failed": "❌"}
+
+
+class ImportTooLarge(Exception):
+    """가져올 파일이 크기 제한을 넘음"""
+
+
+class TransferCommand(commands.Cog):
+    """임베드 가져오기/내보내기 명령어"""
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+
+    @staticmethod
+    def _error_embed(description: str) -> discord.Embed:
+        """오류 임베드"""
+        return discord.Embed(description=description, color=0xE74C3C)
+
+    @staticmethod
+    async def _read_chunks(attachment: discord.Attachment) -> AsyncIterator[bytes]:
+        """첨부 파일을 청크 단위로 내려받기
+
+        Raises:
+            ImportTooLarge: 받은 크기가 제한을 넘은 경우
+        """
+        received = 0
+        async with aiohttp.ClientSession() as session:
+            async with session.get(attachment.url) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(IMPORT_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > IMPORT_MAX_BYTES:
+                        raise ImportTooLarge()
+                    yield chunk
+
+    @staticmethod
+    def _report_embed(file_name: str, results: list[ImportResult]) -> discord.Embed:
+        """가져오기 결과 요약 임베드"""
+        counts = {status: 0 for status in STATUS_LABELS}
+        for result in results:
+            counts[result.status] += 1
+
+        # 저장되지 않은 항목을 먼저 보여줌
+        shown = sorted(results, key=lambda result: result.status == "saved")[:IMPORT_REPORT_LINES]
+        lines = [_format_result(result) for result in shown]
+        if len(results) > len(shown):
+            lines.append(f"... 외 {len(results) - len(shown)}개 (첨부된 결과 파일 참고)")
+
+        embed = discord.Embed(
+            title=f"'{file_name}' 가져오기 결과",
+            description="\n".join(lines)[:4096] or "가져올 임베드가 없습니다.",
+            color=0x2ECC71 if counts["failed"] == 0 and counts["saved"] else 0xF39C12
+        )
+        embed.add_field(name="저장", value=str(counts["saved"]), inline=True)
+        embed.add_field(name="건너뜀", value=str(counts["skipped"]), inline=True)
+        embed.add_field(name="실패", value=str(counts["failed"]), inline=True)
+        return embed
+
+    @discord.slash_command(name="import", description="JSON 또는 NDJSON 파일에서 임베드를 가져옵니다")
+    @discord.option("file", discord.Attachment, description="임베드 JSON/NDJSON 파일")
+    @discord.option("overwrite", bool, description="같은 이름의 임베드 덮어쓰기", required=False, default=False)
+    @discord.option(
+        "name",
+        str,
+        description="이름이 없는 임베드에 붙일 이름 (여러 개면 뒤에 번호가 붙음)",
+        required=False,
+        default=None,
+        max_length=MAX_EMBED_NAME_LENGTH - 5
+    )
+    async def import_embeds(
+        self,
+        ctx: discord.ApplicationContext,
+        file: discord.Attachment,
+        overwrite: bool,
+        name: Optional[str]
+    ) -> None:
+        """임베드 가져오기"""
+        if not self.bot.data_manager:
+            await ctx.respond(embed=self._error_embed("데이터 관리자가 초기화되지 않았습니다."), ephemeral=True)
+            return
+
+        if file.size > IMPORT_MAX_BYTES:
+            await ctx.respond(
+                embed=self._error_embed(f"파일은 최대 {IMPORT_MAX_BYTES // 1024 // 1024}MB까지 가져올 수 있습니다."),
+                ephemeral=True
+            )
+            return
+
+        await ctx.defer(ephemeral=True)
+
+        existing = set() if overwrite else set(await self.bot.data_manager.list_embeds(ctx.user.id))
+        results: list[ImportResult] = []
+        # 이름 -> (결과, 임베드 문서), 파일 안에서 같은 이름이 다시 나오면 나중 것이 남음
+        batch: dict[str, tuple[ImportResult, EmbedDocument]] = {}
+
+        try:
+            index = 0
+            unnamed = 0
+            async for raw in iter_import_items(self._read_chunks(file)):
+                index += 1
+                if index > IMPORT_MAX_ITEMS:
+                    results.append(ImportResult(
+                        index, None, "failed", f"최대 {IMPORT_MAX_ITEMS}개까지 가져올 수 있어 나머지는 무시했습니다."
+                    ))
+                    break
+
+                # 이름 없는 항목에는 name, name-2, name-3, ... 순서로 이름을 붙임
+                default_name = f"{name}-{unnamed + 1}" if name and unnamed else name
+                try:
+                    embed_name, embed_data = parse_import_item(raw, default_name)
+                except EmbedValidationError as e:
+                    results.append(ImportResult(index, None, "failed", str(e)))
+                    continue
+                if default_name is not None and embed_name == default_name:
+                    unnamed += 1
+
+                if embed_name in existing:
+                    results.append(ImportResult(index, embed_name, "skipped", "같은 이름의 임베드가 이미 있습니다."))
+                    continue
+
+                previous = batch.get(embed_name)
+                if previous is not None:
+                    previous[0].status = "skipped"
+                    previous[0].message = f"{index}번째 항목으로 대체되었습니다."
+
+                result = ImportResult(index, embed_name, "saved")
+                results.append(result)
+                batch[embed_name] = (result, embed_data)
+        except ImportTooLarge:
+            await ctx.respond(
+                embed=self._error_embed(f"파일은 최대 {IMPORT_MAX_BYTES // 1024 // 1024}MB까지 가져올 수 있습니다."),
+                ephemeral=True
+            )
+            return
+        except aiohttp.ClientError as e:
+            logger.error(f"가져올 파일 다운로드 실패: {e}")
+            await ctx.respond(embed=self._error_embed("파일을 내려받지 못했습니다."), ephemeral=True)
+            return
+
+        if batch:
+            await self.bot.data_manager.save_embeds(
+                ctx.user.id,
+                [(embed_name, embed_data) for embed_name, (_, embed_data) in batch.items()]
+            )
+
+        saved = sum(1 for result in results if result.status == "saved")
+        logger.info(f"임베드 가져오기: {ctx.user.id} '{file.filename}' {saved}/{len(results)}")
+
+        embed = self._report_embed(file.filename, results)
+        if len(results) > IMPORT_REPORT_LINES:
+            report = "\n".join(_format_result(result) for result in results)
+            report_file = discord.File(io.BytesIO(report.encode("utf-8")), filename="import_report.txt")
+            await ctx.respond(embed=embed, file=report_file, ephemeral=True)
+        else:
+            await ctx.respond(embed=embed, ephemeral=True)
+
+    @staticmethod
+    async def _send_part(ctx: discord.ApplicationContext, part: ExportPart, **kwargs) -> None:
+        """내보내기 파일 전송 후 닫기"""
+        # Windows의 임시 파일은 io.IOBase가 아닌 래퍼이므로 실제 파일을 넘김 (닫기는 래퍼로)
+        fp = getattr(part.fp, "file", part.fp)
+        try:
+            await ctx.respond(file=discord.File(fp, filename=part.filename), ephemeral=True, **kwargs)
+        finally:
+            part.fp.close()
+
+    @discord.slash_command(name="export", description="저장된 모든 임베드를 파일로 내보냅니다")
+    @discord.option(
+        "format",
+        str,
+        description="파일 형식",
+        choices=list(EXPORT_FORMATS),
+        required=False,
+        default="ndjson"
+    )
+    async def export_embeds(self, ctx: discord.ApplicationContext, format: str) -> None:
+        """전체 임베드 내보내기"""
+        if not self.bot.data_manager:
+            await ctx.respond(embed=self._error_embed("데이터 관리자가 초기화되지 않았습니다."), ephemeral=True)
+            return
+
+        await ctx.defer(ephemeral=True)
+
+        # 서버의 첨부 파일 제한이 더 작으면 그에 맞춤
+        part_bytes = EXPORT_PART_BYTES
+        if ctx.guild is not None:
+            part_bytes = min(part_bytes, ctx.guild.filesize_limit)
+
+        exporter = EmbedExporter(format, part_bytes)
+        try:
+            async for embed_name, embed_data in self.bot.data_manager.iter_embeds(ctx.user.id):
+                part = exporter.add(embed_name, embed_data)
+                if part is not None:
+                    await self._send_part(ctx, part)
+
+            part = exporter.finish()
+            if part is None:
+                await ctx.respond(
+                    embed=self._error_embed("저장된 임베드가 없습니다. `/create` 명령어로 임베드를 만들어보세요."),
+                    ephemeral=True
+                )
+                return
+
+            embed = discord.Embed(
+                title="임베드 내보내기 완료",
+                description=(
+                    f"임베드 {exporter.items}개를 파일 {exporter.parts}개로 내보냈습니다.\n"
+                    "`/import` 명령어로 다시 가져올 수 있습니다."
+                ),
+                color=0x2ECC71
+            )
+            await self._send_part(ctx, part, embed=embed)
+        finally:
+            exporter.close()
+
+        logger.info(f"임베드 내보내기: {ctx.user.id} {exporter.items}개, 파일 {exporter.parts}개 ({format})")
+
+
+def _format_result(result: ImportResult) -> str:
+    """결과 한 줄"""
+    line = f"{STATUS_LABELS[result.status]} #{result.index}"
+    if result.name:
+        line += f" '{result.name}'"
+    if result.message:
+        line += f": {result.message}"
+    return line
+
+
+def setup(bot: discord.Bot):
+    """명령어 로드"""
+    bot.add_cog(TransferCommand(bot))
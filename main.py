@@ -1,22 +1,51 @@
 """Seri - 임베드 빌더 봇"""
 from __future__ import annotations
 import asyncio
+import logging
 import os
 import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 import discord
 from dotenv import load_dotenv
 
+from utils.command_sync import CommandSync
 from utils.extension_loader import ExtensionLoader
-from utils.data_manager import DataManager
-from utils.constants import AUTO_SAVE_INTERVAL, DEFAULT_ACTIVITY_NAME
+from utils.data_manager import DataManager, create_data_manager
+from utils.draft_store import DraftStore
+from utils.embed_renderer import EmbedRenderer
+from utils.loop_watchdog import LoopWatchdog
+from utils.metrics import BotMetrics, MetricsServer, instrument_ui
+from utils.profiler import HandlerProfiler
+from utils.scheduler import Scheduler
+from utils.constants import (
+    AUTO_SAVE_INTERVAL,
+    DATA_DIR,
+    DEFAULT_ACTIVITY_NAME,
+    DRAFT_PERSIST,
+    LAZY_EXTENSIONS,
+    LOG_FILE,
+    LOG_JSON,
+    LOG_LEVEL,
+    METRICS_HOST,
+    METRICS_PORT,
+    PROFILE_THRESHOLD,
+    SCHEDULE_CATCH_UP,
+    STORAGE_BACKEND,
+)
 from utils.graceful_shutdown import setup_graceful_shutdown, register_shutdown_callback
-from utils.logging_config import configure_logging
+from utils.logging_config import configure_logging, log_context
 
 load_dotenv()
-configure_logging()
+STRUCTURED_LOGS = os.getenv("SERI_LOG_JSON", "1" if LOG_JSON else "0") == "1"
+configure_logging(
+    level=logging.getLevelName(os.getenv("SERI_LOG_LEVEL", LOG_LEVEL).upper()),
+    log_file=os.getenv("SERI_LOG_FILE", "1" if LOG_FILE else "0") == "1",
+    json_format=STRUCTURED_LOGS
+)
 
-import logging
 logger = logging.getLogger(__name__)
 
 
@@ -28,13 +57,45 @@ class Seri(discord.Bot):
         intents.message_content = True
         intents.members = True
         
-        super().__init__(intents=intents)
+        # 연결할 때마다 동기화하지 않고, 명령어를 모두 불러온 뒤 정의가 바뀐 경우에만 동기화
+        super().__init__(intents=intents, auto_sync_commands=False)
         
-        self.data_manager = DataManager(self)
-        self.extension_loader = ExtensionLoader(self)
+        self.data_manager: DataManager = create_data_manager(
+            self, os.getenv("SERI_STORAGE", STORAGE_BACKEND)
+        )
+        lazy_env = os.getenv("SERI_LAZY_EXTENSIONS")
+        lazy = LAZY_EXTENSIONS if lazy_env is None else [name.strip() for name in lazy_env.split(",") if name.strip()]
+        self.extension_loader = ExtensionLoader(self, lazy=lazy)
+        self.command_sync = CommandSync(self, self.extension_loader)
+        self.embed_renderer = EmbedRenderer()
+        self.scheduler = Scheduler(self, os.getenv("SERI_SCHEDULE_CATCH_UP", SCHEDULE_CATCH_UP))
+        self.draft_store = DraftStore(path=DATA_DIR / "drafts.json" if DRAFT_PERSIST else None)
+        self.metrics = BotMetrics()
+        metrics_port = os.getenv("SERI_METRICS_PORT") or METRICS_PORT
+        self.metrics_server: MetricsServer | None = (
+            MetricsServer(self, os.getenv("SERI_METRICS_HOST", METRICS_HOST), int(metrics_port))
+            if metrics_port else None
+        )
+        threshold_ms = os.getenv("SERI_PROFILE_THRESHOLD_MS")
+        self.loop_watchdog = LoopWatchdog(on_lag=self.metrics.record_loop_lag)
+        self.profiler = HandlerProfiler(int(threshold_ms) / 1000 if threshold_ms else PROFILE_THRESHOLD)
         self._initialized = False
         self._auto_save_task: asyncio.Task | None = None
 
+    async def start(self, token: str, *, reconnect: bool = True) -> None:
+        """메트릭 엔드포인트를 먼저 열고 로그인 (준비 전에도 상태 확인에 응답)"""
+        if os.getenv("SERI_PROFILE") == "1":
+            self.profiler.enable()
+        # JSON 로그는 버튼/모달 로그에도 인터랙션 문맥이 필요함
+        if self.metrics_server or self.profiler.enabled or STRUCTURED_LOGS:
+            self.instrument_ui()
+        if self.metrics_server:
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                logger.error(f"메트릭 엔드포인트 시작 실패: {e}")
+        await super().start(token, reconnect=reconnect)
+
     async def on_ready(self) -> None:
         """봇 준비 완료"""
         if self._initialized or not self.user:
@@ -50,12 +111,24 @@ class Seri(discord.Bot):
 
     async def _initialize(self) -> None:
         """초기화 로직"""
-        self.data_manager.load_data()
+        self.loop_watchdog.start()
+        with self.metrics.storage.time("load"):
+            await self.data_manager.load_data()
+        await self.scheduler.start()
+        await self.draft_store.start()
         
+        await self.extension_loader.prepare("commands")
         self.extension_loader.load_extension_groups("commands")
         if self.extension_loader.failed_extensions:
             for ext_name, error in self.extension_loader.failed_extensions:
                 logger.error(f"명령어 로드 실패: {ext_name}\n{error}")
+
+        try:
+            await self.command_sync.sync(force=os.getenv("SERI_FORCE_SYNC") == "1")
+        except discord.HTTPException as e:
+            logger.error(f"명령어 동기화 실패: {e}")
+        await self.extension_loader.save_manifest()
+        logger.info(self.extension_loader.get_summary())
         
         if self._auto_save_task is None or self._auto_save_task.done():
             self._auto_save_task = asyncio.create_task(self._auto_save_loop())
@@ -71,18 +144,70 @@ class Seri(discord.Bot):
             logger.error(f"상태 변경 오류: {e}")
 
     async def _auto_save_loop(self) -> None:
-        """주기적 데이터 저장"""
+        """주기적 저널 압축 (임계값 초과 시에만) 및 예약 기록"""
         await self.wait_until_ready()
         while not self.is_closed():
             try:
                 await asyncio.sleep(AUTO_SAVE_INTERVAL)
-                self.data_manager.save_data()
-                logger.debug("자동 저장 완료")
+                started = time.perf_counter()
+                if await self.data_manager.maybe_compact():
+                    self.metrics.storage.observe(time.perf_counter() - started, "compact")
+                    logger.debug("자동 저장 완료")
+                await self.scheduler.save()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"자동 저장 오류: {e}")
 
+    def get_loop_stats(self) -> dict[str, Any]:
+        """이벤트 루프 지연 통계 (대시보드용)
+
+        Returns:
+            마지막/최근 p50/p99/최대 지연 (ms), 막힘 횟수와 합계 (초), 스택 캡처 수
+        """
+        return self.loop_watchdog.get_stats()
+
+    @contextmanager
+    def observe_handler(self, kind: str, name: str, interaction: discord.Interaction) -> Iterator[None]:
+        """핸들러 처리 시간 기록 (메트릭, 프로파일러) 및 로그 문맥 설정
+
+        Args:
+            kind: "command" 또는 "component"
+            name: 명령어 이름 또는 `뷰.콜백` 이름
+            interaction: 처리 중인 인터랙션
+        """
+        histogram = self.metrics.commands if kind == "command" else self.metrics.components
+        context = log_context(
+            handler=name,
+            interaction=interaction.id,
+            user=interaction.user.id if interaction.user else None,
+            guild=interaction.guild_id
+        )
+        with context, histogram.time(name), self.profiler.track(kind, name):
+            yield
+
+    def instrument_ui(self) -> None:
+        """버튼/선택 메뉴/모달 콜백도 기록 (메트릭 또는 프로파일링을 켤 때 한 번)"""
+        instrument_ui(self.observe_handler)
+
+    async def process_application_commands(
+        self, interaction: discord.Interaction, auto_sync: bool | None = None
+    ) -> None:
+        """명령어 처리 (아직 불러오지 않은 지연 확장의 명령어면 먼저 불러옴)"""
+        if interaction.data and interaction.type in (
+            discord.InteractionType.application_command,
+            discord.InteractionType.auto_complete,
+        ):
+            extension_name = self.extension_loader.find_deferred(interaction.data.get("name"))
+            if extension_name is not None:
+                self.extension_loader.load_deferred(extension_name)
+        await super().process_application_commands(interaction, auto_sync)
+
+    async def invoke_application_command(self, ctx: discord.ApplicationContext) -> None:
+        """명령어 실행 (오류 처리까지 포함한 처리 시간 기록)"""
+        with self.observe_handler("command", ctx.command.qualified_name, ctx.interaction):
+            await super().invoke_application_command(ctx)
+
     async def on_application_command_error(
         self,
         context: discord.ApplicationContext,
@@ -90,6 +215,7 @@ class Seri(discord.Bot):
     ) -> None:
         """명령어 오류 처리"""
         logger.error(f"명령어 오류: {error}", exc_info=error)
+        self.metrics.record_error(context.command.qualified_name if context.command else "unknown", error)
         
         try:
             embed = discord.Embed(
@@ -103,6 +229,10 @@ class Seri(discord.Bot):
 
     async def close(self) -> None:
         """봇 종료 처리"""
+        # 준비 상태 확인이 먼저 실패하도록 엔드포인트부터 닫음
+        if self.metrics_server:
+            await self.metrics_server.close()
+
         if self._auto_save_task and not self._auto_save_task.done():
             self._auto_save_task.cancel()
             try:
@@ -110,9 +240,18 @@ class Seri(discord.Bot):
             except asyncio.CancelledError:
                 pass
         
+        await self.scheduler.close()
+        await self.draft_store.close()
+        self.profiler.disable()
+        await self.loop_watchdog.close()
+
         if self.data_manager:
-            self.data_manager.save_data()
-            logger.debug("종료 전 데이터 저장")
+            # 로드 전(로그인 중 종료, 초기화 실패)에는 빈 상태를 저장하지 않음
+            if self.data_manager.loaded:
+                with self.metrics.storage.time("save"):
+                    await self.data_manager.save_data()
+                logger.debug("종료 전 데이터 저장")
+            await self.data_manager.close()
         
         await super().close()
 
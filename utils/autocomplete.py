@@ -0,0 +1,54 @@
+"""슬래시 명령어 자동 완성"""
+from __future__ import annotations
+import discord
+
+from .constants import MAX_AUTOCOMPLETE_CHOICES
+
+__all__ = ["embed_name_autocomplete", "schedule_autocomplete"]
+
+
+async def embed_name_autocomplete(ctx: discord.AutocompleteContext) -> list[str]:
+    """저장된 임베드 이름 자동 완성
+
+    저장소의 이름 인덱스를 사용하므로 임베드가 많아도 전체를 훑지 않습니다.
+
+    Args:
+        ctx: 자동 완성 컨텍스트
+
+    Returns:
+        입력값으로 시작하는 임베드 이름 목록
+    """
+    data_manager = getattr(ctx.bot, "data_manager", None)
+    if not data_manager:
+        return []
+
+    return await data_manager.search_embed_names(
+        ctx.interaction.user.id,
+        ctx.value or "",
+        MAX_AUTOCOMPLETE_CHOICES
+    )
+
+
+async def schedule_autocomplete(ctx: discord.AutocompleteContext) -> list[discord.OptionChoice]:
+    """사용자 예약 자동 완성
+
+    Args:
+        ctx: 자동 완성 컨텍스트
+
+    Returns:
+        예약 ID 선택지 목록
+    """
+    scheduler = getattr(ctx.bot, "scheduler", None)
+    if not scheduler:
+        return []
+
+    query = (ctx.value or "").casefold()
+    choices = []
+    for schedule in scheduler.list_for(ctx.interaction.user.id):
+        label = f"#{schedule.schedule_id} {schedule.embed_name}"
+        if query and query not in label.casefold():
+            continue
+        choices.append(discord.OptionChoice(name=label[:100], value=schedule.schedule_id))
+        if len(choices) >= MAX_AUTOCOMPLETE_CHOICES:
+            break
+    return choices
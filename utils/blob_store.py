@@ -0,0 +1,99 @@
+"""내용 주소 기반 임베드 공유 저장소"""
+from __future__ import annotations
+from typing import Any
+
+from .embed_document import EmbedDocument
+from .snapshot import blob_digest, encode_blob
+
+__all__ = ["BlobStore"]
+
+
+class BlobStore:
+    """같은 내용의 임베드를 하나의 객체로 공유하는 참조 카운트 저장소
+
+    임베드는 내용 해시로 식별되며, 사용자와 이름이 달라도 내용이 같으면
+    같은 `EmbedDocument`를 공유합니다. 참조가 0이 된 임베드는 즉시
+    메모리에서 제거됩니다. 공유되는 문서는 수정하면 안 됩니다.
+    """
+
+    __slots__ = ("_blobs", "_digests", "refs")
+
+    def __init__(self):
+        # 내용 해시 -> [문서, 참조 수]
+        self._blobs: dict[bytes, list[Any]] = {}
+        # id(문서) -> 내용 해시 (저장소가 문서를 참조하는 동안 id가 유지됨)
+        self._digests: dict[int, bytes] = {}
+        self.refs = 0
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._blobs
+
+    def acquire(self, embed_data: EmbedDocument, digest: bytes | None = None) -> EmbedDocument:
+        """임베드 참조 추가
+
+        Args:
+            embed_data: 임베드 문서 (같은 내용이 이미 있으면 버려짐)
+            digest: 알고 있는 내용 해시 (없으면 계산)
+
+        Returns:
+            공유되는 임베드 문서
+        """
+        if digest is None:
+            digest = blob_digest(encode_blob(embed_data.to_dict()))
+
+        entry = self._blobs.get(digest)
+        if entry is None:
+            entry = self._blobs[digest] = [embed_data, 0]
+            self._digests[id(embed_data)] = digest
+        entry[1] += 1
+        self.refs += 1
+        return entry[0]
+
+    def acquire_digest(self, digest: bytes) -> EmbedDocument | None:
+        """이미 있는 내용 해시의 참조 추가
+
+        Returns:
+            공유되는 임베드 문서 (없으면 None, 참조도 추가되지 않음)
+        """
+        entry = self._blobs.get(digest)
+        if entry is None:
+            return None
+        entry[1] += 1
+        self.refs += 1
+        return entry[0]
+
+    def release(self, embed_data: EmbedDocument) -> None:
+        """임베드 참조 해제 (참조가 0이 되면 제거)"""
+        digest = self._digests.get(id(embed_data))
+        if digest is None:
+            return
+
+        entry = self._blobs[digest]
+        entry[1] -= 1
+        self.refs -= 1
+        if entry[1] <= 0:
+            del self._blobs[digest]
+            del self._digests[id(embed_data)]
+
+    def digest_of(self, embed_data: EmbedDocument) -> bytes:
+        """공유 중인 임베드의 내용 해시"""
+        return self._digests[id(embed_data)]
+
+    def encode(self, digest: bytes) -> bytes:
+        """공유 중인 임베드를 blob으로 인코딩"""
+        return encode_blob(self._blobs[digest][0].to_dict())
+
+    def get_stats(self) -> dict[str, Any]:
+        """중복 제거 통계
+
+        Returns:
+            고유 임베드 수, 전체 참조 수, 중복 제거 비율 (참조 수 / 고유 수)
+        """
+        return {
+            "unique_blobs": len(self._blobs),
+            "blob_refs": self.refs,
+            "dedup_ratio": self.refs / len(self._blobs) if self._blobs else 1.0,
+        }
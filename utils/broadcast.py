@@ -0,0 +1,149 @@
+"""여러 채널 동시 전송"""
+from __future__ import annotations
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+import discord
+
+from .constants import (
+    BROADCAST_CONCURRENCY,
+    CHANNEL_RATE_LIMIT,
+    CHANNEL_RATE_PERIOD,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BroadcastResult", "Broadcaster", "ChannelRateLimiter"]
+
+
+@dataclass
+class BroadcastResult:
+    """채널별 전송 결과"""
+
+    channel: discord.abc.Messageable
+    ok: bool
+    error: str | None = None
+
+
+class ChannelRateLimiter:
+    """채널별 토큰 버킷
+
+    Discord의 채널당 메시지 제한(기본 5초에 5개)을 넘지 않도록
+    전송 전에 필요한 만큼 대기합니다.
+
+    Args:
+        rate: 기간당 허용 전송 수
+        period: 기간 (초)
+    """
+
+    def __init__(self, rate: int = CHANNEL_RATE_LIMIT, period: float = CHANNEL_RATE_PERIOD):
+        self.rate = rate
+        self.period = period
+        # 채널 ID -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: dict[int, tuple[float, float]] = {}
+
+    def _take(self, channel_id: int) -> float:
+        """토큰 하나 사용
+
+        Returns:
+            토큰이 생길 때까지 기다려야 하는 시간 (초, 0이면 즉시 사용)
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(channel_id, (float(self.rate), now))
+        tokens = min(float(self.rate), tokens + (now - updated) * self.rate / self.period)
+
+        if tokens >= 1:
+            self._buckets[channel_id] = (tokens - 1, now)
+            return 0.0
+
+        self._buckets[channel_id] = (tokens, now)
+        return (1 - tokens) * self.period / self.rate
+
+    async def acquire(self, channel_id: int) -> None:
+        """전송 가능할 때까지 대기
+
+        Args:
+            channel_id: 채널 ID
+        """
+        while True:
+            delay = self._take(channel_id)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def prune(self) -> None:
+        """가득 찬 버킷 정리"""
+        now = time.monotonic()
+        idle = [
+            channel_id
+            for channel_id, (_, updated) in self._buckets.items()
+            if now - updated >= self.period
+        ]
+        for channel_id in idle:
+            del self._buckets[channel_id]
+
+
+class Broadcaster:
+    """동시성 제한과 채널별 속도 제한을 지키는 전송기
+
+    Args:
+        concurrency: 동시에 진행할 최대 전송 수
+        limiter: 채널별 속도 제한기 (여러 브로드캐스트가 공유)
+    """
+
+    def __init__(self, concurrency: int = BROADCAST_CONCURRENCY, limiter: ChannelRateLimiter | None = None):
+        self.concurrency = concurrency
+        self.limiter = limiter or ChannelRateLimiter()
+
+    async def broadcast(
+        self,
+        channels: Iterable[discord.abc.Messageable],
+        on_progress: Callable[[int, int], Awaitable[None] | None] | None = None,
+        **send_kwargs: Any
+    ) -> list[BroadcastResult]:
+        """여러 채널에 같은 메시지 전송
+
+        Args:
+            channels: 전송할 채널 목록
+            on_progress: (완료 수, 전체 수)를 받는 진행 콜백
+            **send_kwargs: `channel.send`에 전달할 인자
+
+        Returns:
+            채널 순서대로의 전송 결과
+        """
+        channels = list(channels)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = 0
+
+        async def send_one(channel: discord.abc.Messageable) -> BroadcastResult:
+            nonlocal done
+            # 속도 제한 대기 중에는 동시 전송 슬롯을 차지하지 않음
+            await self.limiter.acquire(getattr(channel, "id", 0))
+            async with semaphore:
+                try:
+                    await channel.send(**send_kwargs)
+                    result = BroadcastResult(channel, True)
+                except discord.Forbidden:
+                    result = BroadcastResult(channel, False, "권한 없음")
+                except discord.HTTPException as e:
+                    result = BroadcastResult(channel, False, f"HTTP {e.status}: {e.text[:50]}")
+                except Exception as e:
+                    logger.error(f"브로드캐스트 전송 오류: {e}")
+                    result = BroadcastResult(channel, False, str(e)[:50])
+
+            done += 1
+            if on_progress is not None:
+                try:
+                    progress = on_progress(done, len(channels))
+                    if inspect.isawaitable(progress):
+                        await progress
+                except Exception as e:
+                    logger.error(f"브로드캐스트 진행 보고 오류: {e}")
+            return result
+
+        results = await asyncio.gather(*(send_one(channel) for channel in channels))
+        self.limiter.prune()
+        return list(results)
@@ -0,0 +1,159 @@
+"""슬래시 명령어 동기화
+
+등록할 명령어 정의의 해시를 `DATA_DIR/command_sync.json`에 기록해 두고,
+다음 시작 때 해시가 같으면 Discord와의 동기화(명령어 조회 및 등록 요청)를
+건너뜁니다. 명령어를 바꾸면 해시가 달라져 자동으로 다시 동기화하며,
+Discord 쪽 명령어가 직접 바뀐 경우에는 강제 동기화를 사용합니다.
+"""
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+import discord
+
+from .constants import DATA_DIR
+
+if TYPE_CHECKING:
+    from .extension_loader import ExtensionLoader
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CommandSync", "command_payload", "command_schema_hash"]
+
+
+def _normalize(value: Any) -> Any:
+    """순서가 의미 없는 값 정렬 (집합에서 만든 contexts, integration_types 등)"""
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_normalize(item) for item in value]
+        # 옵션이나 선택지처럼 객체 목록은 순서가 의미 있으므로 그대로 둠
+        if all(isinstance(item, (int, str)) for item in items):
+            return sorted(items, key=lambda item: (isinstance(item, str), item))
+        return items
+    return value
+
+
+def command_payload(command: discord.ApplicationCommand) -> dict[str, Any]:
+    """해시에 쓰는 명령어 정의 (JSON으로 저장해도 그대로인 값)
+
+    Args:
+        command: 명령어
+
+    Returns:
+        정렬한 명령어 정의와 서버 ID 목록
+    """
+    payload = _normalize(command.to_dict())
+    payload["guild_ids"] = sorted(command.guild_ids) if command.guild_ids else None
+    return payload
+
+
+def command_schema_hash(
+    commands: Iterable[discord.ApplicationCommand],
+    payloads: Iterable[dict[str, Any]] = ()
+) -> str:
+    """명령어 정의 해시
+
+    Args:
+        commands: 등록할 명령어 목록
+        payloads: 아직 불러오지 않은 명령어의 정의 (`command_payload` 결과)
+
+    Returns:
+        명령어 순서와 관계없는 SHA-256 해시 (16진수)
+    """
+    payloads = [command_payload(command) for command in commands] + list(payloads)
+    payloads.sort(key=lambda payload: (payload["name"], payload.get("type", 1), str(payload["guild_ids"])))
+    encoded = json.dumps(payloads, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CommandSync:
+    """명령어 정의가 바뀐 경우에만 동기화
+
+    지연 확장의 명령어는 아직 불러오지 않았어도 저장된 정의로 해시에 포함하며,
+    동기화가 필요하면 먼저 모두 불러옵니다 (빠진 명령어는 Discord에서 지워지므로).
+
+    Args:
+        bot: 동기화할 봇
+        extensions: 지연 확장을 관리하는 확장 로더
+        path: 마지막으로 동기화한 해시 파일
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        extensions: ExtensionLoader | None = None,
+        path: Path = DATA_DIR / "command_sync.json"
+    ):
+        self.bot = bot
+        self.extensions = extensions
+        self.path = path
+        self.last_synced: float | None = None
+        self.skipped = False
+
+    def _read_state(self) -> dict[str, Any]:
+        """저장된 동기화 상태 (스레드)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"명령어 동기화 상태 읽기 실패: {e}")
+            return {}
+
+    def _write_state(self, state: dict[str, Any]) -> None:
+        """동기화 상태 기록 (스레드)"""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        tmp_path.replace(self.path)
+
+    async def sync(self, force: bool = False) -> bool:
+        """명령어 동기화 (정의가 같으면 건너뜀)
+
+        Args:
+            force: 해시와 관계없이 동기화
+
+        Returns:
+            동기화 실행 여부
+
+        Raises:
+            discord.HTTPException: 동기화 요청 실패 (해시는 기록하지 않음)
+        """
+        deferred = self.extensions.deferred_payloads() if self.extensions else []
+        schema_hash = command_schema_hash(self.bot.pending_application_commands, deferred)
+        application_id = self.bot.application_id or (self.bot.user and self.bot.user.id)
+
+        state = await asyncio.to_thread(self._read_state)
+        if not force and state.get("hash") == schema_hash and state.get("application_id") == application_id:
+            self.skipped = True
+            logger.info(f"명령어 정의가 같아 동기화를 건너뜀 ({schema_hash[:12]})")
+            return False
+
+        if deferred:
+            self.extensions.load_deferred()
+            schema_hash = command_schema_hash(self.bot.pending_application_commands)
+
+        started = time.perf_counter()
+        await self.bot.sync_commands()
+        self.skipped = False
+        self.last_synced = time.time()
+        logger.info(
+            f"명령어 {len(self.bot.pending_application_commands)}개 동기화 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms, {schema_hash[:12]})"
+        )
+
+        try:
+            await asyncio.to_thread(
+                self._write_state,
+                {"application_id": application_id, "hash": schema_hash, "synced_at": self.last_synced}
+            )
+        except OSError as e:
+            logger.error(f"명령어 동기화 상태 저장 실패: {e}")
+        return True
@@ -1,19 +1,83 @@
 """상수 정의"""
 from __future__ import annotations
+import os
 from pathlib import Path
 
 __all__ = [
     "DATA_DIR",
+    "STORAGE_BACKEND",
     "EMBED_COLORS",
+    "DEFAULT_EMBED_COLOR",
     "AUTO_SAVE_INTERVAL",
+    "JOURNAL_MAX_BYTES",
+    "JOURNAL_MAX_AGE",
+    "WRITE_BEHIND_DELAY",
+    "WRITE_BEHIND_CLOSE_TIMEOUT",
+    "SHARD_BUCKETS",
+    "SHARD_CACHE_BYTES",
     "DEFAULT_ACTIVITY_NAME",
     "MAX_EMBED_FIELDS",
+    "MAX_TITLE_LENGTH",
+    "MAX_DESCRIPTION_LENGTH",
+    "MAX_AUTHOR_LENGTH",
+    "MAX_FOOTER_LENGTH",
     "MAX_FIELD_NAME_LENGTH",
     "MAX_FIELD_VALUE_LENGTH",
+    "MAX_EMBED_NAME_LENGTH",
+    "MAX_EMBED_TOTAL_LENGTH",
+    "MAX_AUTOCOMPLETE_CHOICES",
+    "LIST_PAGE_SIZE",
+    "LIST_PAGE_CACHE_USERS",
+    "BROADCAST_CONCURRENCY",
+    "BROADCAST_MAX_CHANNELS",
+    "BROADCAST_PROGRESS_INTERVAL",
+    "CHANNEL_RATE_LIMIT",
+    "CHANNEL_RATE_PERIOD",
+    "SCHEDULE_CATCH_UP",
+    "SCHEDULE_CATCH_UP_MAX",
+    "SCHEDULE_MIN_INTERVAL",
+    "SCHEDULE_MAX_PER_USER",
+    "SCHEDULE_UTC_OFFSET",
+    "DRAFT_TTL",
+    "DRAFT_MAX_BYTES",
+    "DRAFT_SWEEP_INTERVAL",
+    "DRAFT_PERSIST",
+    "BUILDER_RENDER_DELAY",
+    "INTERACTION_TOKEN_TTL",
+    "IMPORT_MAX_BYTES",
+    "IMPORT_MAX_ITEMS",
+    "IMPORT_MAX_ITEM_BYTES",
+    "IMPORT_CHUNK_SIZE",
+    "IMPORT_REPORT_LINES",
+    "EXPORT_PART_BYTES",
+    "EXPORT_ZIP_HEADROOM",
+    "EXPORT_BATCH_SIZE",
+    "METRICS_HOST",
+    "METRICS_PORT",
+    "METRICS_LATENCY_BUCKETS",
+    "LOOP_WATCHDOG_INTERVAL",
+    "LOOP_WATCHDOG_THRESHOLD",
+    "LOOP_WATCHDOG_STACK_DEPTH",
+    "LOOP_WATCHDOG_WINDOW",
+    "PROFILE_THRESHOLD",
+    "PROFILE_SAMPLE_INTERVAL",
+    "PROFILE_SAMPLE_WINDOW",
+    "PROFILE_MAX_RECORDS",
+    "PROFILE_MAX_DUMPS",
+    "LOG_LEVEL",
+    "LOG_JSON",
+    "LOG_FILE",
+    "LOG_FILE_MAX_BYTES",
+    "LOG_FILE_BACKUPS",
+    "LAZY_EXTENSIONS",
+    "EXTENSION_PRELOAD_WORKERS",
 ]
 
-# 경로
-DATA_DIR = Path(__file__).parent.parent / "data"
+# 경로 (SERI_DATA_DIR 환경 변수로 변경, 벤치마크가 임시 디렉토리를 쓸 때 사용)
+DATA_DIR = Path(os.getenv("SERI_DATA_DIR") or Path(__file__).parent.parent / "data")
+
+# 저장소 백엔드 ("json", "sqlite", "sharded", SERI_STORAGE 환경 변수로 변경)
+STORAGE_BACKEND: str = "json"
 
 # 색상 (0xRRGGBB 형식)
 EMBED_COLORS = {
@@ -26,12 +90,103 @@ EMBED_COLORS = {
     "GRAY": 0x95A5A6,
     "DARK_GRAY": 0x34495E,
 }
+DEFAULT_EMBED_COLOR: int = EMBED_COLORS["BLUE"]
 
 # 봇 설정
 DEFAULT_ACTIVITY_NAME: str = "임베드 빌더"
-AUTO_SAVE_INTERVAL: int = 300  # 5분
+AUTO_SAVE_INTERVAL: int = 60  # 1분 (저널 압축 검사 주기)
+
+# 저널 압축 임계값
+JOURNAL_MAX_BYTES: int = 4 * 1024 * 1024  # 4MB
+JOURNAL_MAX_AGE: int = 1800  # 30분
+
+# 쓰기 지연
+WRITE_BEHIND_DELAY: float = 0.5  # 변경 병합 대기 시간 (초)
+WRITE_BEHIND_CLOSE_TIMEOUT: float = 10.0  # 종료 시 마지막 반영 제한 시간 (초)
+
+# 사용자별 샤드 저장소
+SHARD_BUCKETS: int = 256  # 샤드 파일을 나누는 하위 디렉토리 수
+SHARD_CACHE_BYTES: int = 64 * 1024 * 1024  # 메모리에 유지할 샤드 최대 크기 (64MB)
 
 # 임베드 제한값
 MAX_EMBED_FIELDS: int = 25
+MAX_TITLE_LENGTH: int = 256
+MAX_DESCRIPTION_LENGTH: int = 4096
+MAX_AUTHOR_LENGTH: int = 256
+MAX_FOOTER_LENGTH: int = 2048
 MAX_FIELD_NAME_LENGTH: int = 256
 MAX_FIELD_VALUE_LENGTH: int = 1024
+MAX_EMBED_NAME_LENGTH: int = 50
+MAX_EMBED_TOTAL_LENGTH: int = 6000  # 제목, 설명, 필드, 작성자, 바닥글 글자 수 합
+
+# 자동 완성 제한값
+MAX_AUTOCOMPLETE_CHOICES: int = 25
+
+# 목록 페이지 (Select 옵션 최대 25개)
+LIST_PAGE_SIZE: int = 20
+LIST_PAGE_CACHE_USERS: int = 1000  # 렌더링된 페이지를 캐시할 최대 사용자 수
+
+# 브로드캐스트
+BROADCAST_CONCURRENCY: int = 5  # 동시에 진행할 최대 전송 수
+BROADCAST_MAX_CHANNELS: int = 500  # 한 번에 전송할 최대 채널 수
+BROADCAST_PROGRESS_INTERVAL: float = 2.0  # 진행 메시지 수정 최소 간격 (초)
+CHANNEL_RATE_LIMIT: int = 5  # 채널당 기간 내 최대 메시지 수
+CHANNEL_RATE_PERIOD: float = 5.0  # 채널 속도 제한 기간 (초)
+
+# 예약 전송
+SCHEDULE_CATCH_UP: str = "once"  # 놓친 실행 처리 ("skip", "once", "all", SERI_SCHEDULE_CATCH_UP 환경 변수로 변경)
+SCHEDULE_CATCH_UP_MAX: int = 10  # "all"일 때 예약당 최대 재실행 횟수
+SCHEDULE_MIN_INTERVAL: int = 300  # 반복 최소 간격 (5분)
+SCHEDULE_MAX_PER_USER: int = 25
+SCHEDULE_UTC_OFFSET: int = 9  # 예약 시각 입력 기준 시간대 (KST)
+
+# 빌더 초안
+DRAFT_TTL: int = 1800  # 마지막 사용 후 초안 유지 시간 (30분)
+DRAFT_MAX_BYTES: int = 16 * 1024 * 1024  # 전체 초안 크기 상한 (16MB)
+DRAFT_SWEEP_INTERVAL: int = 60  # 만료 초안 정리 주기 (초)
+DRAFT_PERSIST: bool = True  # 재시작 후에도 초안 유지 (data/drafts.json)
+
+# 빌더 메시지
+BUILDER_RENDER_DELAY: float = 0.3  # 연속 액션을 한 번의 메시지 수정으로 묶는 대기 시간 (초)
+INTERACTION_TOKEN_TTL: int = 900  # 인터랙션 토큰 유효 시간 (15분)
+
+# 가져오기
+IMPORT_MAX_BYTES: int = 8 * 1024 * 1024  # 가져올 파일 최대 크기 (8MB)
+IMPORT_MAX_ITEMS: int = 1000  # 한 번에 가져올 최대 임베드 수
+IMPORT_MAX_ITEM_BYTES: int = 64 * 1024  # 항목 하나의 최대 크기 (64KB)
+IMPORT_CHUNK_SIZE: int = 64 * 1024  # 파일을 읽는 단위 (64KB)
+IMPORT_REPORT_LINES: int = 20  # 결과 임베드에 표시할 최대 항목 수 (넘으면 파일 첨부)
+
+# 전체 내보내기
+EXPORT_PART_BYTES: int = 8 * 1024 * 1024  # 내보내기 파일 하나의 최대 크기 (서버 첨부 제한이 더 작으면 그 값)
+EXPORT_ZIP_HEADROOM: int = 256 * 1024  # 압축기가 아직 기록하지 않은 데이터를 위한 여유 (256KB)
+EXPORT_BATCH_SIZE: int = 200  # 저장소에서 한 번에 읽는 임베드 수
+
+# 메트릭 엔드포인트 (기본 꺼짐, SERI_METRICS_PORT 환경 변수로 켬)
+METRICS_HOST: str = "127.0.0.1"  # 외부에 노출하지 않도록 로컬에서만 수신
+METRICS_PORT: int | None = None
+METRICS_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 초
+
+# 이벤트 루프 감시
+LOOP_WATCHDOG_INTERVAL: float = 0.1  # 지연 측정 주기 (초)
+LOOP_WATCHDOG_THRESHOLD: float = 0.25  # 막힘으로 보고 스택을 남기는 최소 지연 (초)
+LOOP_WATCHDOG_STACK_DEPTH: int = 20  # 로그에 남길 안쪽 프레임 수
+LOOP_WATCHDOG_WINDOW: int = 600  # p50/p99 계산에 쓰는 최근 측정 수 (1분)
+
+# 느린 핸들러 프로파일링 (기본 꺼짐, SERI_PROFILE=1 또는 /profile on으로 켬)
+PROFILE_THRESHOLD: float = 0.5  # 프로파일을 남길 최소 처리 시간 (초, SERI_PROFILE_THRESHOLD_MS로 변경)
+PROFILE_SAMPLE_INTERVAL: float = 0.005  # 스택 표본 간격 (초)
+PROFILE_SAMPLE_WINDOW: float = 30.0  # 표본을 보관하는 기간 (초, 이보다 긴 핸들러는 앞부분이 빠짐)
+PROFILE_MAX_RECORDS: int = 50  # 보관할 느린 핸들러 기록 수
+PROFILE_MAX_DUMPS: int = 100  # data/profiles에 남길 프로파일 파일 수
+
+# 로깅 (SERI_LOG_LEVEL, SERI_LOG_JSON=1, SERI_LOG_FILE=1 환경 변수로 변경)
+LOG_LEVEL: str = "INFO"
+LOG_JSON: bool = False  # 한 줄에 하나인 JSON 형식 (인터랙션, 사용자, 서버 문맥 포함)
+LOG_FILE: bool = False  # data/logs/seri.log에 저장
+LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024  # 로그 파일 하나의 최대 크기 (10MB)
+LOG_FILE_BACKUPS: int = 5  # 보관할 이전 로그 파일 수
+
+# 확장 로드 (SERI_LAZY_EXTENSIONS 환경 변수로 변경, 쉼표로 구분하며 빈 값이면 모두 바로 불러옴)
+LAZY_EXTENSIONS: tuple[str, ...] = ("commands.profile", "commands.sync", "commands.transfer")  # 처음 사용할 때 불러올 확장
+EXTENSION_PRELOAD_WORKERS: int = 4  # 등록 전에 의존 모듈을 미리 가져올 스레드 수
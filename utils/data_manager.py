@@ -1,128 +1,804 @@
-"""JSON 파일 기반 데이터 관리"""
+"""임베드 데이터 관리
+
+`DataManager`는 저장소 인터페이스이며, 구현체는 다음과 같습니다.
+
+- `JsonDataManager`: 바이너리 스냅샷(embeds.snap) + 추가 전용 저널(embeds.journal)
+- `SqliteDataManager`: SQLite(WAL) 데이터베이스 (`utils.sqlite_data_manager`)
+- `ShardedDataManager`: 사용자별 샤드 파일 + LRU 캐시 (`utils.sharded_data_manager`)
+
+모든 메서드는 코루틴이며 이벤트 루프를 오래 막지 않아야 합니다.
+"""
 from __future__ import annotations
+import asyncio
 import json
 import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Iterator, TextIO
 import discord
 
-from .constants import DATA_DIR
+from .constants import (
+    DATA_DIR,
+    JOURNAL_MAX_AGE,
+    JOURNAL_MAX_BYTES,
+    LIST_PAGE_SIZE,
+    STORAGE_BACKEND,
+    WRITE_BEHIND_CLOSE_TIMEOUT,
+)
+from .blob_store import BlobStore
+from .embed_document import EmbedDocument
+from .name_index import NameIndex
+from .snapshot import (
+    SnapshotReader,
+    blob_digest,
+    decode_refs,
+    encode_blob,
+    encode_refs,
+    write_snapshot,
+)
+from .write_behind import PendingWrites, WriteBehindQueue
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["DataManager"]
+__all__ = ["DataManager", "EmbedPage", "JsonDataManager", "create_data_manager"]
+
 
+@dataclass
+class EmbedPage:
+    """임베드 이름 목록의 한 페이지"""
 
-class DataManager:
-    """사용자 임베드 데이터 관리"""
+    names: list[str]
+    next_cursor: str | None
+    total: int
+
+
+class DataManager(ABC):
+    """사용자 임베드 저장소 인터페이스"""
 
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.embeds_file = DATA_DIR / "embeds.json"
-        self.user_embeds: dict[int, dict[str, Any]] = {}
-        
+        self._change_listeners: list[Callable[[int], None]] = []
+        # load_data가 성공한 뒤에만 True (그 전에는 빈 상태를 디스크에 반영하지 않음)
+        self._loaded = False
+
         # 디렉토리 생성
         DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    def load_data(self) -> None:
-        """모든 데이터 로드"""
-        self._load_embeds()
+    @property
+    def loaded(self) -> bool:
+        """`load_data`가 성공했는지 여부"""
+        return self._loaded
 
-    def save_data(self) -> None:
-        """모든 데이터 저장"""
-        self._save_embeds()
+    def add_change_listener(self, listener: Callable[[int], None]) -> None:
+        """임베드 저장/삭제 시 호출할 리스너 등록
 
-    def _load_embeds(self) -> None:
-        """사용자 임베드 로드"""
-        try:
-            if self.embeds_file.exists():
-                with open(self.embeds_file, "r", encoding="utf-8") as f:
-                    self.user_embeds = json.load(f)
-            else:
-                self.user_embeds = {}
-                self._save_embeds()
-        except Exception as e:
-            logger.error(f"임베드 로드 실패: {e}")
-            self.user_embeds = {}
+        Args:
+            listener: 변경된 사용자 ID를 받는 함수
+        """
+        self._change_listeners.append(listener)
 
-    def _save_embeds(self) -> None:
-        """사용자 임베드 저장"""
-        try:
-            with open(self.embeds_file, "w", encoding="utf-8") as f:
-                json.dump(self.user_embeds, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"임베드 저장 실패: {e}")
+    def remove_change_listener(self, listener: Callable[[int], None]) -> None:
+        """변경 리스너 해제"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_change(self, user_id: int) -> None:
+        """변경 리스너 호출"""
+        for listener in self._change_listeners:
+            try:
+                listener(user_id)
+            except Exception as e:
+                logger.error(f"변경 리스너 오류: {e}")
+
+    @abstractmethod
+    async def load_data(self) -> None:
+        """저장소 열기 및 데이터 로드"""
+
+    @abstractmethod
+    async def save_data(self) -> None:
+        """모든 데이터를 디스크에 반영"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """저장소 닫기"""
+
+    async def maybe_compact(self) -> bool:
+        """백엔드별 주기 정리 작업
+
+        Returns:
+            정리 작업 실행 여부
+        """
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """저장소 통계
+
+        Returns:
+            백엔드별 통계 (없으면 빈 딕셔너리)
+        """
+        return {}
 
-    def save_embed(self, user_id: int, embed_name: str, embed_data: dict[str, Any]) -> None:
+    @abstractmethod
+    async def save_embed(self, user_id: int, embed_name: str, embed_data: EmbedDocument) -> None:
         """임베드 저장
-        
+
+        저장소는 복사본을 보관하므로 이후 원본을 수정해도 저장본은 바뀌지 않습니다.
+
         Args:
             user_id: 사용자 ID
             embed_name: 임베드 이름
-            embed_data: 임베드 데이터
+            embed_data: 임베드 문서
+
+        Raises:
+            EmbedValidationError: 임베드 제한값을 넘은 경우
         """
-        if user_id not in self.user_embeds:
-            self.user_embeds[user_id] = {}
-        
-        self.user_embeds[user_id][embed_name] = embed_data
-        self._save_embeds()
 
-    def get_embed(self, user_id: int, embed_name: str) -> dict[str, Any] | None:
+    @abstractmethod
+    async def save_embeds(self, user_id: int, embeds: list[tuple[str, EmbedDocument]]) -> None:
+        """여러 임베드를 한 번에 저장
+
+        모든 임베드를 먼저 검증하므로 하나라도 제한값을 넘으면 아무것도
+        저장하지 않습니다. 변경은 한 번의 쓰기로 반영됩니다.
+
+        Args:
+            user_id: 사용자 ID
+            embeds: (임베드 이름, 임베드 문서) 목록 (같은 이름이면 나중 것이 남음)
+
+        Raises:
+            EmbedValidationError: 임베드 제한값을 넘은 경우
+        """
+
+    @abstractmethod
+    async def get_embed(self, user_id: int, embed_name: str) -> EmbedDocument | None:
         """임베드 조회
-        
+
+        반환된 문서는 저장소와 공유될 수 있으므로 수정하지 말고
+        필요하면 `copy()`를 사용해야 합니다.
+
         Args:
             user_id: 사용자 ID
             embed_name: 임베드 이름
-            
+
         Returns:
-            임베드 데이터 (없으면 None)
+            임베드 문서 (없으면 None)
         """
-        if user_id not in self.user_embeds:
-            return None
-        return self.user_embeds[user_id].get(embed_name)
 
-    def delete_embed(self, user_id: int, embed_name: str) -> bool:
+    @abstractmethod
+    async def delete_embed(self, user_id: int, embed_name: str) -> bool:
         """임베드 삭제
-        
+
         Args:
             user_id: 사용자 ID
             embed_name: 임베드 이름
-            
+
         Returns:
             성공 여부
         """
-        if user_id not in self.user_embeds:
-            return False
-        
-        if embed_name in self.user_embeds[user_id]:
-            del self.user_embeds[user_id][embed_name]
-            self._save_embeds()
-            return True
-        return False
 
-    def list_embeds(self, user_id: int) -> list[str]:
+    @abstractmethod
+    async def list_embeds(self, user_id: int) -> list[str]:
         """사용자의 모든 임베드 이름 조회
-        
+
         Args:
             user_id: 사용자 ID
-            
+
         Returns:
             임베드 이름 목록
         """
-        if user_id not in self.user_embeds:
-            return []
-        return list(self.user_embeds[user_id].keys())
 
-    def embed_exists(self, user_id: int, embed_name: str) -> bool:
+    async def iter_embeds(self, user_id: int) -> AsyncIterator[tuple[str, EmbedDocument]]:
+        """사용자의 모든 임베드를 이름순으로 차례로 조회
+
+        전체를 한 번에 목록으로 만들지 않으므로 큰 보관함을 내보낼 때
+        사용합니다. 기본 구현은 이름 목록을 받은 뒤 하나씩 조회합니다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Yields:
+            (임베드 이름, 임베드 문서)
+        """
+        for embed_name in sorted(await self.list_embeds(user_id)):
+            embed_data = await self.get_embed(user_id, embed_name)
+            if embed_data is not None:
+                yield embed_name, embed_data
+
+    @abstractmethod
+    async def embed_exists(self, user_id: int, embed_name: str) -> bool:
         """임베드 존재 여부 확인
-        
+
         Args:
             user_id: 사용자 ID
             embed_name: 임베드 이름
-            
+
         Returns:
             존재 여부
         """
-        if user_id not in self.user_embeds:
+
+    @abstractmethod
+    async def search_embed_names(self, user_id: int, prefix: str, limit: int = 25) -> list[str]:
+        """접두사로 임베드 이름 검색 (자동 완성용)
+
+        Args:
+            user_id: 사용자 ID
+            prefix: 이름 접두사 (대소문자 무시)
+            limit: 최대 결과 수
+
+        Returns:
+            이름순으로 정렬된 임베드 이름 목록
+        """
+
+    @abstractmethod
+    async def list_embeds_page(
+        self,
+        user_id: int,
+        sort: str = "name",
+        cursor: str | None = None,
+        limit: int = LIST_PAGE_SIZE
+    ) -> EmbedPage:
+        """커서 기반 임베드 이름 페이지 조회
+
+        Args:
+            user_id: 사용자 ID
+            sort: "name" (이름순) 또는 "recent" (최근 저장순)
+            cursor: 이전 페이지의 next_cursor (처음이면 None)
+            limit: 페이지 크기
+
+        Returns:
+            임베드 이름 페이지
+        """
+
+
+class JsonDataManager(DataManager):
+    """스냅샷 + 저널 기반 저장소
+
+    시작 시에는 바이너리 스냅샷(`utils.snapshot`)의 헤더만 읽고, 사용자
+    임베드는 처음 접근할 때 디코딩하여 `user_embeds`에 유지합니다.
+    변경 사항은 메모리에 즉시 반영된 뒤 쓰기 지연 큐를 거쳐 저널에 한 줄씩
+    추가되고, 저널이 임계값을 넘으면 백그라운드에서 새 스냅샷으로 압축됩니다.
+    이전 형식의 embeds.json이 있으면 읽은 뒤 첫 압축 때 스냅샷으로 바꿉니다.
+
+    같은 내용의 임베드는 메모리에서는 `BlobStore`로 하나의 객체를 공유하고,
+    스냅샷에서는 blob 하나로 저장됩니다. 더 이상 참조되지 않는 blob은
+    압축(자동 저장) 때 새 스냅샷에 복사되지 않는 방식으로 정리됩니다.
+    """
+
+    def __init__(self, bot: discord.Bot):
+        super().__init__(bot)
+        self.snapshot_file = DATA_DIR / "embeds.snap"
+        self.embeds_file = DATA_DIR / "embeds.json"
+        self.journal_file = DATA_DIR / "embeds.journal"
+        self.user_embeds: dict[int, dict[str, EmbedDocument]] = {}
+
+        self._snapshot: SnapshotReader | None = None
+        self._name_indexes: dict[int, NameIndex] = {}
+        self._blobs = BlobStore()
+        self.blobs_collected = 0
+
+        self._journal: TextIO | None = None
+        self._journal_bytes = 0
+        self._journal_started: float | None = None
+        self._compacting = False
+        self._writer = WriteBehindQueue(self._write_pending)
+
+    async def load_data(self) -> None:
+        """스냅샷 로드 및 저널 재생"""
+        self._loaded = False
+        self._load_embeds()
+        self._loaded = True
+        self._writer.start()
+
+    async def save_data(self) -> None:
+        """저널을 스냅샷으로 강제 압축 (로드 전에는 아무것도 하지 않음)"""
+        await self.compact()
+
+    async def close(self) -> None:
+        """대기 중인 변경 반영 후 저널 파일 닫기"""
+        await self._writer.close(WRITE_BEHIND_CLOSE_TIMEOUT)
+        self._close_journal()
+        self._close_snapshot()
+
+    def get_stats(self) -> dict[str, Any]:
+        """쓰기 지연, 저널, 스냅샷 및 중복 제거 통계"""
+        stats: dict[str, Any] = self._writer.get_stats()
+        stats["journal_bytes"] = self._journal_bytes
+        stats["snapshot_bytes"] = self.snapshot_file.stat().st_size if self.snapshot_file.exists() else 0
+        stats["snapshot_users"] = len(self._snapshot) if self._snapshot else 0
+        stats["resident_users"] = len(self.user_embeds)
+        stats.update(self._blobs.get_stats())
+
+        # 디스크: 스냅샷의 임베드 참조 수 / 저장된 blob 수
+        if self._snapshot is not None and self._snapshot.blob_count:
+            stats["snapshot_blobs"] = self._snapshot.blob_count
+            stats["snapshot_dedup_ratio"] = self._snapshot.ref_count / self._snapshot.blob_count
+        stats["blobs_collected"] = self.blobs_collected
+        return stats
+
+    def has_data(self) -> bool:
+        """디스크에 저장된 데이터 존재 여부"""
+        return (
+            self.snapshot_file.exists()
+            or self.embeds_file.exists()
+            or bool(self._journal_files())
+        )
+
+    def needs_compaction(self) -> bool:
+        """저널 압축 필요 여부
+
+        Returns:
+            저널이 크기 또는 시간 임계값을 넘었는지 여부
+        """
+        if self._journal_bytes == 0 or self._journal_started is None:
+            return False
+        if self._journal_bytes >= JOURNAL_MAX_BYTES:
+            return True
+        return time.time() - self._journal_started >= JOURNAL_MAX_AGE
+
+    async def maybe_compact(self) -> bool:
+        """임계값을 넘었으면 저널 압축
+
+        Returns:
+            압축 실행 여부
+        """
+        if not self._loaded or self._compacting or not self.needs_compaction():
             return False
-        return embed_name in self.user_embeds[user_id]
+        await self.compact()
+        return True
+
+    async def compact(self) -> None:
+        """저널을 새 스냅샷으로 압축
+
+        직렬화는 일관된 시점을 위해 이벤트 루프에서 수행하고,
+        파일 쓰기만 스레드에서 수행합니다. 로드가 끝나지 않았으면 디스크의
+        스냅샷과 저널을 그대로 둡니다 (손상된 스냅샷은 확인할 수 있도록 보존).
+        """
+        if self._compacting:
+            return
+        if not self._loaded:
+            logger.warning("임베드를 로드하지 않은 상태이므로 압축을 건너뜀")
+            return
+
+        self._compacting = True
+        try:
+            async with self._writer.lock:
+                hot_users, new_blobs = self._encode_resident_users()
+                rotated = self._rotate_journal()
+                tmp_file = await asyncio.to_thread(self._write_snapshot, hot_users, new_blobs)
+                if tmp_file is not None:
+                    self._install_snapshot(tmp_file, rotated)
+        finally:
+            self._compacting = False
+
+    def _close_journal(self) -> None:
+        """열린 저널 파일 닫기"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _close_snapshot(self) -> None:
+        """열린 스냅샷 닫기"""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _load_embeds(self) -> None:
+        """스냅샷 열기 및 저널 재생
+
+        Raises:
+            SnapshotError: 스냅샷 파일이 손상된 경우
+        """
+        started = time.perf_counter()
+        self._close_journal()
+        self._close_snapshot()
+        self.user_embeds = {}
+        self._name_indexes = {}
+        self._blobs = BlobStore()
+
+        if self.snapshot_file.exists():
+            # 손상된 스냅샷 위에 빈 상태를 압축하지 않도록 예외를 전파
+            self._snapshot = SnapshotReader(self.snapshot_file)
+        elif self.embeds_file.exists():
+            try:
+                with open(self.embeds_file, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                # JSON 키는 문자열이므로 사용자 ID로 변환
+                self.user_embeds = {int(uid): self._decode_user(embeds) for uid, embeds in raw.items()}
+            except Exception as e:
+                # 손상된 파일을 빈 스냅샷으로 바꾸지 않도록 예외를 전파
+                logger.error(f"임베드 로드 실패: {e}")
+                raise
+
+        replayed = 0
+        for journal_path in self._journal_files():
+            replayed += self._replay_journal(journal_path)
+
+        try:
+            self._journal_bytes = self.journal_file.stat().st_size
+        except FileNotFoundError:
+            self._journal_bytes = 0
+        self._journal_started = time.time() if self._journal_bytes else None
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        snapshot_users = len(self._snapshot) if self._snapshot else len(self.user_embeds)
+        logger.info(f"임베드 로드 완료: {elapsed_ms:.1f}ms (사용자 {snapshot_users}명, 저널 {replayed}건)")
+
+    def _decode_user(self, embeds: dict[str, Any]) -> dict[str, EmbedDocument]:
+        """저장된 사용자 임베드 딕셔너리를 공유 문서로 변환"""
+        return {
+            name: self._blobs.acquire(EmbedDocument.from_dict(data))
+            for name, data in embeds.items()
+        }
+
+    def _resolve_refs(self, refs: dict[str, bytes]) -> dict[str, EmbedDocument]:
+        """스냅샷 내용 해시를 공유 문서로 변환 (이미 메모리에 있으면 디코딩 생략)"""
+        embeds = {}
+        for name, digest in refs.items():
+            embed_data = self._blobs.acquire_digest(digest)
+            if embed_data is None:
+                embed_data = self._blobs.acquire(
+                    EmbedDocument.from_dict(self._snapshot.get_blob(digest)), digest
+                )
+            embeds[name] = embed_data
+        return embeds
+
+    @staticmethod
+    def _encode_user(embeds: dict[str, EmbedDocument]) -> dict[str, Any]:
+        """사용자 임베드 문서를 저장용 딕셔너리로 변환"""
+        return {name: embed.to_dict() for name, embed in embeds.items()}
+
+    def _user(self, user_id: int) -> dict[str, EmbedDocument] | None:
+        """사용자 임베드 조회 (스냅샷에서 필요할 때 디코딩)"""
+        embeds = self.user_embeds.get(user_id)
+        if embeds is None and self._snapshot is not None:
+            if self._snapshot.version >= 2:
+                refs = self._snapshot.get_refs(user_id)
+                if refs is not None:
+                    embeds = self.user_embeds[user_id] = self._resolve_refs(refs)
+            else:
+                raw = self._snapshot.get(user_id)
+                if raw is not None:
+                    embeds = self.user_embeds[user_id] = self._decode_user(raw)
+        return embeds
+
+    def _iter_user_embeds(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """메모리와 스냅샷의 모든 사용자 임베드를 저장용 딕셔너리로 순회"""
+        for user_id, embeds in self.user_embeds.items():
+            yield user_id, self._encode_user(embeds)
+        if self._snapshot is not None:
+            for user_id, embeds in self._snapshot.iter_users():
+                if user_id not in self.user_embeds:
+                    yield user_id, embeds
+
+    def _journal_files(self) -> list[Path]:
+        """재생할 저널 파일 목록 (오래된 순서)"""
+        rotated = [
+            p for p in DATA_DIR.glob(f"{self.journal_file.name}.*")
+            if p.suffix[1:].isdigit()
+        ]
+        files = sorted(rotated, key=lambda p: int(p.suffix[1:]))
+        if self.journal_file.exists():
+            files.append(self.journal_file)
+        return files
+
+    def _replay_journal(self, journal_path: Path) -> int:
+        """저널 파일 재생
+
+        Args:
+            journal_path: 저널 파일 경로
+
+        Returns:
+            적용된 레코드 수
+        """
+        count = 0
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 비정상 종료로 잘린 마지막 줄
+                    logger.warning(f"손상된 저널 레코드 무시: {journal_path.name}:{line_no}")
+                    continue
+                self._apply_record(record)
+                count += 1
+        return count
+
+    def _apply_record(self, record: dict[str, Any]) -> None:
+        """저널 레코드를 메모리에 적용"""
+        user_id = int(record["uid"])
+        name = record["name"]
+        embeds = self._user(user_id)
+
+        if record["op"] == "put":
+            if embeds is None:
+                embeds = self.user_embeds[user_id] = {}
+            # 딕셔너리 순서를 최근 저장순으로 유지
+            old_data = embeds.pop(name, None)
+            embeds[name] = self._blobs.acquire(EmbedDocument.from_dict(record["data"]))
+            if old_data is not None:
+                self._blobs.release(old_data)
+        elif record["op"] == "del":
+            if embeds is not None:
+                old_data = embeds.pop(name, None)
+                if old_data is not None:
+                    self._blobs.release(old_data)
+
+    def _write_pending(self, pending: PendingWrites) -> None:
+        """더티 상태를 저널 레코드로 추가 (writer 스레드)"""
+        lines = []
+        for user_id, changes in pending.items():
+            for embed_name, embed_data in changes.items():
+                if embed_data is None:
+                    record = {"op": "del", "uid": user_id, "name": embed_name}
+                else:
+                    record = {"op": "put", "uid": user_id, "name": embed_name, "data": embed_data}
+                lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+        chunk = "\n".join(lines) + "\n"
+        if self._journal is None:
+            self._journal = open(self.journal_file, "a", encoding="utf-8")
+        self._journal.write(chunk)
+        self._journal.flush()
+
+        if self._journal_started is None:
+            self._journal_started = time.time()
+        self._journal_bytes += len(chunk.encode("utf-8"))
+
+    def _encode_resident_users(self) -> tuple[dict[int, dict[str, bytes] | None], dict[bytes, bytes]]:
+        """메모리에 있는 사용자를 스냅샷 레코드로 인코딩
+
+        Returns:
+            (사용자 ID -> 임베드 이름 -> 내용 해시 (빈 사용자는 None),
+             기존 스냅샷에 없는 blob)
+        """
+        snapshot = self._snapshot if self._snapshot is not None and self._snapshot.version >= 2 else None
+        hot_users: dict[int, dict[str, bytes] | None] = {}
+        new_blobs: dict[bytes, bytes] = {}
+
+        for user_id, embeds in self.user_embeds.items():
+            if not embeds:
+                hot_users[user_id] = None
+                continue
+            refs = {}
+            for name, embed_data in embeds.items():
+                digest = self._blobs.digest_of(embed_data)
+                refs[name] = digest
+                if digest not in new_blobs and (snapshot is None or not snapshot.has_blob(digest)):
+                    new_blobs[digest] = self._blobs.encode(digest)
+            hot_users[user_id] = refs
+        return hot_users, new_blobs
+
+    def _rotate_journal(self) -> list[Path]:
+        """현재 저널을 세대 파일로 교체
+
+        스냅샷 쓰기 도중 발생한 변경은 새 저널에 기록됩니다.
+
+        Returns:
+            스냅샷이 반영하는 저널 파일 목록
+        """
+        self._close_journal()
+        covered = [p for p in self._journal_files() if p != self.journal_file]
+
+        if self.journal_file.exists():
+            rotated = self.journal_file.with_name(f"{self.journal_file.name}.{time.time_ns()}")
+            os.replace(self.journal_file, rotated)
+            covered.append(rotated)
+
+        self._journal_bytes = 0
+        self._journal_started = None
+        return covered
+
+    def _write_snapshot(
+        self,
+        hot_users: dict[int, dict[str, bytes] | None],
+        new_blobs: dict[bytes, bytes]
+    ) -> Path | None:
+        """새 스냅샷을 임시 파일에 기록 (스레드)
+
+        메모리에 없는 사용자는 기존 스냅샷의 레코드를 그대로 복사하고,
+        기록된 사용자가 참조하는 blob만 새 스냅샷에 옮깁니다 (참조되지 않는 blob 정리).
+
+        Args:
+            hot_users: 메모리에 있는 사용자의 임베드 내용 해시
+            new_blobs: 기존 스냅샷에 없는 blob
+
+        Returns:
+            임시 파일 경로 (실패 시 None)
+        """
+        snapshot = self._snapshot
+        referenced: set[bytes] = set()
+
+        def users() -> Iterator[tuple[int, bytes, int]]:
+            for user_id, refs in hot_users.items():
+                if refs:
+                    referenced.update(refs.values())
+                    yield user_id, encode_refs(refs), len(refs)
+            if snapshot is None:
+                return
+            for user_id, record in snapshot.iter_raw():
+                if user_id in hot_users:
+                    continue
+                if snapshot.version >= 2:
+                    refs = decode_refs(record)
+                else:
+                    # 버전 1 스냅샷은 한 번만 blob 형식으로 변환
+                    refs = {}
+                    for name, embed_data in json.loads(record).items():
+                        blob = encode_blob(EmbedDocument.from_dict(embed_data).to_dict())
+                        digest = blob_digest(blob)
+                        new_blobs.setdefault(digest, blob)
+                        refs[name] = digest
+                    record = encode_refs(refs)
+                referenced.update(refs.values())
+                yield user_id, record, len(refs)
+
+        def blobs() -> Iterator[tuple[bytes, bytes]]:
+            # users()를 모두 기록한 뒤에 순회되므로 참조 집합이 완성되어 있음
+            for digest in referenced:
+                blob = new_blobs.get(digest)
+                if blob is None and snapshot is not None and snapshot.version >= 2:
+                    blob = snapshot.get_blob_raw(digest)
+                if blob is None:
+                    logger.error(f"참조된 blob이 없습니다: {digest.hex()}")
+                    continue
+                yield digest, blob
+
+        tmp_file = self.snapshot_file.with_suffix(".snap.tmp")
+        try:
+            write_snapshot(tmp_file, users(), blobs())
+        except Exception as e:
+            # 저널 세대 파일이 남아 있으므로 다음 로드 시 재생됨
+            logger.error(f"임베드 저장 실패: {e}")
+            return None
+
+        if snapshot is not None and snapshot.blob_count:
+            kept = sum(1 for digest in referenced if digest not in new_blobs)
+            self.blobs_collected += snapshot.blob_count - kept
+        return tmp_file
+
+    def _install_snapshot(self, tmp_file: Path, covered: list[Path]) -> None:
+        """새 스냅샷으로 교체하고 반영된 저널 삭제
+
+        Args:
+            tmp_file: 기록된 임시 스냅샷 경로
+            covered: 스냅샷에 반영된 저널 파일 목록
+        """
+        # 열린 mmap이 있으면 교체할 수 없는 플랫폼이 있으므로 먼저 닫기
+        self._close_snapshot()
+        try:
+            os.replace(tmp_file, self.snapshot_file)
+        finally:
+            self._snapshot = SnapshotReader(self.snapshot_file)
+
+        stale = [*covered, self.embeds_file]
+        for path in stale:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        logger.debug(f"저널 압축 완료: {len(covered)}개 파일")
+
+    async def save_embed(self, user_id: int, embed_name: str, embed_data: EmbedDocument) -> None:
+        """임베드 저장"""
+        await self.save_embeds(user_id, [(embed_name, embed_data)])
+
+    async def save_embeds(self, user_id: int, embeds: list[tuple[str, EmbedDocument]]) -> None:
+        """여러 임베드를 한 번에 저장"""
+        for _, embed_data in embeds:
+            embed_data.validate()
+
+        user_embeds = self._user(user_id)
+        if user_embeds is None:
+            user_embeds = self.user_embeds[user_id] = {}
+        name_index = self._name_indexes.get(user_id)
+
+        for embed_name, embed_data in embeds:
+            # 빌더가 이후에 원본을 수정해도 저장본은 유지 (같은 내용이 있으면 공유)
+            embed_data = self._blobs.acquire(embed_data.copy())
+            # 딕셔너리 순서를 최근 저장순으로 유지
+            old_data = user_embeds.pop(embed_name, None)
+            user_embeds[embed_name] = embed_data
+            if old_data is not None:
+                self._blobs.release(old_data)
+            self._writer.mark(user_id, embed_name, embed_data.to_dict())
+
+            if name_index is not None:
+                name_index.add(embed_name)
+        self._notify_change(user_id)
+
+    async def get_embed(self, user_id: int, embed_name: str) -> EmbedDocument | None:
+        """임베드 조회"""
+        embeds = self._user(user_id)
+        if embeds is None:
+            return None
+        return embeds.get(embed_name)
+
+    async def delete_embed(self, user_id: int, embed_name: str) -> bool:
+        """임베드 삭제"""
+        embeds = self._user(user_id)
+        if embeds is None:
+            return False
+
+        if embed_name in embeds:
+            self._blobs.release(embeds.pop(embed_name))
+            self._writer.mark(user_id, embed_name, None)
+
+            name_index = self._name_indexes.get(user_id)
+            if name_index is not None:
+                name_index.remove(embed_name)
+            self._notify_change(user_id)
+            return True
+        return False
+
+    async def list_embeds(self, user_id: int) -> list[str]:
+        """사용자의 모든 임베드 이름 조회"""
+        embeds = self._user(user_id)
+        if embeds is None:
+            return []
+        return list(embeds.keys())
+
+    async def embed_exists(self, user_id: int, embed_name: str) -> bool:
+        """임베드 존재 여부 확인"""
+        embeds = self._user(user_id)
+        if embeds is None:
+            return False
+        return embed_name in embeds
+
+    def _get_name_index(self, user_id: int) -> NameIndex | None:
+        """사용자 이름 인덱스 (첫 사용 때 생성)"""
+        name_index = self._name_indexes.get(user_id)
+        if name_index is None:
+            embeds = self._user(user_id)
+            if not embeds:
+                return None
+            name_index = self._name_indexes[user_id] = NameIndex(embeds)
+        return name_index
+
+    async def search_embed_names(self, user_id: int, prefix: str, limit: int = 25) -> list[str]:
+        """접두사로 임베드 이름 검색"""
+        name_index = self._get_name_index(user_id)
+        if name_index is None:
+            return []
+        return name_index.search(prefix, limit)
+
+    async def list_embeds_page(
+        self,
+        user_id: int,
+        sort: str = "name",
+        cursor: str | None = None,
+        limit: int = LIST_PAGE_SIZE
+    ) -> EmbedPage:
+        """커서 기반 임베드 이름 페이지 조회"""
+        name_index = self._get_name_index(user_id)
+        if name_index is None:
+            return EmbedPage([], None, 0)
+        names, next_cursor = name_index.page(sort, cursor, limit)
+        return EmbedPage(names, next_cursor, len(name_index))
+
+
+def create_data_manager(bot: discord.Bot, backend: str | None = None) -> DataManager:
+    """저장소 백엔드 생성
+
+    Args:
+        bot: 봇 인스턴스
+        backend: 백엔드 이름 ("json", "sqlite", "sharded", 기본값: STORAGE_BACKEND)
+
+    Returns:
+        데이터 관리자
+    """
+    backend = (backend or STORAGE_BACKEND).lower()
+
+    if backend == "json":
+        return JsonDataManager(bot)
+    if backend == "sqlite":
+        from .sqlite_data_manager import SqliteDataManager
+        return SqliteDataManager(bot)
+    if backend == "sharded":
+        from .sharded_data_manager import ShardedDataManager
+        return ShardedDataManager(bot)
+
+    raise ValueError(f"알 수 없는 저장소 백엔드: {backend}")
@@ -0,0 +1,239 @@
+"""임베드 빌더 초안 세션 저장소"""
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .constants import DRAFT_MAX_BYTES, DRAFT_SWEEP_INTERVAL, DRAFT_TTL
+from .embed_document import EmbedDocument
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["DraftStore"]
+
+# 직렬화했을 때 키와 구분자가 차지하는 대략적인 길이 (문서, 필드 하나)
+_DOCUMENT_OVERHEAD = 64
+_FIELD_OVERHEAD = 40
+
+
+class DraftStore:
+    """유휴 만료와 메모리 상한이 있는 초안 저장소
+
+    초안은 마지막 사용 후 `ttl`초가 지나면 주기적인 정리 작업에서 삭제되고,
+    전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은 초안부터
+    내보냅니다. `path`를 지정하면 종료 및 정리 시점에 초안을 기록하여
+    재시작 후에도 이어서 작업할 수 있습니다.
+
+    Args:
+        ttl: 초안 유휴 만료 시간 (초)
+        max_bytes: 전체 초안 크기 상한 (직렬화 기준 바이트)
+        path: 초안 저장 파일 (None이면 메모리에만 유지)
+    """
+
+    def __init__(
+        self,
+        ttl: float = DRAFT_TTL,
+        max_bytes: int = DRAFT_MAX_BYTES,
+        path: Path | None = None
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.path = path
+
+        # 사용자 ID -> (초안, 마지막 사용 시각, 추정 크기), 오래 사용하지 않은 순
+        self._drafts: OrderedDict[int, tuple[EmbedDocument, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._dirty = False
+        self._task: asyncio.Task | None = None
+
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._drafts)
+
+    @staticmethod
+    def _estimate_size(draft: EmbedDocument, text_length: int | None = None) -> int:
+        """초안의 추정 크기 (직렬화 길이, 직렬화하지 않고 글자 수로 어림)
+
+        Args:
+            draft: 초안 문서
+            text_length: 알고 있는 전체 글자 수 (`EmbedBudget.total`, 없으면 문서에서 계산)
+        """
+        if text_length is None:
+            text_length = draft.text_length()
+        urls = len(draft.image or "") + len(draft.thumbnail or "")
+        return _DOCUMENT_OVERHEAD + text_length + urls + len(draft.fields) * _FIELD_OVERHEAD
+
+    def get(self, user_id: int) -> EmbedDocument | None:
+        """초안 조회 (사용 시각 갱신)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            초안 (없거나 만료되었으면 None)
+        """
+        entry = self._drafts.get(user_id)
+        if entry is None:
+            return None
+
+        draft, last_used, size = entry
+        now = time.time()
+        if now - last_used > self.ttl:
+            self._remove(user_id)
+            self.expired += 1
+            return None
+
+        self._drafts[user_id] = (draft, now, size)
+        self._drafts.move_to_end(user_id)
+        return draft
+
+    def put(self, user_id: int, draft: EmbedDocument, text_length: int | None = None) -> None:
+        """초안 저장 또는 변경 반영
+
+        초안을 수정한 뒤에도 호출하여 크기와 사용 시각을 갱신합니다.
+
+        Args:
+            user_id: 사용자 ID
+            draft: 초안 문서
+            text_length: 초안의 전체 글자 수 (`EmbedBudget.total`을 넘기면 O(1)로 크기 갱신)
+        """
+        self._remove(user_id)
+        size = self._estimate_size(draft, text_length)
+        self._drafts[user_id] = (draft, time.time(), size)
+        self._bytes += size
+        self._dirty = True
+
+        # 방금 저장한 초안은 남기고 오래된 초안부터 내보내기
+        while self._bytes > self.max_bytes and len(self._drafts) > 1:
+            old_user_id = next(iter(self._drafts))
+            self._remove(old_user_id)
+            self.evicted += 1
+
+    def pop(self, user_id: int) -> EmbedDocument | None:
+        """초안 삭제
+
+        Returns:
+            삭제된 초안 (없으면 None)
+        """
+        entry = self._remove(user_id)
+        return entry[0] if entry else None
+
+    def _remove(self, user_id: int) -> tuple[EmbedDocument, float, int] | None:
+        """초안 제거 및 크기 반영"""
+        entry = self._drafts.pop(user_id, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+            self._dirty = True
+        return entry
+
+    def sweep(self) -> int:
+        """만료된 초안 정리
+
+        Returns:
+            삭제된 초안 수
+        """
+        deadline = time.time() - self.ttl
+        expired = [
+            user_id
+            for user_id, (_, last_used, _) in self._drafts.items()
+            if last_used < deadline
+        ]
+        for user_id in expired:
+            self._remove(user_id)
+        self.expired += len(expired)
+        return len(expired)
+
+    def get_stats(self) -> dict[str, int]:
+        """초안 통계
+
+        Returns:
+            활성 초안 수, 전체 크기, 만료/내보낸 초안 수
+        """
+        return {
+            "drafts": len(self._drafts),
+            "draft_bytes": self._bytes,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    async def start(self) -> None:
+        """저장된 초안 불러오기 및 정리 작업 시작"""
+        if self.path is not None and not self._drafts:
+            records = await asyncio.to_thread(self._read_file)
+            # 오래된 순서로 기록되어 있으므로 그대로 넣으면 LRU 순서가 유지됨
+            for user_id, data, last_used in records:
+                draft = EmbedDocument.from_dict(data)
+                size = self._estimate_size(draft)
+                self._drafts[int(user_id)] = (draft, last_used, size)
+                self._bytes += size
+            self._dirty = False
+            removed = self.sweep()
+            logger.info(f"초안 {len(self._drafts)}개 로드 (만료 {removed}개)")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sweep_loop())
+
+    async def close(self) -> None:
+        """정리 작업 종료 및 초안 기록"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await self.save()
+
+    async def save(self) -> None:
+        """변경된 초안 기록 (저장 파일이 있을 때만)"""
+        if self.path is None or not self._dirty:
+            return
+        self._dirty = False
+        records = [
+            [user_id, draft.to_dict(), last_used]
+            for user_id, (draft, last_used, _) in self._drafts.items()
+        ]
+        try:
+            await asyncio.to_thread(self._write_file, records)
+        except Exception as e:
+            self._dirty = True
+            logger.error(f"초안 저장 오류: {e}")
+
+    def _read_file(self) -> list[list[Any]]:
+        """초안 파일 읽기 (스레드)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except json.JSONDecodeError as e:
+            logger.error(f"초안 파일 손상, 무시함: {e}")
+            return []
+
+    def _write_file(self, records: list[list[Any]]) -> None:
+        """초안 파일을 원자적으로 기록 (스레드)"""
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    async def _sweep_loop(self) -> None:
+        """주기적으로 만료된 초안 정리 및 기록"""
+        while True:
+            try:
+                await asyncio.sleep(DRAFT_SWEEP_INTERVAL)
+                removed = self.sweep()
+                if removed:
+                    logger.debug(f"만료된 초안 {removed}개 정리")
+                await self.save()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"초안 정리 오류: {e}")
@@ -0,0 +1,302 @@
+"""임베드 데이터 모델"""
+from __future__ import annotations
+from typing import Any, Iterable
+
+from .constants import (
+    DEFAULT_EMBED_COLOR,
+    MAX_AUTHOR_LENGTH,
+    MAX_DESCRIPTION_LENGTH,
+    MAX_EMBED_FIELDS,
+    MAX_EMBED_TOTAL_LENGTH,
+    MAX_FIELD_NAME_LENGTH,
+    MAX_FIELD_VALUE_LENGTH,
+    MAX_FOOTER_LENGTH,
+    MAX_TITLE_LENGTH,
+)
+
+__all__ = ["EmbedBudget", "EmbedDocument", "EmbedField", "EmbedValidationError"]
+
+# 값이 없으면 저장하지 않는 문자열 속성
+_OPTIONAL_TEXT = ("title", "description", "author", "footer", "image", "thumbnail")
+
+# 글자 수 제한이 있는 문자열 속성 -> (이름, 최대 길이), 모두 전체 글자 수에 포함됨
+_TEXT_LIMITS = {
+    "title": ("제목", MAX_TITLE_LENGTH),
+    "description": ("설명", MAX_DESCRIPTION_LENGTH),
+    "author": ("작성자", MAX_AUTHOR_LENGTH),
+    "footer": ("바닥글", MAX_FOOTER_LENGTH),
+}
+
+
+class EmbedValidationError(ValueError):
+    """임베드 제한값 위반"""
+
+
+def _text_length(value: str | None) -> int:
+    """전체 글자 수에 더해지는 길이"""
+    return len(value) if value else 0
+
+
+def _check_text(key: str, value: str | None) -> None:
+    """문자열 속성 검사"""
+    label, limit = _TEXT_LIMITS[key]
+    if value is not None and not isinstance(value, str):
+        raise EmbedValidationError(f"{label}은 문자열이어야 합니다.")
+    if value is not None and len(value) > limit:
+        raise EmbedValidationError(f"{label}은 최대 {limit}자까지 가능합니다.")
+
+
+def _check_color(color: int) -> None:
+    """색상 검사"""
+    if not isinstance(color, int) or isinstance(color, bool) or not 0 <= color <= 0xFFFFFF:
+        raise EmbedValidationError("색상은 0x000000 ~ 0xFFFFFF 범위여야 합니다.")
+
+
+def _check_field(position: int, field: EmbedField) -> None:
+    """필드 검사"""
+    if not isinstance(field.name, str) or not field.name:
+        raise EmbedValidationError(f"{position}번째 필드의 이름이 비어 있습니다.")
+    if not isinstance(field.value, str) or not field.value:
+        raise EmbedValidationError(f"{position}번째 필드의 내용이 비어 있습니다.")
+    if len(field.name) > MAX_FIELD_NAME_LENGTH:
+        raise EmbedValidationError(f"필드 이름은 최대 {MAX_FIELD_NAME_LENGTH}자까지 가능합니다.")
+    if len(field.value) > MAX_FIELD_VALUE_LENGTH:
+        raise EmbedValidationError(f"필드 값은 최대 {MAX_FIELD_VALUE_LENGTH}자까지 가능합니다.")
+
+
+def _check_total(total: int) -> None:
+    """전체 글자 수 검사"""
+    if total > MAX_EMBED_TOTAL_LENGTH:
+        raise EmbedValidationError(
+            f"임베드 전체 글자 수는 최대 {MAX_EMBED_TOTAL_LENGTH}자까지 가능합니다. (현재 {total}자)"
+        )
+
+
+class EmbedField:
+    """임베드 필드
+
+    Args:
+        name: 필드 이름
+        value: 필드 내용
+        inline: 인라인 표시 여부
+    """
+
+    __slots__ = ("name", "value", "inline")
+
+    def __init__(self, name: str, value: str, inline: bool = False):
+        self.name = name
+        self.value = value
+        self.inline = inline
+
+    def __repr__(self) -> str:
+        return f"EmbedField(name={self.name!r}, value={self.value!r}, inline={self.inline!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmbedField):
+            return NotImplemented
+        return (self.name, self.value, self.inline) == (other.name, other.value, other.inline)
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장용 딕셔너리 (inline은 True일 때만 기록)"""
+        if self.inline:
+            return {"name": self.name, "value": self.value, "inline": True}
+        return {"name": self.name, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EmbedField:
+        """저장된 딕셔너리에서 생성"""
+        return cls(data.get("name") or "", data.get("value") or "", bool(data.get("inline", False)))
+
+
+class EmbedDocument:
+    """임베드 문서
+
+    저장소, 빌더, 렌더러가 공유하는 임베드 표현입니다. 값이 없는 선택
+    속성은 `to_dict()`에서 생략되므로 저장 크기가 작고, 이전 형식처럼
+    모든 키가 `None`으로 채워진 딕셔너리도 `from_dict()`로 읽을 수 있습니다.
+
+    Args:
+        title: 제목
+        description: 설명
+        color: 색상 (0xRRGGBB)
+        fields: 필드 목록
+        author: 작성자 이름
+        footer: 바닥글
+        image: 이미지 URL
+        thumbnail: 썸네일 URL
+    """
+
+    __slots__ = ("title", "description", "color", "fields", "author", "footer", "image", "thumbnail")
+
+    def __init__(
+        self,
+        title: str | None = None,
+        description: str | None = None,
+        color: int = DEFAULT_EMBED_COLOR,
+        fields: Iterable[EmbedField] = (),
+        author: str | None = None,
+        footer: str | None = None,
+        image: str | None = None,
+        thumbnail: str | None = None
+    ):
+        self.title = title
+        self.description = description
+        self.color = color
+        self.fields: list[EmbedField] = list(fields)
+        self.author = author
+        self.footer = footer
+        self.image = image
+        self.thumbnail = thumbnail
+
+    def __repr__(self) -> str:
+        return f"EmbedDocument({self.to_dict()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmbedDocument):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장용 딕셔너리 (값이 없는 선택 속성은 생략)
+
+        Returns:
+            새로 만든 딕셔너리 (원본과 공유하지 않음)
+        """
+        data: dict[str, Any] = {"color": self.color}
+        for key in _OPTIONAL_TEXT:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.fields:
+            data["fields"] = [field.to_dict() for field in self.fields]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EmbedDocument:
+        """저장된 딕셔너리에서 생성 (검증하지 않음)
+
+        Args:
+            data: `to_dict()` 또는 이전 형식의 임베드 딕셔너리
+
+        Returns:
+            임베드 문서
+        """
+        color = data.get("color")
+        return cls(
+            title=data.get("title"),
+            description=data.get("description"),
+            color=DEFAULT_EMBED_COLOR if color is None else color,
+            fields=[EmbedField.from_dict(field) for field in data.get("fields") or ()],
+            author=data.get("author"),
+            footer=data.get("footer"),
+            image=data.get("image"),
+            thumbnail=data.get("thumbnail"),
+        )
+
+    def copy(self) -> EmbedDocument:
+        """독립적인 복사본"""
+        return EmbedDocument(
+            self.title,
+            self.description,
+            self.color,
+            [EmbedField(field.name, field.value, field.inline) for field in self.fields],
+            self.author,
+            self.footer,
+            self.image,
+            self.thumbnail,
+        )
+
+    def text_length(self) -> int:
+        """Discord 전체 글자 수 제한에 포함되는 길이
+
+        제목, 설명, 필드 이름과 값, 작성자, 바닥글의 길이 합입니다.
+        """
+        total = sum(_text_length(getattr(self, key)) for key in _TEXT_LIMITS)
+        for field in self.fields:
+            total += _text_length(field.name) + _text_length(field.value)
+        return total
+
+    def validate(self) -> None:
+        """Discord 임베드 제한값 검사
+
+        Raises:
+            EmbedValidationError: 제한값을 넘은 경우
+        """
+        for key in _TEXT_LIMITS:
+            _check_text(key, getattr(self, key))
+
+        for label, value in (("이미지", self.image), ("썸네일", self.thumbnail)):
+            if value is not None and not (isinstance(value, str) and value.startswith(("http://", "https://"))):
+                raise EmbedValidationError(f"{label} URL이 올바르지 않습니다.")
+
+        _check_color(self.color)
+
+        if len(self.fields) > MAX_EMBED_FIELDS:
+            raise EmbedValidationError(f"필드는 최대 {MAX_EMBED_FIELDS}개까지 가능합니다.")
+        for position, field in enumerate(self.fields, 1):
+            _check_field(position, field)
+
+        _check_total(self.text_length())
+
+        if not (self.title or self.description or self.fields):
+            raise EmbedValidationError("제목, 설명, 필드 중 하나는 있어야 합니다.")
+
+
+class EmbedBudget:
+    """편집 중인 임베드의 전체 글자 수 누적 합계
+
+    처음 한 번만 전체를 세고, 이후에는 바뀌는 값의 길이 차이만 반영하므로
+    변경마다 O(1)로 `validate()`와 같은 제한값을 확인합니다. 제한을 넘는
+    변경은 문서에 적용되지 않습니다. 합계가 맞으려면 문서의 모든 변경을
+    이 객체를 통해 적용해야 합니다.
+
+    Args:
+        document: 편집할 임베드 문서
+    """
+
+    __slots__ = ("document", "total")
+
+    def __init__(self, document: EmbedDocument):
+        self.document = document
+        self.total = document.text_length()
+
+    @property
+    def remaining(self) -> int:
+        """더 쓸 수 있는 글자 수"""
+        return MAX_EMBED_TOTAL_LENGTH - self.total
+
+    def set_text(self, key: str, value: str | None) -> None:
+        """문자열 속성 변경 (title, description, author, footer)
+
+        Raises:
+            EmbedValidationError: 제한값을 넘는 경우 (문서는 바뀌지 않음)
+        """
+        _check_text(key, value)
+        total = self.total - _text_length(getattr(self.document, key)) + _text_length(value)
+        _check_total(total)
+        setattr(self.document, key, value)
+        self.total = total
+
+    def set_color(self, color: int) -> None:
+        """색상 변경
+
+        Raises:
+            EmbedValidationError: 범위를 벗어난 경우 (문서는 바뀌지 않음)
+        """
+        _check_color(color)
+        self.document.color = color
+
+    def add_field(self, field: EmbedField) -> None:
+        """필드 추가
+
+        Raises:
+            EmbedValidationError: 제한값을 넘는 경우 (문서는 바뀌지 않음)
+        """
+        fields = self.document.fields
+        if len(fields) >= MAX_EMBED_FIELDS:
+            raise EmbedValidationError(f"필드는 최대 {MAX_EMBED_FIELDS}개까지 가능합니다.")
+        _check_field(len(fields) + 1, field)
+        total = self.total + _text_length(field.name) + _text_length(field.value)
+        _check_total(total)
+        fields.append(field)
+        self.total = total
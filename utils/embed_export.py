@@ -0,0 +1,138 @@
+"""임베드 보관함 NDJSON/zip 내보내기"""
+from __future__ import annotations
+import json
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import IO
+
+from .constants import EXPORT_PART_BYTES, EXPORT_ZIP_HEADROOM
+from .embed_document import EmbedDocument
+
+__all__ = ["EXPORT_FORMATS", "EmbedExporter", "ExportPart"]
+
+EXPORT_FORMATS = ("ndjson", "zip")
+
+# zip 안의 NDJSON 파일 이름
+_ZIP_MEMBER = "embeds.ndjson"
+
+
+@dataclass
+class ExportPart:
+    """완성된 내보내기 파일
+
+    Attributes:
+        filename: 첨부 파일 이름
+        fp: 처음 위치로 되감은 임시 파일 (사용 후 닫아야 함, Windows에서는 `.file`이 실제 파일)
+        items: 담긴 임베드 수
+    """
+
+    filename: str
+    fp: IO[bytes]
+    items: int
+
+
+class EmbedExporter:
+    """임베드를 한 줄씩 기록하고 크기 제한에 맞춰 파일을 나누는 내보내기
+
+    각 줄은 `/import`로 다시 가져올 수 있는 `{"name": ..., "embed": {...}}`
+    형식입니다. 파일은 임시 파일(`TemporaryFile`)에 기록되며, 다음 줄을 더하면
+    `part_bytes`를 넘을 때 현재 파일을 완성하고 새 파일을 시작합니다.
+    `SpooledTemporaryFile`은 Python 3.10에서 `io.IOBase`가 아니어서
+    `discord.File`이 파일 경로로 취급하므로 쓰지 않습니다.
+
+    Args:
+        fmt: "ndjson" 또는 "zip"
+        part_bytes: 파일 하나의 최대 크기
+        basename: 첨부 파일 이름 (확장자 제외)
+    """
+
+    def __init__(self, fmt: str = "ndjson", part_bytes: int = EXPORT_PART_BYTES, basename: str = "seri_embeds"):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        self.fmt = fmt
+        self.part_bytes = part_bytes
+        self.basename = basename
+
+        self.items = 0
+        self.parts = 0
+        self._file: IO[bytes] | None = None
+        self._zip: zipfile.ZipFile | None = None
+        self._member: IO[bytes] | None = None
+        self._part_items = 0
+
+    def _open_part(self) -> None:
+        """새 파일 시작"""
+        self._file = tempfile.TemporaryFile()
+        if self.fmt == "zip":
+            self._zip = zipfile.ZipFile(self._file, "w", compression=zipfile.ZIP_DEFLATED)
+            self._member = self._zip.open(_ZIP_MEMBER, "w")
+        self._part_items = 0
+
+    def _part_size(self) -> int:
+        """현재 파일의 예상 크기 (zip은 압축기에 남은 데이터 여유 포함)"""
+        if self.fmt == "zip":
+            return self._file.tell() + EXPORT_ZIP_HEADROOM
+        return self._file.tell()
+
+    def _close_part(self, final: bool) -> ExportPart:
+        """현재 파일 완성"""
+        if self._member is not None:
+            self._member.close()
+            self._zip.close()
+            self._member = self._zip = None
+
+        self.parts += 1
+        # 파일이 하나뿐이면 번호를 붙이지 않음
+        suffix = "" if final and self.parts == 1 else f"_part{self.parts}"
+        fp, self._file = self._file, None
+        fp.seek(0)
+        return ExportPart(f"{self.basename}{suffix}.{self.fmt}", fp, self._part_items)
+
+    def add(self, embed_name: str, embed_data: EmbedDocument) -> ExportPart | None:
+        """임베드 한 줄 기록
+
+        Args:
+            embed_name: 임베드 이름
+            embed_data: 임베드 문서
+
+        Returns:
+            이 줄을 더하면 크기 제한을 넘어 완성된 이전 파일 (없으면 None)
+        """
+        line = json.dumps(
+            {"name": embed_name, "embed": embed_data.to_dict()},
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8") + b"\n"
+
+        finished = None
+        if self._file is None:
+            self._open_part()
+        elif self._part_items and self._part_size() + len(line) > self.part_bytes:
+            finished = self._close_part(final=False)
+            self._open_part()
+
+        (self._member or self._file).write(line)
+        self._part_items += 1
+        self.items += 1
+        return finished
+
+    def finish(self) -> ExportPart | None:
+        """마지막 파일 완성
+
+        Returns:
+            마지막 파일 (기록한 임베드가 없으면 None)
+        """
+        if self._file is None:
+            return None
+        return self._close_part(final=True)
+
+    def close(self) -> None:
+        """완성하지 않은 파일 정리"""
+        if self._member is not None:
+            self._member.close()
+            self._zip.close()
+            self._member = self._zip = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
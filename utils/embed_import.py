@@ -0,0 +1,210 @@
+"""임베드 JSON/NDJSON 가져오기"""
+from __future__ import annotations
+import codecs
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator
+
+from .constants import IMPORT_MAX_ITEM_BYTES, MAX_EMBED_NAME_LENGTH
+from .embed_document import EmbedDocument, EmbedField, EmbedValidationError
+
+__all__ = ["ImportItemError", "ImportResult", "StreamingItemParser", "iter_import_items", "parse_import_item"]
+
+_WHITESPACE = " \t\r\n"
+
+
+class ImportItemError(ValueError):
+    """가져올 항목을 읽을 수 없음"""
+
+
+@dataclass
+class ImportResult:
+    """항목별 가져오기 결과
+
+    Attributes:
+        index: 파일 안에서의 순서 (1부터)
+        name: 임베드 이름 (읽지 못했으면 None)
+        status: "saved", "skipped", "failed"
+        message: 사유
+    """
+
+    index: int
+    name: str | None
+    status: str
+    message: str = ""
+
+
+class StreamingItemParser:
+    """청크 단위로 JSON 항목을 읽는 파서
+
+    최상위가 배열이면 배열의 각 요소를, 아니면 공백으로 구분된 JSON 값
+    (NDJSON, 또는 여러 줄로 된 단일 객체)을 항목으로 읽습니다. 아직 읽지
+    않은 한 항목 분량만 버퍼에 남기므로 파일 전체를 메모리에 올리지 않습니다.
+
+    Args:
+        max_item_bytes: 항목 하나의 최대 크기 (넘는 항목은 오류로 처리)
+    """
+
+    def __init__(self, max_item_bytes: int = IMPORT_MAX_ITEM_BYTES):
+        self.max_item_bytes = max_item_bytes
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._array: bool | None = None
+        self._done = False
+        # 너무 긴 NDJSON 줄의 나머지를 버리는 중
+        self._skip_line = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """청크 추가
+
+        Returns:
+            새로 읽은 항목 목록 (읽을 수 없는 항목은 `ImportItemError`)
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """입력 종료
+
+        Returns:
+            남은 항목 목록 (읽을 수 없는 항목은 `ImportItemError`)
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._array and not self._done:
+            items.append(ImportItemError("배열이 닫히지 않았습니다."))
+        return items
+
+    def _drain(self, final: bool) -> list[Any]:
+        """버퍼에서 완성된 항목 꺼내기"""
+        items: list[Any] = []
+        pos = 0
+        buffer = self._buffer
+
+        while not self._done:
+            if self._skip_line:
+                newline = buffer.find("\n", pos)
+                if newline < 0:
+                    pos = len(buffer)
+                    break
+                pos = newline + 1
+                self._skip_line = False
+
+            # 공백 (배열이면 쉼표도) 건너뛰기
+            while pos < len(buffer) and (buffer[pos] in _WHITESPACE or (self._array and buffer[pos] == ",")):
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if self._array is None:
+                self._array = buffer[pos] == "["
+                if self._array:
+                    pos += 1
+                    continue
+            if self._array and buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if not final and len(buffer) - pos <= self.max_item_bytes:
+                    # 항목이 아직 다 도착하지 않았을 수 있음
+                    break
+                if len(buffer) - pos > self.max_item_bytes:
+                    items.append(ImportItemError(f"항목이 {self.max_item_bytes // 1024}KB를 넘습니다."))
+                else:
+                    items.append(ImportItemError(f"JSON 형식 오류: {e.msg}"))
+                if self._array:
+                    # 배열 안에서는 다음 항목의 시작을 알 수 없음
+                    self._done = True
+                    pos = len(buffer)
+                    break
+                # NDJSON은 다음 줄부터 계속
+                self._skip_line = True
+                continue
+
+            # 숫자는 다음 청크에서 이어질 수 있으므로 끝에 닿으면 기다림
+            if end >= len(buffer) and not final and not isinstance(value, (dict, list, str)):
+                break
+            if end - pos > self.max_item_bytes:
+                items.append(ImportItemError(f"항목이 {self.max_item_bytes // 1024}KB를 넘습니다."))
+            else:
+                items.append(value)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+async def iter_import_items(
+    chunks: AsyncIterable[bytes],
+    max_item_bytes: int = IMPORT_MAX_ITEM_BYTES
+) -> AsyncIterator[Any]:
+    """바이트 청크에서 항목을 차례로 읽기
+
+    Args:
+        chunks: 파일 내용 청크
+        max_item_bytes: 항목 하나의 최대 크기
+
+    Yields:
+        JSON 값 (읽을 수 없는 항목은 `ImportItemError`)
+    """
+    parser = StreamingItemParser(max_item_bytes)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+def parse_import_item(raw: Any, default_name: str | None = None) -> tuple[str, EmbedDocument]:
+    """가져온 항목을 이름과 임베드 문서로 변환 및 검증
+
+    `{"name": ..., "embed": {...}}` 형식과 JSON 내보내기로 만든 임베드
+    딕셔너리를 모두 받습니다. 이름이 없으면 `default_name`을 사용합니다.
+
+    Args:
+        raw: JSON 값
+        default_name: 항목에 이름이 없을 때 사용할 이름
+
+    Returns:
+        (임베드 이름, 임베드 문서)
+
+    Raises:
+        EmbedValidationError: 형식이 잘못되었거나 제한값을 넘은 경우
+    """
+    if isinstance(raw, ImportItemError):
+        raise EmbedValidationError(str(raw))
+    if not isinstance(raw, dict):
+        raise EmbedValidationError("항목은 JSON 객체여야 합니다.")
+
+    if isinstance(raw.get("embed"), dict):
+        name = raw.get("name")
+        data = raw["embed"]
+    else:
+        name = raw.get("name") if isinstance(raw.get("name"), str) else None
+        data = raw
+
+    if name is None:
+        name = default_name
+    if not isinstance(name, str) or not name.strip():
+        raise EmbedValidationError("임베드 이름이 없습니다.")
+    name = name.strip()
+    if len(name) > MAX_EMBED_NAME_LENGTH:
+        raise EmbedValidationError(f"임베드 이름은 최대 {MAX_EMBED_NAME_LENGTH}자까지 가능합니다.")
+
+    fields = data.get("fields")
+    if fields is not None and not (isinstance(fields, list) and all(isinstance(f, dict) for f in fields)):
+        raise EmbedValidationError("fields는 객체 목록이어야 합니다.")
+
+    embed_data = EmbedDocument.from_dict(data)
+    # from_dict는 빈 값을 보정하므로 원래 값으로 검증
+    embed_data.fields = [
+        EmbedField(field.get("name"), field.get("value"), bool(field.get("inline", False)))
+        for field in fields or ()
+    ]
+    embed_data.validate()
+    return name, embed_data
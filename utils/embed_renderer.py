@@ -0,0 +1,52 @@
+"""임베드 문서 -> discord.Embed 변환"""
+from __future__ import annotations
+import discord
+
+from .embed_document import EmbedDocument
+
+__all__ = ["EmbedRenderer"]
+
+
+class EmbedRenderer:
+    """임베드 렌더러
+
+    캐시하지 않습니다. `discord.Embed` 생성은 수 µs로, 캐시 키로 쓸 내용
+    해시(전체 문서 직렬화 후 해시)를 계산하는 것보다 빠르기 때문입니다.
+    """
+
+    def render(self, embed_data: EmbedDocument) -> discord.Embed:
+        """임베드 문서를 discord.Embed로 변환
+
+        Args:
+            embed_data: 임베드 문서
+
+        Returns:
+            새로 생성한 임베드
+        """
+        return self.build(embed_data)
+
+    @staticmethod
+    def build(embed_data: EmbedDocument) -> discord.Embed:
+        """임베드 객체 생성"""
+        embed = discord.Embed(
+            title=embed_data.title,
+            description=embed_data.description,
+            color=embed_data.color
+        )
+        
+        for field in embed_data.fields:
+            embed.add_field(name=field.name, value=field.value, inline=field.inline)
+        
+        if embed_data.author:
+            embed.set_author(name=embed_data.author)
+        
+        if embed_data.footer:
+            embed.set_footer(text=embed_data.footer)
+        
+        if embed_data.image:
+            embed.set_image(url=embed_data.image)
+        
+        if embed_data.thumbnail:
+            embed.set_thumbnail(url=embed_data.thumbnail)
+        
+        return embed
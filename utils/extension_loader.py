@@ -1,69 +1,310 @@
-"""확장 로더"""
+"""확장 로더
+
+등록하기 전에 각 확장이 가져오는 모듈을 스레드 풀에서 미리 가져오고 (그동안
+이벤트 루프는 다른 일을 처리), 확장마다 가져오기/등록 시간을 기록합니다.
+
+지연 확장은 명령어 정의를 `DATA_DIR/extension_manifest.json`에 저장해 두고
+다음 시작부터는 가져오지 않으며, 그 명령어가 처음 사용될 때 불러옵니다.
+확장 파일이나 직접 가져오는 프로젝트 모듈이 바뀌었으면 시작할 때 바로 불러옵니다.
+"""
 from __future__ import annotations
+import ast
+import asyncio
+import importlib.util
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, List
 import discord
 
+from .command_sync import command_payload
+from .constants import DATA_DIR, EXTENSION_PRELOAD_WORKERS
+
 logger = logging.getLogger(__name__)
 
-__all__ = ["ExtensionLoader"]
+__all__ = ["ExtensionLoader", "ExtensionTiming"]
+
+# import 문 목록 (모듈 이름, from 절로 가져오는 이름)
+ImportList = List[tuple[str, tuple[str, ...]]]
+
+
+@dataclass
+class ExtensionTiming:
+    """확장 하나의 로드 시간 (초)
+
+    Attributes:
+        name: 확장 이름
+        preload: 의존 모듈을 미리 가져온 시간 (여러 확장이 같이 쓰는 모듈은 먼저 가져온 쪽에 포함)
+        load: 확장 모듈 실행과 setup 시간
+        lazy: 지연 확장 여부
+        on_demand: 명령어를 처음 사용할 때 불러왔는지 여부
+    """
+    name: str
+    preload: float = 0.0
+    load: float = 0.0
+    lazy: bool = False
+    on_demand: bool = False
+
+
+def _parse_imports(source: Path, package: str) -> ImportList:
+    """모듈 최상위의 import 문 (스레드)
+
+    Args:
+        source: 모듈 소스 파일
+        package: 상대 import 기준 패키지
+
+    Returns:
+        가져오는 모듈 목록 (읽을 수 없으면 빈 목록, 오류는 등록할 때 기록됨)
+    """
+    try:
+        tree = ast.parse(source.read_bytes(), filename=str(source))
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    imports: ImportList = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, ()) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module != "__future__":
+            name = node.module or ""
+            if node.level:
+                try:
+                    name = importlib.util.resolve_name("." * node.level + name, package)
+                except ImportError:
+                    continue
+            imports.append((name, tuple(alias.name for alias in node.names if alias.name != "*")))
+    return imports
 
 
 class ExtensionLoader:
-    """Discord Bot 확장(명령어) 로더"""
+    """Discord Bot 확장(명령어) 로더
 
-    def __init__(self, bot: discord.Bot):
+    Args:
+        bot: 확장을 등록할 봇
+        lazy: 처음 사용할 때 불러올 확장 이름
+        workers: 의존 모듈을 미리 가져올 스레드 수
+        manifest_path: 지연 확장의 명령어 정의 파일
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        lazy: Iterable[str] = (),
+        workers: int = EXTENSION_PRELOAD_WORKERS,
+        manifest_path: Path = DATA_DIR / "extension_manifest.json"
+    ):
         self.bot = bot
+        self.lazy = frozenset(lazy)
+        self.workers = workers
+        self.manifest_path = manifest_path
         self.loaded_extensions: List[str] = []
         self.failed_extensions: List[tuple[str, str]] = []
+        self.timings: dict[str, ExtensionTiming] = {}
+        self.preload_time = 0.0
+        # 아직 불러오지 않은 지연 확장과 저장된 명령어 정의
+        self.deferred: dict[str, list[dict[str, Any]]] = {}
+        self._deferred_commands: dict[str, str] = {}
+        # 지연 확장의 소스 파일 상태와 불러온 뒤의 명령어 정의 (매니페스트 기록용)
+        self._stamps: dict[str, list[list[Any]]] = {}
+        self._payloads: dict[str, list[dict[str, Any]]] = {}
+        self._manifest_dirty = False
+
+    def _find_extensions(self, extensions_path: Path) -> list[tuple[str, Path]]:
+        """확장 이름과 소스 파일 (파일 확장, 패키지 확장 순)"""
+        extensions = [
+            (f"{extensions_path.name}.{file_path.stem}", file_path)
+            for file_path in sorted(extensions_path.glob("*.py"))
+            if not file_path.name.startswith("_")
+        ]
+        for subdir in sorted(extensions_path.iterdir()):
+            if subdir.is_dir() and not subdir.name.startswith("_") and (subdir / "__init__.py").exists():
+                extensions.append((f"{extensions_path.name}.{subdir.name}", subdir / "__init__.py"))
+        return extensions
+
+    @staticmethod
+    def _package_of(extension_name: str, source: Path) -> str:
+        """상대 import 기준 패키지"""
+        return extension_name if source.name == "__init__.py" else extension_name.rpartition(".")[0]
+
+    def _stamp(self, extension_name: str, source: Path, root: Path) -> list[list[Any]]:
+        """확장 파일과 직접 가져오는 프로젝트 모듈의 수정 시각, 크기 (스레드)"""
+        files = {source}
+        for name, fromlist in _parse_imports(source, self._package_of(extension_name, source)):
+            base = root.joinpath(*name.split("."))
+            candidates = [base.with_suffix(".py"), base / "__init__.py"]
+            candidates.extend(base / f"{item}.py" for item in fromlist)
+            files.update(path for path in candidates if path.is_file())
+
+        stamp = []
+        for path in sorted(files):
+            stat = path.stat()
+            stamp.append([path.relative_to(root).as_posix(), stat.st_mtime_ns, stat.st_size])
+        return stamp
+
+    def _read_manifest(self, sources: dict[str, Path], root: Path) -> dict[str, list[dict[str, Any]]]:
+        """소스가 바뀌지 않은 지연 확장의 저장된 명령어 정의 (스레드)"""
+        for extension_name, source in sources.items():
+            try:
+                self._stamps[extension_name] = self._stamp(extension_name, source, root)
+            except OSError as e:
+                logger.warning(f"확장 파일 확인 실패: {extension_name} - {e}")
+
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"확장 매니페스트 읽기 실패: {e}")
+            return {}
+
+        valid = {}
+        for extension_name, stamp in self._stamps.items():
+            entry = manifest.get(extension_name)
+            if isinstance(entry, dict) and entry.get("sources") == stamp and isinstance(entry.get("commands"), list):
+                valid[extension_name] = entry["commands"]
+        return valid
+
+    def _write_manifest(self, manifest: dict[str, Any]) -> None:
+        """매니페스트 기록 (스레드)"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        tmp_path.replace(self.manifest_path)
+
+    @staticmethod
+    def _preload(extension_name: str, source: Path, package: str) -> float:
+        """확장이 가져오는 모듈 미리 가져오기 (스레드)
+
+        확장 모듈 자체는 `load_extension`이 다시 실행하므로 의존 모듈만 가져옵니다.
+
+        Returns:
+            걸린 시간 (초)
+        """
+        started = time.perf_counter()
+        for name, fromlist in _parse_imports(source, package):
+            try:
+                __import__(name, fromlist=fromlist)
+            except Exception as e:
+                # 등록할 때 다시 가져오므로 실패는 그때 기록됨
+                logger.debug(f"미리 가져오기 실패: {extension_name} - {name}: {e}")
+        return time.perf_counter() - started
+
+    async def prepare(self, extensions_dir: str | Path) -> None:
+        """등록 전 준비 (지연 확장 확인, 의존 모듈 미리 가져오기)
+
+        Args:
+            extensions_dir: 확장 디렉토리 경로
+        """
+        extensions_path = Path(extensions_dir)
+        if not extensions_path.exists():
+            return
+
+        extensions = await asyncio.to_thread(self._find_extensions, extensions_path)
+        lazy_sources = {name: source for name, source in extensions if name in self.lazy}
+        if lazy_sources:
+            manifest = await asyncio.to_thread(
+                self._read_manifest, lazy_sources, extensions_path.parent
+            )
+            for extension_name, payloads in manifest.items():
+                self.deferred[extension_name] = payloads
+                for payload in payloads:
+                    self._deferred_commands[payload["name"]] = extension_name
+
+        eager = [(name, source) for name, source in extensions if name not in self.deferred]
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="seri-preload") as executor:
+            durations = await asyncio.gather(*(
+                loop.run_in_executor(executor, self._preload, name, source, self._package_of(name, source))
+                for name, source in eager
+            ))
+        self.preload_time = time.perf_counter() - started
+
+        for (extension_name, _), duration in zip(eager, durations):
+            self.timings[extension_name] = ExtensionTiming(
+                extension_name, preload=duration, lazy=extension_name in self.lazy
+            )
+
+    def _load(self, extension_name: str, on_demand: bool = False) -> bool:
+        """확장 하나 등록
+
+        Returns:
+            성공 여부
+        """
+        before = {id(command) for command in self.bot.pending_application_commands}
+        started = time.perf_counter()
+        try:
+            self.bot.load_extension(extension_name)
+        except Exception as e:
+            self.failed_extensions.append((extension_name, str(e)))
+            logger.error(f"확장 로드 실패: {extension_name} - {e}")
+            return False
+
+        timing = self.timings.setdefault(
+            extension_name, ExtensionTiming(extension_name, lazy=extension_name in self.lazy)
+        )
+        timing.load = time.perf_counter() - started
+        timing.on_demand = on_demand
+        self.loaded_extensions.append(extension_name)
+
+        if extension_name in self.lazy:
+            self._payloads[extension_name] = [
+                command_payload(command)
+                for command in self.bot.pending_application_commands
+                if id(command) not in before
+            ]
+        return True
 
     def load_extensions(self, extensions_dir: str | Path) -> int:
-        """디렉토리에서 모든 확장 로드
-        
+        """디렉토리에서 모든 확장 로드 (지연 확장 제외)
+
         Args:
             extensions_dir: 확장 디렉토리 경로
-            
+
         Returns:
             로드된 확장 개수
         """
         extensions_path = Path(extensions_dir)
-        
+
         if not extensions_path.exists():
             logger.warning(f"확장 디렉토리 없음: {extensions_path}")
             return 0
 
         count = 0
-        
+
         # 폴더의 모든 .py 파일 스캔
         for file_path in sorted(extensions_path.glob("*.py")):
             if file_path.name.startswith("_"):
                 continue
-                
+
             module_name = file_path.stem
             extension_name = f"{extensions_path.name}.{module_name}"
-            
-            try:
-                self.bot.load_extension(extension_name)
-                self.loaded_extensions.append(extension_name)
+            if extension_name in self.deferred:
+                continue
+
+            if self._load(extension_name):
                 count += 1
-            except Exception as e:
-                self.failed_extensions.append((extension_name, str(e)))
-                logger.error(f"확장 로드 실패: {extension_name} - {e}")
 
         return count
 
     def load_extension_groups(self, extensions_dir: str | Path) -> int:
         """확장 그룹 로드 (서브폴더)
-        
+
         Args:
             extensions_dir: 확장 디렉토리 경로
-            
+
         Returns:
             로드된 확장 개수
         """
         extensions_path = Path(extensions_dir)
         count = self.load_extensions(extensions_path)
+        if not extensions_path.exists():
+            return count
 
         # 서브폴더 처리
         for subdir in sorted(extensions_path.iterdir()):
@@ -72,26 +313,117 @@ class ExtensionLoader:
                 if init_file.exists():
                     parent_name = extensions_path.name
                     extension_name = f"{parent_name}.{subdir.name}"
-                    
-                    try:
-                        self.bot.load_extension(extension_name)
-                        self.loaded_extensions.append(extension_name)
+                    if extension_name in self.deferred:
+                        continue
+
+                    if self._load(extension_name):
                         count += 1
-                    except Exception as e:
-                        self.failed_extensions.append((extension_name, str(e)))
-                        logger.error(f"확장 로드 실패: {extension_name} - {e}")
+
+        # 저장된 정의가 없거나 바뀐 지연 확장은 다음 시작부터 지연
+        if any(name not in self.deferred for name in self._payloads):
+            self._manifest_dirty = True
 
         return count
 
+    def find_deferred(self, command_name: str) -> str | None:
+        """아직 불러오지 않은 지연 확장의 명령어인지 확인
+
+        Args:
+            command_name: 최상위 명령어 이름
+
+        Returns:
+            명령어가 속한 지연 확장 이름 (없으면 None)
+        """
+        return self._deferred_commands.get(command_name)
+
+    def deferred_payloads(self) -> list[dict[str, Any]]:
+        """아직 불러오지 않은 지연 확장의 명령어 정의
+
+        Returns:
+            `command_payload` 형식의 정의 목록
+        """
+        return [payload for payloads in self.deferred.values() for payload in payloads]
+
+    def load_deferred(self, extension_name: str | None = None) -> int:
+        """지연 확장 불러오기
+
+        Args:
+            extension_name: 불러올 확장 (기본값: 대기 중인 지연 확장 모두)
+
+        Returns:
+            불러온 확장 개수
+        """
+        names = [extension_name] if extension_name else list(self.deferred)
+        count = 0
+        for name in names:
+            payloads = self.deferred.pop(name, None)
+            if payloads is None:
+                continue
+            for payload in payloads:
+                self._deferred_commands.pop(payload["name"], None)
+
+            if not self._load(name, on_demand=True):
+                continue
+            count += 1
+            logger.info(f"지연 확장 로드: {name} ({self.timings[name].load * 1000:.1f}ms)")
+
+            def key(payload: dict[str, Any]) -> str:
+                return json.dumps(payload, sort_keys=True)
+
+            if sorted(map(key, self._payloads[name])) != sorted(map(key, payloads)):
+                logger.warning(f"지연 확장의 명령어 정의가 저장된 정의와 다릅니다: {name} (/sync로 다시 동기화하세요)")
+                self._manifest_dirty = True
+                try:
+                    asyncio.get_running_loop().create_task(self.save_manifest())
+                except RuntimeError:
+                    pass
+        return count
+
+    async def save_manifest(self) -> None:
+        """지연 확장의 명령어 정의 저장 (바뀐 경우에만)"""
+        if not self._manifest_dirty:
+            return
+        self._manifest_dirty = False
+
+        manifest: dict[str, Any] = {}
+        for extension_name, stamp in self._stamps.items():
+            payloads = self._payloads.get(extension_name, self.deferred.get(extension_name))
+            if payloads is not None:
+                manifest[extension_name] = {"sources": stamp, "commands": payloads}
+
+        try:
+            await asyncio.to_thread(self._write_manifest, manifest)
+        except OSError as e:
+            logger.error(f"확장 매니페스트 저장 실패: {e}")
+
     def get_summary(self) -> str:
-        """로딩 요약 정보
-        
+        """로딩 요약 정보 (확장별 시간은 오래 걸린 순)
+
         Returns:
             요약 정보 문자열
         """
         summary = f"로드된 확장: {len(self.loaded_extensions)}개"
-        
+
+        if self.deferred:
+            summary += f", 지연: {len(self.deferred)}개 ({', '.join(sorted(self.deferred))})"
+
         if self.failed_extensions:
             summary += f", 실패: {len(self.failed_extensions)}개"
-        
+
+        timings = sorted(self.timings.values(), key=lambda timing: timing.preload + timing.load, reverse=True)
+        if timings:
+            summary += (
+                f" (미리 가져오기 {self.preload_time * 1000:.0f}ms, "
+                f"등록 {sum(timing.load for timing in timings) * 1000:.0f}ms)"
+            )
+        for timing in timings:
+            summary += (
+                f"\n  {timing.name}: 가져오기 {timing.preload * 1000:.1f}ms, "
+                f"등록 {timing.load * 1000:.1f}ms"
+            )
+            if timing.on_demand:
+                summary += " (처음 사용 시)"
+            elif timing.lazy:
+                summary += " (지연 확장)"
+
         return summary
@@ -1,31 +1,140 @@
-"""로깅 설정"""
+"""로깅 설정
+
+로그 호출은 `QueueHandler`가 기록을 큐에 넣기만 하고, 콘솔/파일 출력은
+`QueueListener` 스레드가 처리하므로 이벤트 루프에서 I/O가 일어나지 않습니다.
+"""
 from __future__ import annotations
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from .constants import DATA_DIR, LOG_FILE_BACKUPS, LOG_FILE_MAX_BYTES
+
+__all__ = ["JsonFormatter", "configure_logging", "log_context"]
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 현재 작업(인터랙션)의 로그 문맥
+_context: ContextVar[dict[str, Any] | None] = ContextVar("seri_log_context", default=None)
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: logging.Handler | None = None
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """블록 안에서 남기는 로그에 문맥 추가 (JSON 형식에서 출력)
+
+    Args:
+        **fields: 문맥 값 (예: interaction, user, guild)
+    """
+    token = _context.set({**(_context.get() or {}), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 기록 하나인 JSON 형식"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        context = getattr(record, "context", None)
+        if context:
+            data.update(context)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
 
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """로그를 남긴 작업의 문맥을 붙여 큐에 넣는 핸들러"""
 
-def configure_logging(level: int = logging.INFO, log_file: bool = False) -> None:
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 리스너 스레드의 포매터가 다시 쓸 수 있도록 메시지와 예외만 문자열로 만듦
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.context = _context.get()
+        return record
+
+
+def _stop_listener() -> None:
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+def configure_logging(level: int = logging.INFO, log_file: bool = False, json_format: bool = False) -> None:
     """로깅 설정
-    
+
+    다시 호출하면 이전 설정을 대체합니다.
+
     Args:
-        level: 로깅 레벨 (기본값: INFO)
-        log_file: 파일에 저장 여부 (기본값: False)
+        level: 로깅 레벨 (기본값: INFO, 루트 로거도 같은 레벨로 설정해 걸러질 기록은 만들지 않음)
+        log_file: `data/logs/seri.log`에 크기 기준으로 순환하며 저장 여부 (기본값: False)
+        json_format: 한 줄에 하나인 JSON 형식 출력 여부 (기본값: False)
     """
-    # 기본 포맷
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+    _stop_listener()
+
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_formatter = logging.Formatter(log_format)
-    console_handler.setFormatter(console_formatter)
-    
+    console_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [console_handler]
+
+    # 파일 핸들러
+    if log_file:
+        log_dir = DATA_DIR / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / "seri.log",
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUPS,
+            encoding="utf-8"
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    global _listener, _queue_handler
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _ContextQueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     # 루트 로거 설정
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(console_handler)
-    
+    root_logger.setLevel(level)
+    root_logger.addHandler(_queue_handler)
+
     # 비동기 관련 로그 조용히
     logging.getLogger("discord").setLevel(logging.WARNING)
     logging.getLogger("discord.http").setLevel(logging.WARNING)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+
+atexit.register(_stop_listener)
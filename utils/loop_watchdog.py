@@ -0,0 +1,147 @@
+"""이벤트 루프 지연 감시
+
+루프 안의 작업이 주기적으로 깨어나며 예정보다 늦은 시간(지연)을 기록하고,
+별도 스레드가 마지막 깨어난 시각을 지켜보다가 루프가 임계값보다 오래
+멈춰 있으면 그 순간 루프 스레드의 호출 스택을 로그에 남깁니다. 스택은
+루프가 막혀 있는 동안 캡처하므로 막고 있는 함수가 그대로 드러납니다.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable
+
+from .constants import (
+    LOOP_WATCHDOG_INTERVAL,
+    LOOP_WATCHDOG_STACK_DEPTH,
+    LOOP_WATCHDOG_THRESHOLD,
+    LOOP_WATCHDOG_WINDOW,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["LoopWatchdog"]
+
+
+class LoopWatchdog:
+    """이벤트 루프 지연 측정 및 막힘 스택 캡처
+
+    Args:
+        threshold: 막힘으로 보는 최소 지연 (초)
+        interval: 측정 간격 (초)
+        on_lag: 측정할 때마다 지연(초)을 받는 함수 (메트릭 기록용)
+    """
+
+    def __init__(
+        self,
+        threshold: float = LOOP_WATCHDOG_THRESHOLD,
+        interval: float = LOOP_WATCHDOG_INTERVAL,
+        on_lag: Callable[[float], None] | None = None
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.on_lag = on_lag
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.blocked = 0.0
+        self.captures = 0
+        self._recent: deque[float] = deque(maxlen=LOOP_WATCHDOG_WINDOW)
+
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread: int | None = None
+        # 감시 스레드가 읽는 값 (루프 작업만 갱신)
+        self._last_beat = 0.0
+        self._beats = 0
+
+    def start(self) -> None:
+        """감시 시작 (루프 스레드에서 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._beat_loop())
+        self._thread = threading.Thread(target=self._watch, name="seri-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def close(self) -> None:
+        """감시 종료"""
+        self._stop.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join, 1.0)
+            self._thread = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """지연 통계
+
+        Returns:
+            마지막/최근 p50/p99/최대 지연 (ms), 막힘 횟수와 합계 (초), 스택 캡처 수
+        """
+        recent = sorted(self._recent)
+
+        def percentile(q: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, round(q * (len(recent) - 1)))] * 1000
+
+        return {
+            "lag_ms": self.last_lag * 1000,
+            "p50_lag_ms": percentile(0.50),
+            "p99_lag_ms": percentile(0.99),
+            "max_lag_ms": self.max_lag * 1000,
+            "stalls": self.stalls,
+            "blocked_seconds": self.blocked,
+            "captures": self.captures,
+        }
+
+    async def _beat_loop(self) -> None:
+        """주기적으로 깨어나며 지연 기록 (루프 작업)"""
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            self._last_beat = now
+            self._beats += 1
+
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self._recent.append(lag)
+            if lag >= self.threshold:
+                self.stalls += 1
+                self.blocked += lag
+                logger.debug(f"이벤트 루프 막힘 해소: {lag * 1000:.0f}ms")
+            if self.on_lag is not None:
+                self.on_lag(lag)
+
+    def _watch(self) -> None:
+        """루프가 멈춰 있으면 스택 캡처 (감시 스레드)"""
+        captured_beat = -1
+        while not self._stop.wait(self.interval):
+            stalled = time.perf_counter() - self._last_beat - self.interval
+            # 막힘 한 번에 스택은 한 번만 남김
+            if stalled < self.threshold or captured_beat == self._beats:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            captured_beat = self._beats
+            stack = "".join(traceback.format_stack(frame, limit=LOOP_WATCHDOG_STACK_DEPTH))
+            del frame
+            self.captures += 1
+            logger.warning(f"이벤트 루프가 {stalled * 1000:.0f}ms째 막혀 있습니다. 실행 중인 코드:\n{stack}")
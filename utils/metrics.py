@@ -0,0 +1,289 @@
+"""Prometheus 형식 메트릭 수집 및 HTTP 엔드포인트
+
+`BotMetrics`는 명령어/컴포넌트/저장소 지연 시간 히스토그램과 오류 수를
+모으고, `MetricsServer`는 이를 aiohttp로 노출합니다.
+
+- `/metrics`: Prometheus 텍스트 형식 메트릭
+- `/health`: 프로세스 생존 여부 (항상 200)
+- `/ready`: 초기화가 끝나고 종료 중이 아니면 200, 아니면 503
+"""
+from __future__ import annotations
+import logging
+import math
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Iterator
+
+import discord
+from aiohttp import web
+
+from .constants import METRICS_LATENCY_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BotMetrics", "Histogram", "MetricsServer", "instrument_ui"]
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 핸들러 종류, 이름, 인터랙션을 받아 실행을 감싸는 컨텍스트 관리자를 돌려주는 함수
+HandlerObserver = Callable[[str, str, discord.Interaction], ContextManager[None]]
+
+# instrument_ui가 호출할 관찰자 (None이면 아직 감싸지 않음)
+_ui_observer: HandlerObserver | None = None
+
+
+def _escape(value: str) -> str:
+    """레이블 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: dict[str, str]) -> str:
+    """레이블 문자열 (`{a="1",b="2"}`, 없으면 빈 문자열)"""
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items()) + "}"
+
+
+def _number(value: float) -> str:
+    """Prometheus 숫자 표기"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """레이블 하나로 나뉘는 누적 히스토그램
+
+    Args:
+        name: 메트릭 이름
+        help: 설명
+        label: 레이블 이름 (None이면 레이블 없음)
+        buckets: 버킷 상한 (초, 오름차순)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label: str | None = None,
+        buckets: tuple[float, ...] = METRICS_LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = buckets
+        # 레이블 값 -> [버킷별 개수..., 초과 개수], 합계
+        self._counts: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+
+    def observe(self, value: float, label_value: str = "") -> None:
+        """값 하나 기록"""
+        counts = self._counts.get(label_value)
+        if counts is None:
+            counts = self._counts[label_value] = [0] * (len(self.buckets) + 1)
+            self._sums[label_value] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[label_value] += value
+
+    @contextmanager
+    def time(self, label_value: str = "") -> Iterator[None]:
+        """블록 실행 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, label_value)
+
+    def render(self, lines: list[str]) -> None:
+        """Prometheus 텍스트 형식으로 추가"""
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for label_value in sorted(self._counts):
+            counts = self._counts[label_value]
+            base = {self.label: label_value} if self.label else {}
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels({**base, 'le': _number(bound)})} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(base)} {_number(self._sums[label_value])}")
+            lines.append(f"{self.name}_count{_labels(base)} {cumulative}")
+
+
+class BotMetrics:
+    """봇 메트릭 모음
+
+    지연 시간은 항상 기록하고 (버킷 하나를 늘리는 비용), 초안 수나
+    게이트웨이 지연 같은 값은 수집 시점에 봇에서 읽습니다.
+    """
+
+    def __init__(self) -> None:
+        self.commands = Histogram(
+            "seri_command_duration_seconds", "슬래시 명령어 처리 시간", "command"
+        )
+        self.components = Histogram(
+            "seri_component_duration_seconds", "버튼/선택 메뉴/모달 콜백 처리 시간", "component"
+        )
+        self.storage = Histogram(
+            "seri_storage_duration_seconds", "저장소 로드/저장/압축 시간", "operation"
+        )
+        self.loop_lag = Histogram(
+            "seri_event_loop_lag_seconds", "이벤트 루프 지연 (예정보다 늦게 깨어난 시간)"
+        )
+        # (명령어, 오류 종류) -> 횟수
+        self.errors: dict[tuple[str, str], int] = {}
+        self.last_loop_lag = 0.0
+
+    def record_loop_lag(self, lag: float) -> None:
+        """이벤트 루프 지연 기록"""
+        self.last_loop_lag = lag
+        self.loop_lag.observe(lag)
+
+    def record_error(self, command: str, error: BaseException) -> None:
+        """명령어 오류 기록"""
+        # 명령어 안에서 난 예외는 ApplicationCommandInvokeError로 감싸져 있음
+        original = getattr(error, "original", error)
+        key = (command, type(original).__name__)
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def render(self, bot: discord.Bot) -> str:
+        """Prometheus 텍스트 형식 메트릭"""
+        lines: list[str] = []
+
+        def gauge(name: str, help: str, value: float, kind: str = "gauge") -> None:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_number(value)}")
+
+        gauge("seri_ready", "초기화 완료 여부", int(getattr(bot, "_initialized", False) and not bot.is_closed()))
+        if math.isfinite(bot.latency):
+            gauge("seri_gateway_latency_seconds", "게이트웨이 하트비트 지연", bot.latency)
+        gauge("seri_event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연", self.last_loop_lag)
+        get_loop_stats = getattr(bot, "get_loop_stats", None)
+        if get_loop_stats is not None:
+            loop_stats = get_loop_stats()
+            gauge("seri_event_loop_stalls_total", "임계값을 넘은 이벤트 루프 막힘 수", loop_stats["stalls"], "counter")
+            gauge(
+                "seri_event_loop_blocked_seconds_total", "임계값을 넘은 막힘 시간 합계",
+                loop_stats["blocked_seconds"], "counter"
+            )
+
+        self.commands.render(lines)
+        self.components.render(lines)
+        self.storage.render(lines)
+        self.loop_lag.render(lines)
+
+        lines.append("# HELP seri_interaction_errors_total 명령어 오류 수")
+        lines.append("# TYPE seri_interaction_errors_total counter")
+        for (command, error), count in sorted(self.errors.items()):
+            lines.append(f"seri_interaction_errors_total{_labels({'command': command, 'error': error})} {count}")
+
+        draft_store = getattr(bot, "draft_store", None)
+        if draft_store is not None:
+            stats = draft_store.get_stats()
+            gauge("seri_drafts", "활성 초안 수", stats["drafts"])
+            gauge("seri_draft_bytes", "초안 전체 크기 (직렬화 기준)", stats["draft_bytes"])
+            gauge("seri_drafts_expired_total", "만료된 초안 수", stats["expired"], "counter")
+            gauge("seri_drafts_evicted_total", "크기 상한으로 내보낸 초안 수", stats["evicted"], "counter")
+
+        data_manager = getattr(bot, "data_manager", None)
+        if data_manager is not None:
+            # 백엔드마다 통계 항목이 다르므로 숫자 값을 모두 레이블로 노출
+            lines.append("# HELP seri_storage 저장소 백엔드 통계 (바이트, 대기 쓰기 수, 반영 시간 등)")
+            lines.append("# TYPE seri_storage gauge")
+            for key, value in sorted(data_manager.get_stats().items()):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"seri_storage{_labels({'stat': key})} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def instrument_ui(observe: HandlerObserver) -> None:
+    """버튼/선택 메뉴와 모달 콜백 실행을 관찰자로 감싸기
+
+    py-cord는 컴포넌트 콜백을 `View._scheduled_task`에서, 모달 콜백을
+    `ModalStore.dispatch`에서 실행하므로 두 곳을 한 번만 감싸고, 이후
+    호출에서는 관찰자만 바꿉니다.
+
+    Args:
+        observe: `observe("component", 이름, 인터랙션)` 형태로 호출할 관찰자
+    """
+    global _ui_observer
+    already = _ui_observer is not None
+    _ui_observer = observe
+    if already:
+        return
+
+    view_task = discord.ui.View._scheduled_task
+    modal_dispatch = discord.ui.modal.ModalStore.dispatch
+
+    async def scheduled_task(view: discord.ui.View, item: Any, interaction: discord.Interaction) -> Any:
+        # 데코레이터로 만든 항목의 콜백은 functools.partial
+        callback = getattr(item.callback, "func", item.callback)
+        label = f"{type(view).__name__}.{getattr(callback, '__name__', type(item).__name__)}"
+        with _ui_observer("component", label, interaction):
+            return await view_task(view, item, interaction)
+
+    async def dispatch(store: Any, user_id: int, custom_id: str, interaction: discord.Interaction) -> Any:
+        modal = store._modals.get((user_id, custom_id))
+        if modal is None:
+            return await modal_dispatch(store, user_id, custom_id, interaction)
+        with _ui_observer("component", type(modal).__name__, interaction):
+            return await modal_dispatch(store, user_id, custom_id, interaction)
+
+    discord.ui.View._scheduled_task = scheduled_task
+    discord.ui.modal.ModalStore.dispatch = dispatch
+
+
+class MetricsServer:
+    """메트릭 및 상태 확인 HTTP 서버
+
+    Args:
+        bot: 메트릭을 수집할 봇 (`metrics` 속성 필요)
+        host: 수신 주소
+        port: 수신 포트
+    """
+
+    def __init__(self, bot: discord.Bot, host: str, port: int):
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """서버 시작"""
+        if self._runner is not None:
+            return
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/health", self._handle_health)
+        app.router.add_get("/ready", self._handle_ready)
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self.host, self.port).start()
+        except OSError:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        logger.info(f"메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        body = self.bot.metrics.render(self.bot).encode("utf-8")
+        return web.Response(body=body, headers={"Content-Type": _CONTENT_TYPE})
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+    async def _handle_ready(self, request: web.Request) -> web.Response:
+        if getattr(self.bot, "_initialized", False) and not self.bot.is_closed():
+            return web.Response(text="ready")
+        return web.Response(text="not ready", status=503)
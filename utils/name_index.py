@@ -0,0 +1,103 @@
+"""임베드 이름 정렬 인덱스"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+__all__ = ["NameIndex"]
+
+
+class NameIndex:
+    """사용자 임베드 이름의 정렬 인덱스
+
+    이름을 대소문자 구분 없이 정렬해 두고, 접두사 검색과 이름순 페이지를
+    이진 탐색으로 처리합니다. 최근 저장순 페이지를 위해 저장 순번도
+    함께 유지합니다. 추가/삭제는 저장소의 save/delete 시점에 반영됩니다.
+
+    Args:
+        names: 초기 이름 목록 (오래 전에 저장된 순서)
+    """
+
+    __slots__ = ("_entries", "_recent", "_sequence", "_next_sequence")
+
+    def __init__(self, names: Iterable[str] = ()):
+        names = list(names)
+        self._entries: list[tuple[str, str]] = sorted((name.casefold(), name) for name in names)
+        self._recent: list[tuple[int, str]] = list(enumerate(names))
+        self._sequence: dict[str, int] = {name: sequence for sequence, name in self._recent}
+        self._next_sequence = len(names)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, name: str) -> None:
+        """이름 추가 (이미 있으면 가장 최근으로 이동)"""
+        entry = (name.casefold(), name)
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            self._remove_recent(name)
+        else:
+            self._entries.insert(position, entry)
+
+        self._recent.append((self._next_sequence, name))
+        self._sequence[name] = self._next_sequence
+        self._next_sequence += 1
+
+    def remove(self, name: str) -> None:
+        """이름 삭제 (없으면 무시)"""
+        entry = (name.casefold(), name)
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+            self._remove_recent(name)
+
+    def _remove_recent(self, name: str) -> None:
+        """저장 순번 목록에서 이름 제거"""
+        sequence = self._sequence.pop(name)
+        position = bisect_left(self._recent, (sequence, name))
+        del self._recent[position]
+
+    def search(self, prefix: str, limit: int = 25) -> list[str]:
+        """접두사로 시작하는 이름 검색
+
+        Args:
+            prefix: 검색할 접두사 (대소문자 무시)
+            limit: 최대 결과 수
+
+        Returns:
+            정렬된 이름 목록
+        """
+        key = prefix.casefold()
+        position = bisect_left(self._entries, (key, ""))
+        results = []
+        for entry_key, name in self._entries[position:position + limit]:
+            if not entry_key.startswith(key):
+                break
+            results.append(name)
+        return results
+
+    def page(self, sort: str, cursor: str | None, limit: int) -> tuple[list[str], str | None]:
+        """커서 위치부터 한 페이지 조회
+
+        Args:
+            sort: "name" (이름순) 또는 "recent" (최근 저장순)
+            cursor: 이전 페이지가 반환한 커서 (처음이면 None)
+            limit: 페이지 크기
+
+        Returns:
+            (이름 목록, 다음 페이지 커서 또는 None)
+        """
+        if sort == "recent":
+            end = len(self._recent)
+            if cursor is not None:
+                end = bisect_left(self._recent, (int(cursor), ""))
+            start = max(end - limit, 0)
+            items = self._recent[start:end][::-1]
+            next_cursor = str(items[-1][0]) if start > 0 and items else None
+            return [name for _, name in items], next_cursor
+
+        start = 0
+        if cursor is not None:
+            start = bisect_right(self._entries, (cursor.casefold(), cursor))
+        items = self._entries[start:start + limit]
+        next_cursor = items[-1][1] if start + limit < len(self._entries) and items else None
+        return [name for _, name in items], next_cursor
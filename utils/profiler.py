@@ -0,0 +1,250 @@
+"""느린 핸들러 샘플링 프로파일러
+
+프로파일링을 켜면 명령어/컴포넌트 핸들러가 실행되는 동안만 별도 스레드가
+이벤트 루프 스레드의 호출 스택을 주기적으로 기록합니다. 핸들러가 임계값보다
+오래 걸리면 그 시간 동안의 표본을 collapsed stack 형식(`flamegraph.pl`,
+speedscope에서 열 수 있음)으로 `DATA_DIR/profiles`에 기록합니다.
+
+핸들러는 같은 스레드에서 번갈아 실행되므로 표본에는 같은 시간에 루프를 쓴
+다른 작업도 포함되며, 루프가 I/O를 기다린 표본은 대기로 따로 셉니다.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from .constants import (
+    DATA_DIR,
+    PROFILE_MAX_DUMPS,
+    PROFILE_MAX_RECORDS,
+    PROFILE_SAMPLE_INTERVAL,
+    PROFILE_SAMPLE_WINDOW,
+    PROFILE_THRESHOLD,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["HandlerProfiler", "SlowHandler"]
+
+# 스택 하나의 최대 깊이
+_MAX_DEPTH = 64
+
+# 루프가 할 일 없이 I/O를 기다리는 함수 (selectors.py)
+_IDLE_FUNCTIONS = frozenset({"select", "poll", "epoll", "kqueue", "control"})
+
+Stack = tuple[str, ...]
+
+
+@dataclass
+class SlowHandler:
+    """임계값을 넘은 핸들러 기록
+
+    Attributes:
+        kind: "command" 또는 "component"
+        name: 명령어 이름 또는 `뷰.콜백` 이름
+        duration: 처리 시간 (초)
+        finished_at: 끝난 시각 (Unix 시간)
+        samples: 처리 중 기록한 표본 수
+        idle_samples: 그중 루프가 I/O를 기다린 표본 수
+        hot_frames: 가장 자주 실행 중이던 프레임과 표본 수
+        dump_path: 프로파일 파일 경로 (표본이 없으면 None)
+    """
+
+    kind: str
+    name: str
+    duration: float
+    finished_at: float
+    samples: int
+    idle_samples: int
+    hot_frames: list[tuple[str, int]] = field(default_factory=list)
+    dump_path: Path | None = None
+
+
+# (코드, 줄) -> 표시 이름, 표본마다 같은 문자열을 공유하도록 캐시
+_labels: dict[tuple[object, int], str] = {}
+
+
+def _frame_label(frame) -> str:
+    """프레임 표시 이름 (`함수 (파일:줄)`)"""
+    code = frame.f_code
+    key = (code, frame.f_lineno)
+    label = _labels.get(key)
+    if label is None:
+        label = _labels[key] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+    return label
+
+
+def _extract_stack(frame) -> Stack:
+    """바깥쪽부터의 호출 스택"""
+    labels = []
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+def _is_idle(stack: Stack) -> bool:
+    """루프가 I/O를 기다리던 표본인지 여부"""
+    return bool(stack) and stack[-1].split(" ", 1)[0] in _IDLE_FUNCTIONS and "selectors.py" in stack[-1]
+
+
+class HandlerProfiler:
+    """핸들러 처리 시간 측정 및 느린 핸들러 프로파일 기록
+
+    Args:
+        threshold: 프로파일을 남길 최소 처리 시간 (초)
+        interval: 표본 기록 간격 (초)
+        directory: 프로파일 파일 디렉토리
+    """
+
+    def __init__(
+        self,
+        threshold: float = PROFILE_THRESHOLD,
+        interval: float = PROFILE_SAMPLE_INTERVAL,
+        directory: Path = DATA_DIR / "profiles"
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.directory = directory
+
+        self.slow: deque[SlowHandler] = deque(maxlen=PROFILE_MAX_RECORDS)
+        self.handled = 0
+        self._enabled = False
+        self._active = 0
+        self._loop_thread: int | None = None
+        # (시각, 스택), 표본 기록 스레드만 추가함
+        self._samples: deque[tuple[float, Stack]] = deque(maxlen=int(PROFILE_SAMPLE_WINDOW / interval))
+        self._wake = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self, threshold: float | None = None) -> None:
+        """프로파일링 시작
+
+        Args:
+            threshold: 새 임계값 (초, None이면 유지)
+        """
+        if threshold is not None:
+            self.threshold = threshold
+        self._enabled = True
+        if self._sampler is None or not self._sampler.is_alive():
+            self._sampler = threading.Thread(target=self._sample_loop, name="seri-profiler", daemon=True)
+            self._sampler.start()
+        logger.info(f"프로파일링 시작 (임계값 {self.threshold * 1000:.0f}ms)")
+
+    def disable(self) -> None:
+        """프로파일링 중지 (기록은 유지)"""
+        if not self._enabled:
+            return
+        self._enabled = False
+        self._wake.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+            self._sampler = None
+        self._samples.clear()
+        logger.info("프로파일링 중지")
+
+    @contextmanager
+    def track(self, kind: str, name: str) -> Iterator[None]:
+        """핸들러 실행 추적 (꺼져 있으면 아무것도 하지 않음)
+
+        Args:
+            kind: "command" 또는 "component"
+            name: 핸들러 이름
+        """
+        if not self._enabled:
+            yield
+            return
+
+        self._loop_thread = threading.get_ident()
+        self._active += 1
+        self._wake.set()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            self._active -= 1
+            if self._active == 0:
+                self._wake.clear()
+            self.handled += 1
+            if finished - started >= self.threshold:
+                self._record(kind, name, started, finished)
+
+    def slowest(self, count: int) -> list[SlowHandler]:
+        """최근 느린 핸들러를 처리 시간 순으로
+
+        Args:
+            count: 최대 개수
+        """
+        return sorted(self.slow, key=lambda record: record.duration, reverse=True)[:count]
+
+    def _sample_loop(self) -> None:
+        """핸들러가 실행 중인 동안 루프 스레드 스택 기록 (표본 스레드)"""
+        while self._enabled:
+            if not self._wake.wait(timeout=1.0):
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self._samples.append((time.perf_counter(), _extract_stack(frame)))
+                del frame
+            time.sleep(self.interval)
+
+    def _record(self, kind: str, name: str, started: float, finished: float) -> None:
+        """느린 핸들러 기록 및 프로파일 파일 쓰기 예약"""
+        stacks: Counter[Stack] = Counter(
+            stack for at, stack in list(self._samples) if started <= at <= finished
+        )
+        samples = sum(stacks.values())
+        idle = sum(count for stack, count in stacks.items() if _is_idle(stack))
+
+        # 실행 중이던 (대기가 아닌) 가장 안쪽 프레임
+        leaves: Counter[str] = Counter()
+        for stack, count in stacks.items():
+            if stack and not _is_idle(stack):
+                leaves[stack[-1]] += count
+
+        record = SlowHandler(
+            kind=kind,
+            name=name,
+            duration=finished - started,
+            finished_at=time.time(),
+            samples=samples,
+            idle_samples=idle,
+            hot_frames=leaves.most_common(3),
+        )
+        if stacks:
+            safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+            record.dump_path = self.directory / f"{time.strftime('%Y%m%d-%H%M%S')}_{kind}_{safe_name}.folded"
+            asyncio.get_running_loop().run_in_executor(None, self._write_dump, record.dump_path, stacks)
+        self.slow.append(record)
+        logger.warning(
+            f"느린 핸들러: {kind} {name} {record.duration * 1000:.0f}ms "
+            f"(표본 {samples}개, 대기 {idle}개)"
+        )
+
+    def _write_dump(self, path: Path, stacks: Counter[Stack]) -> None:
+        """collapsed stack 파일 기록 및 오래된 파일 정리 (스레드)"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{';'.join(stack)} {count}\n")
+
+            dumps = sorted(self.directory.glob("*.folded"), key=lambda p: p.stat().st_mtime)
+            for old in dumps[:-PROFILE_MAX_DUMPS]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"프로파일 기록 오류: {e}")
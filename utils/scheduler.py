@@ -0,0 +1,452 @@
+"""예약 및 반복 임베드 전송
+
+모든 예약은 하나의 타이머 힙에 들어가며, 단일 태스크가 가장 이른 예약
+시각까지만 잠들었다가 도래한 항목을 처리합니다. 예약이 아무리 많아도
+대기 중인 태스크는 하나이고, 도래한 항목마다 한 번씩만 깨어납니다.
+"""
+from __future__ import annotations
+import asyncio
+import heapq
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+import discord
+
+from .broadcast import ChannelRateLimiter
+from .constants import (
+    BROADCAST_CONCURRENCY,
+    DATA_DIR,
+    SCHEDULE_CATCH_UP,
+    SCHEDULE_CATCH_UP_MAX,
+    SCHEDULE_UTC_OFFSET,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CATCH_UP_POLICIES",
+    "Schedule",
+    "Scheduler",
+    "parse_duration",
+    "parse_run_time",
+    "format_run_time",
+]
+
+# 재시작 시 놓친 실행 처리 방식
+#   skip: 놓친 실행은 건너뛰고 다음 예정 시각부터 실행
+#   once: 놓친 실행이 여러 번이어도 한 번만 즉시 실행
+#   all:  놓친 실행을 모두 실행 (SCHEDULE_CATCH_UP_MAX회까지)
+CATCH_UP_POLICIES = ("skip", "once", "all")
+
+# 타이머가 한 번에 잠드는 최대 시간 (시스템 시계 변경 대비)
+_MAX_SLEEP = 3600.0
+
+_DURATION_PATTERN = re.compile(r"(\d+)\s*([smhdw])")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+_TIMEZONE = timezone(timedelta(hours=SCHEDULE_UTC_OFFSET))
+
+
+def parse_duration(text: str) -> int:
+    """기간 문자열 해석
+
+    Args:
+        text: 예: "30m", "12h", "1d", "1d12h"
+
+    Returns:
+        초 단위 기간
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    compact = text.strip().lower().replace(" ", "")
+    matches = list(_DURATION_PATTERN.finditer(compact))
+    if not matches or "".join(match.group(0) for match in matches) != compact:
+        raise ValueError(f"기간 형식이 올바르지 않습니다: {text} (예: 30m, 12h, 1d)")
+    return sum(int(number) * _DURATION_UNITS[unit] for number, unit in (m.groups() for m in matches))
+
+
+def parse_run_time(text: str, now: float | None = None) -> float:
+    """실행 시각 해석
+
+    Args:
+        text: "YYYY-MM-DD HH:MM", "HH:MM" (오늘, 지났으면 내일) 또는 "+30m" 형식
+        now: 기준 시각 (epoch 초, 기본값: 현재)
+
+    Returns:
+        실행 시각 (epoch 초)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    now = time.time() if now is None else now
+    text = text.strip()
+
+    if text.startswith("+"):
+        return now + parse_duration(text[1:])
+
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=_TIMEZONE).timestamp()
+        except ValueError:
+            pass
+
+    try:
+        clock = datetime.strptime(text, "%H:%M")
+    except ValueError:
+        raise ValueError(f"시각 형식이 올바르지 않습니다: {text} (예: 2025-01-01 09:00, 09:00, +30m)")
+
+    today = datetime.fromtimestamp(now, _TIMEZONE)
+    run_at = today.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0)
+    if run_at.timestamp() <= now:
+        run_at += timedelta(days=1)
+    return run_at.timestamp()
+
+
+def format_run_time(timestamp: float) -> str:
+    """실행 시각을 Discord 타임스탬프 표기로 변환"""
+    return f"<t:{int(timestamp)}:f>"
+
+
+@dataclass
+class Schedule:
+    """예약 전송"""
+
+    schedule_id: int
+    user_id: int
+    channel_id: int
+    embed_name: str
+    next_run: float
+    interval: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장용 딕셔너리"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Schedule:
+        """저장된 딕셔너리에서 생성"""
+        return cls(
+            schedule_id=int(data["schedule_id"]),
+            user_id=int(data["user_id"]),
+            channel_id=int(data["channel_id"]),
+            embed_name=data["embed_name"],
+            next_run=float(data["next_run"]),
+            interval=int(data["interval"]) if data.get("interval") else None,
+        )
+
+    def advance(self, now: float) -> bool:
+        """다음 실행 시각으로 이동
+
+        Args:
+            now: 현재 시각
+
+        Returns:
+            반복 예약이면 True, 일회성 예약이면 False (삭제 대상)
+        """
+        if not self.interval:
+            return False
+        if self.next_run <= now:
+            missed = int((now - self.next_run) // self.interval) + 1
+            self.next_run += missed * self.interval
+        return True
+
+    def missed_runs(self, now: float) -> int:
+        """현재 시각까지 도래한 실행 횟수"""
+        if self.next_run > now:
+            return 0
+        if not self.interval:
+            return 1
+        return int((now - self.next_run) // self.interval) + 1
+
+
+class Scheduler:
+    """타이머 힙 기반 예약 전송기
+
+    예약 추가/삭제는 즉시 `schedules.json`에 기록되고, 반복 예약의 다음
+    실행 시각은 `save()` (자동 저장 주기 및 종료 시)에 모아서 기록됩니다.
+    비정상 종료로 기록되지 못한 실행은 재시작 시 놓친 실행 처리 방식에 따릅니다.
+
+    Args:
+        bot: 봇 인스턴스
+        catch_up: 놓친 실행 처리 방식 ("skip", "once", "all")
+        path: 예약 저장 파일
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        catch_up: str = SCHEDULE_CATCH_UP,
+        path: Path = DATA_DIR / "schedules.json"
+    ):
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"알 수 없는 놓친 실행 처리 방식: {catch_up}")
+
+        self.bot = bot
+        self.catch_up = catch_up
+        self.path = path
+        self.limiter = ChannelRateLimiter()
+
+        self._schedules: dict[int, Schedule] = {}
+        self._user_schedules: dict[int, set[int]] = {}
+        # (실행 시각, 예약 ID) - 삭제/변경된 항목은 꺼낼 때 건너뜀
+        self._heap: list[tuple[float, int]] = []
+        self._next_id = 1
+        self._dirty = False
+        self._save_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._sends: set[asyncio.Task] = set()
+        self._send_semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+        self.sent = 0
+        self.failed = 0
+        self.caught_up = 0
+        self.skipped = 0
+
+    async def start(self) -> None:
+        """저장된 예약을 불러오고 타이머 태스크 시작"""
+        if self._task is not None and not self._task.done():
+            return
+
+        records = await asyncio.to_thread(self._read_file)
+        now = time.time()
+        for record in records:
+            schedule = Schedule.from_dict(record)
+            self._next_id = max(self._next_id, schedule.schedule_id + 1)
+            if self._catch_up(schedule, now):
+                self._insert(schedule)
+
+        logger.info(f"예약 {len(self._schedules)}개 로드 (놓친 실행 {self.caught_up}회 실행, {self.skipped}회 건너뜀)")
+        self._task = asyncio.create_task(self._timer_loop())
+
+    def _catch_up(self, schedule: Schedule, now: float) -> bool:
+        """재시작 전에 놓친 실행 처리
+
+        Returns:
+            예약을 유지하면 True
+        """
+        missed = schedule.missed_runs(now)
+        if missed == 0:
+            return True
+
+        if self.catch_up == "skip":
+            runs = 0
+        elif self.catch_up == "once":
+            runs = 1
+        else:
+            runs = min(missed, SCHEDULE_CATCH_UP_MAX)
+
+        for _ in range(runs):
+            self._dispatch(schedule)
+        self.caught_up += runs
+        self.skipped += missed - runs
+        self._dirty = True
+        return schedule.advance(now)
+
+    def _read_file(self) -> list[dict[str, Any]]:
+        """예약 파일 읽기 (스레드)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _write_file(self, records: list[dict[str, Any]]) -> None:
+        """예약 파일을 원자적으로 기록 (스레드)"""
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    async def save(self) -> None:
+        """변경된 예약 기록"""
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            records = [schedule.to_dict() for schedule in self._schedules.values()]
+            try:
+                await asyncio.to_thread(self._write_file, records)
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"예약 저장 오류: {e}")
+
+    async def close(self) -> None:
+        """타이머 태스크 종료 및 예약 기록"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+        await self.save()
+
+    def _insert(self, schedule: Schedule) -> None:
+        """예약 등록 및 힙에 추가"""
+        self._schedules[schedule.schedule_id] = schedule
+        self._user_schedules.setdefault(schedule.user_id, set()).add(schedule.schedule_id)
+        self._push(schedule)
+
+    def _push(self, schedule: Schedule) -> None:
+        """힙에 실행 시각 추가 (더 이른 항목이면 타이머 깨우기)"""
+        if not self._heap or schedule.next_run < self._heap[0][0]:
+            self._wakeup.set()
+        heapq.heappush(self._heap, (schedule.next_run, schedule.schedule_id))
+
+    def _discard(self, schedule_id: int) -> Schedule | None:
+        """예약 제거 (힙 항목은 꺼낼 때 건너뜀)"""
+        schedule = self._schedules.pop(schedule_id, None)
+        if schedule is None:
+            return None
+
+        user_schedules = self._user_schedules.get(schedule.user_id)
+        if user_schedules is not None:
+            user_schedules.discard(schedule_id)
+            if not user_schedules:
+                del self._user_schedules[schedule.user_id]
+
+        # 삭제된 항목이 많이 쌓이면 힙 재구성
+        if len(self._heap) > 2 * len(self._schedules) + 64:
+            self._heap = [
+                (s.next_run, s.schedule_id) for s in self._schedules.values()
+            ]
+            heapq.heapify(self._heap)
+        return schedule
+
+    async def add(
+        self,
+        user_id: int,
+        channel_id: int,
+        embed_name: str,
+        run_at: float,
+        interval: int | None = None
+    ) -> Schedule:
+        """예약 추가
+
+        Args:
+            user_id: 예약한 사용자 ID
+            channel_id: 전송할 채널 ID
+            embed_name: 전송할 임베드 이름
+            run_at: 첫 실행 시각 (epoch 초)
+            interval: 반복 간격 (초, 일회성이면 None)
+
+        Returns:
+            추가된 예약
+        """
+        schedule = Schedule(self._next_id, user_id, channel_id, embed_name, run_at, interval)
+        self._next_id += 1
+        self._insert(schedule)
+        self._dirty = True
+        await self.save()
+        return schedule
+
+    async def remove(self, user_id: int, schedule_id: int) -> bool:
+        """예약 삭제
+
+        Args:
+            user_id: 사용자 ID (다른 사용자의 예약은 삭제 불가)
+            schedule_id: 예약 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        schedule = self._schedules.get(schedule_id)
+        if schedule is None or schedule.user_id != user_id:
+            return False
+
+        self._discard(schedule_id)
+        self._dirty = True
+        await self.save()
+        return True
+
+    def list_for(self, user_id: int) -> list[Schedule]:
+        """사용자의 예약 목록 (실행 시각순)"""
+        return sorted(
+            (self._schedules[schedule_id] for schedule_id in self._user_schedules.get(user_id, ())),
+            key=lambda schedule: schedule.next_run
+        )
+
+    def count_for(self, user_id: int) -> int:
+        """사용자의 예약 수"""
+        return len(self._user_schedules.get(user_id, ()))
+
+    def get_stats(self) -> dict[str, Any]:
+        """예약 통계"""
+        return {
+            "schedules": len(self._schedules),
+            "heap_entries": len(self._heap),
+            "next_run": self._heap[0][0] if self._heap else None,
+            "in_flight": len(self._sends),
+            "sent": self.sent,
+            "failed": self.failed,
+            "caught_up": self.caught_up,
+            "skipped": self.skipped,
+        }
+
+    async def _timer_loop(self) -> None:
+        """가장 이른 예약 시각까지 대기 후 도래한 예약 처리"""
+        while True:
+            try:
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    run_at, schedule_id = heapq.heappop(self._heap)
+                    schedule = self._schedules.get(schedule_id)
+                    if schedule is None or schedule.next_run != run_at:
+                        continue
+
+                    self._dispatch(schedule)
+                    if schedule.advance(now):
+                        self._push(schedule)
+                    else:
+                        self._discard(schedule_id)
+                    self._dirty = True
+
+                timeout = min(self._heap[0][0] - now, _MAX_SLEEP) if self._heap else _MAX_SLEEP
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"예약 타이머 오류: {e}")
+                await asyncio.sleep(1)
+
+    def _dispatch(self, schedule: Schedule) -> None:
+        """예약 전송 시작 (타이머를 막지 않도록 별도 태스크)"""
+        task = asyncio.create_task(
+            self._send(schedule.schedule_id, schedule.user_id, schedule.channel_id, schedule.embed_name)
+        )
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(self, schedule_id: int, user_id: int, channel_id: int, embed_name: str) -> None:
+        """예약된 임베드 전송"""
+        async with self._send_semaphore:
+            try:
+                channel = self.bot.get_channel(channel_id)
+                if channel is None:
+                    raise LookupError(f"채널을 찾을 수 없음: {channel_id}")
+
+                embed_data = await self.bot.data_manager.get_embed(user_id, embed_name)
+                if not embed_data:
+                    raise LookupError(f"임베드를 찾을 수 없음: {embed_name}")
+
+                await self.limiter.acquire(channel_id)
+                await channel.send(embed=self.bot.embed_renderer.render(embed_data))
+                self.sent += 1
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"예약 #{schedule_id} 전송 실패: {e}")
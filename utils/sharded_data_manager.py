@@ -0,0 +1,326 @@
+"""사용자별 샤드 파일 기반 데이터 관리"""
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+import discord
+
+from .constants import (
+    DATA_DIR,
+    LIST_PAGE_SIZE,
+    SHARD_BUCKETS,
+    SHARD_CACHE_BYTES,
+    WRITE_BEHIND_CLOSE_TIMEOUT,
+)
+from .data_manager import DataManager, EmbedPage, JsonDataManager
+from .embed_document import EmbedDocument
+from .name_index import NameIndex
+from .write_behind import PendingWrites, WriteBehindQueue
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ShardedDataManager"]
+
+# 캐시 항목 하나(딕셔너리, 이름 색인 등)의 대략적인 고정 비용 (바이트)
+# 샤드가 없는 사용자도 예산에 포함되어 내보내지도록 함
+_ENTRY_OVERHEAD = 256
+
+
+class ShardedDataManager(DataManager):
+    """사용자별 샤드 저장소
+
+    사용자마다 `shards/<버킷>/<user_id>.json` 파일 하나를 사용합니다.
+    샤드는 처음 접근할 때 스레드에서 로드되어 LRU 캐시에 유지되고,
+    캐시가 메모리 예산을 넘으면 오래 사용하지 않은 사용자부터 내보냅니다.
+    변경은 쓰기 지연 큐를 거쳐 해당 사용자의 샤드 파일에만 반영되므로
+    상주 메모리는 전체 사용자가 아닌 활성 사용자 수에 비례합니다.
+
+    Args:
+        bot: 봇 인스턴스
+        cache_bytes: 샤드 캐시 메모리 예산 (바이트)
+    """
+
+    def __init__(self, bot: discord.Bot, cache_bytes: int = SHARD_CACHE_BYTES):
+        super().__init__(bot)
+        self.shards_dir = DATA_DIR / "shards"
+        self.cache_bytes = cache_bytes
+
+        # 사용자 ID -> (임베드, 추정 크기)
+        self._cache: OrderedDict[int, tuple[dict[str, EmbedDocument], int]] = OrderedDict()
+        self._cache_size = 0
+        self._loading: dict[int, asyncio.Future] = {}
+        self._name_indexes: dict[int, NameIndex] = {}
+        self._writer = WriteBehindQueue(self._write_pending)
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.evictions = 0
+
+    async def load_data(self) -> None:
+        """샤드 디렉토리 준비 (최초 실행 시 JSON 데이터 이전)"""
+        self._loaded = False
+        if not self.shards_dir.exists():
+            await asyncio.to_thread(self._migrate_from_json)
+        self._loaded = True
+        self._writer.start()
+
+    async def save_data(self) -> None:
+        """대기 중인 변경 반영"""
+        await self._writer.flush()
+
+    async def close(self) -> None:
+        """대기 중인 변경 반영 후 캐시 비우기"""
+        await self._writer.close(WRITE_BEHIND_CLOSE_TIMEOUT)
+        self._cache.clear()
+        self._cache_size = 0
+        self._name_indexes.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """쓰기 지연 및 샤드 캐시 통계"""
+        stats: dict[str, Any] = self._writer.get_stats()
+        stats.update({
+            "resident_users": len(self._cache),
+            "resident_bytes": self._cache_size,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "evictions": self.evictions,
+        })
+        return stats
+
+    def _shard_path(self, user_id: int) -> Path:
+        """사용자 샤드 파일 경로"""
+        bucket = zlib.crc32(str(user_id).encode()) % SHARD_BUCKETS
+        return self.shards_dir / f"{bucket:02x}" / f"{user_id}.json"
+
+    def _migrate_from_json(self) -> None:
+        """기존 JSON 저장소 데이터를 샤드로 한 번만 이전 (스레드)"""
+        json_manager = JsonDataManager(self.bot)
+        has_json = json_manager.has_data()
+
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        if not has_json:
+            return
+
+        json_manager._load_embeds()
+        count = 0
+        try:
+            for user_id, embeds in json_manager._iter_user_embeds():
+                if embeds:
+                    self._write_shard(user_id, embeds)
+                    count += 1
+        finally:
+            json_manager._close_snapshot()
+        logger.info(f"JSON 저장소 샤드 이전 완료: {count}명")
+
+    def _read_shard(self, user_id: int) -> tuple[dict[str, Any], int]:
+        """샤드 파일 읽기 (스레드)
+
+        Returns:
+            임베드 딕셔너리와 파일 크기
+        """
+        path = self._shard_path(user_id)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return {}, 0
+        return json.loads(raw), len(raw)
+
+    def _write_shard(self, user_id: int, embeds: dict[str, Any]) -> None:
+        """샤드 파일을 원자적으로 기록 (스레드)"""
+        path = self._shard_path(user_id)
+        if not embeds:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(embeds, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def _write_pending(self, pending: PendingWrites) -> None:
+        """더티 사용자의 샤드에 변경 반영 (writer 스레드)
+
+        캐시 상태를 공유하지 않도록 디스크의 샤드를 읽어 변경을 적용합니다.
+        """
+        for user_id, changes in pending.items():
+            embeds, _ = self._read_shard(user_id)
+            self._apply_changes(embeds, changes)
+            self._write_shard(user_id, embeds)
+
+    @staticmethod
+    def _apply_changes(embeds: dict[str, Any], changes: dict[str, Any]) -> None:
+        """변경 목록을 임베드 딕셔너리에 적용"""
+        for embed_name, embed_data in changes.items():
+            # 딕셔너리 순서를 최근 저장순으로 유지
+            embeds.pop(embed_name, None)
+            if embed_data is not None:
+                embeds[embed_name] = embed_data
+
+    async def _get_shard(self, user_id: int) -> dict[str, EmbedDocument]:
+        """사용자 샤드 조회 (없으면 로드)"""
+        entry = self._cache.get(user_id)
+        if entry is not None:
+            self._cache.move_to_end(user_id)
+            self.cache_hits += 1
+            return entry[0]
+
+        # 같은 사용자를 동시에 로드하지 않도록 진행 중인 로드를 공유
+        loading = self._loading.get(user_id)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        self.cache_misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._loading[user_id] = future
+        try:
+            # 읽는 동안 반영이 끝나면 그 변경은 반영 중 목록에서 빠지고 읽은 내용에도
+            # 없을 수 있으므로 다시 읽음 (확인과 덮어쓰기 사이에는 양보하지 않음)
+            while True:
+                generation = self._writer.flush_generation
+                raw, size = await asyncio.to_thread(self._read_shard, user_id)
+                if self._writer.flush_generation == generation:
+                    break
+
+            # 아직 디스크에 반영되지 않은 변경 덮어쓰기
+            for changes in self._writer.pending_for(user_id):
+                self._apply_changes(raw, changes)
+
+            embeds = {name: EmbedDocument.from_dict(data) for name, data in raw.items()}
+            size += _ENTRY_OVERHEAD
+            self._cache[user_id] = (embeds, size)
+            self._cache_size += size
+            self._evict()
+            future.set_result(embeds)
+            return embeds
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기 중인 호출이 없어도 경고가 남지 않도록 조회 처리
+            future.exception()
+            raise
+        finally:
+            del self._loading[user_id]
+
+    @staticmethod
+    def _estimate_size(embed_data: EmbedDocument) -> int:
+        """임베드의 추정 크기 (직렬화 길이)"""
+        return len(json.dumps(embed_data.to_dict(), ensure_ascii=False, separators=(",", ":")))
+
+    def _resize(self, user_id: int, delta: int) -> None:
+        """캐시된 샤드의 추정 크기 조정"""
+        if user_id not in self._cache:
+            return
+        embeds, size = self._cache[user_id]
+        size = max(size + delta, _ENTRY_OVERHEAD)
+        self._cache_size += size - self._cache[user_id][1]
+        self._cache[user_id] = (embeds, size)
+
+    def _evict(self) -> None:
+        """메모리 예산을 넘으면 오래된 샤드부터 내보내기
+
+        샤드를 따로 기록하지 않습니다. 더티 샤드의 변경은 쓰기 지연 큐에 남아 있어
+        내보낸 뒤에도 writer가 디스크에 반영하며, 반영 전에 다시 로드하면 큐의
+        변경으로 덮어씁니다.
+        """
+        while self._cache_size > self.cache_bytes and len(self._cache) > 1:
+            user_id, (_, size) = self._cache.popitem(last=False)
+            self._cache_size -= size
+            self._name_indexes.pop(user_id, None)
+            self.evictions += 1
+
+    async def save_embed(self, user_id: int, embed_name: str, embed_data: EmbedDocument) -> None:
+        """임베드 저장"""
+        await self.save_embeds(user_id, [(embed_name, embed_data)])
+
+    async def save_embeds(self, user_id: int, embeds: list[tuple[str, EmbedDocument]]) -> None:
+        """여러 임베드를 한 번에 저장"""
+        for _, embed_data in embeds:
+            embed_data.validate()
+
+        user_embeds = await self._get_shard(user_id)
+        name_index = self._name_indexes.get(user_id)
+
+        for embed_name, embed_data in embeds:
+            # 빌더가 이후에 원본을 수정해도 저장본은 유지
+            embed_data = embed_data.copy()
+            record = embed_data.to_dict()
+
+            old_data = user_embeds.pop(embed_name, None)
+            old_size = self._estimate_size(old_data) if old_data is not None else 0
+            user_embeds[embed_name] = embed_data
+            self._resize(user_id, self._estimate_size(embed_data) - old_size)
+            self._writer.mark(user_id, embed_name, record)
+
+            if name_index is not None:
+                name_index.add(embed_name)
+        self._notify_change(user_id)
+        self._evict()
+
+    async def get_embed(self, user_id: int, embed_name: str) -> EmbedDocument | None:
+        """임베드 조회"""
+        embeds = await self._get_shard(user_id)
+        return embeds.get(embed_name)
+
+    async def delete_embed(self, user_id: int, embed_name: str) -> bool:
+        """임베드 삭제"""
+        embeds = await self._get_shard(user_id)
+        if embed_name not in embeds:
+            return False
+
+        old_data = embeds.pop(embed_name)
+        self._resize(user_id, -self._estimate_size(old_data))
+        self._writer.mark(user_id, embed_name, None)
+
+        name_index = self._name_indexes.get(user_id)
+        if name_index is not None:
+            name_index.remove(embed_name)
+        self._notify_change(user_id)
+        return True
+
+    async def list_embeds(self, user_id: int) -> list[str]:
+        """사용자의 모든 임베드 이름 조회"""
+        embeds = await self._get_shard(user_id)
+        return list(embeds.keys())
+
+    async def embed_exists(self, user_id: int, embed_name: str) -> bool:
+        """임베드 존재 여부 확인"""
+        embeds = await self._get_shard(user_id)
+        return embed_name in embeds
+
+    async def _get_name_index(self, user_id: int) -> NameIndex:
+        """사용자 이름 인덱스 (샤드가 캐시에 있는 동안 유지)"""
+        embeds = await self._get_shard(user_id)
+        name_index = self._name_indexes.get(user_id)
+        if name_index is None:
+            name_index = NameIndex(embeds)
+            if user_id in self._cache:
+                self._name_indexes[user_id] = name_index
+        return name_index
+
+    async def search_embed_names(self, user_id: int, prefix: str, limit: int = 25) -> list[str]:
+        """접두사로 임베드 이름 검색"""
+        name_index = await self._get_name_index(user_id)
+        return name_index.search(prefix, limit)
+
+    async def list_embeds_page(
+        self,
+        user_id: int,
+        sort: str = "name",
+        cursor: str | None = None,
+        limit: int = LIST_PAGE_SIZE
+    ) -> EmbedPage:
+        """커서 기반 임베드 이름 페이지 조회"""
+        name_index = await self._get_name_index(user_id)
+        names, next_cursor = name_index.page(sort, cursor, limit)
+        return EmbedPage(names, next_cursor, len(name_index))
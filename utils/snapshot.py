@@ -0,0 +1,429 @@
+"""바이너리 임베드 스냅샷 형식
+
+파일 구조 (리틀 엔디언, 버전 2):
+
+    헤더        magic(8s) version(H) flags(H) user_count(I) index_offset(Q)
+                blob_count(I) blob_index_offset(Q) ref_count(Q)
+    사용자      사용자별 {임베드 이름: 내용 해시(hex)} (압축된 JSON, UTF-8)
+    blob        임베드 내용 (정렬된 키의 압축된 JSON, UTF-8), 내용 해시당 하나
+    인덱스      user_id(Q) offset(Q) length(I) × user_count, user_id 오름차순
+    blob 인덱스 digest(16s) offset(Q) length(I) × blob_count, digest 오름차순
+
+같은 내용의 임베드는 사용자와 이름이 달라도 blob 하나만 저장됩니다.
+버전 1 파일(사용자 레코드에 임베드 내용을 직접 저장, blob 없음)도 읽을 수 있습니다.
+
+파일은 mmap으로 열리며, 시작 시에는 헤더만 읽습니다. 사용자 조회는
+인덱스에 대한 이진 탐색이고, 해당 사용자의 데이터만 필요할 때 디코딩합니다.
+
+JSON 변환:
+    python -m utils.snapshot from-json data/embeds.json data/embeds.snap
+    python -m utils.snapshot to-json data/embeds.snap embeds.json
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .embed_document import EmbedDocument
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "SnapshotError",
+    "SnapshotReader",
+    "write_snapshot",
+    "encode_blob",
+    "encode_refs",
+    "decode_refs",
+    "blob_digest",
+    "json_to_snapshot",
+    "snapshot_to_json",
+]
+
+SNAPSHOT_MAGIC = b"SERISNAP"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<8sHHIQ")
+_BLOB_HEADER = struct.Struct("<IQQ")
+_INDEX_ENTRY = struct.Struct("<QQI")
+_BLOB_ENTRY = struct.Struct("<16sQI")
+
+DIGEST_SIZE = 16
+
+
+class SnapshotError(ValueError):
+    """스냅샷 형식 오류"""
+
+
+def encode_blob(embed_data: dict[str, Any]) -> bytes:
+    """임베드 내용을 blob으로 인코딩
+
+    같은 내용이면 항상 같은 바이트가 되도록 키를 정렬합니다.
+
+    Args:
+        embed_data: `EmbedDocument.to_dict()` 형식의 임베드 데이터
+
+    Returns:
+        인코딩된 바이트
+    """
+    return json.dumps(embed_data, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def blob_digest(blob: bytes) -> bytes:
+    """blob의 내용 해시 (16바이트)"""
+    return hashlib.blake2b(blob, digest_size=DIGEST_SIZE).digest()
+
+
+def encode_refs(refs: dict[str, bytes]) -> bytes:
+    """사용자 레코드 인코딩
+
+    Args:
+        refs: 임베드 이름 -> 내용 해시
+
+    Returns:
+        인코딩된 바이트
+    """
+    return json.dumps(
+        {name: digest.hex() for name, digest in refs.items()},
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def decode_refs(record: bytes) -> dict[str, bytes]:
+    """사용자 레코드 디코딩 (임베드 이름 -> 내용 해시)"""
+    return {name: bytes.fromhex(digest) for name, digest in json.loads(record).items()}
+
+
+def write_snapshot(
+    path: str | Path,
+    users: Iterable[tuple[int, bytes, int]],
+    blobs: Iterable[tuple[bytes, bytes]]
+) -> int:
+    """스냅샷 파일 기록
+
+    레코드를 순서대로 기록하므로 전체 데이터를 메모리에 모으지 않습니다.
+    `blobs`는 `users`를 모두 기록한 뒤에 순회됩니다.
+
+    Args:
+        path: 기록할 파일 경로
+        users: (사용자 ID, 인코딩된 레코드, 참조 수) 목록
+        blobs: (내용 해시, 인코딩된 blob) 목록
+
+    Returns:
+        기록된 사용자 수
+    """
+    index: list[tuple[int, int, int]] = []
+    blob_index: list[tuple[bytes, int, int]] = []
+    ref_count = 0
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * (_HEADER.size + _BLOB_HEADER.size))
+        offset = _HEADER.size + _BLOB_HEADER.size
+
+        for user_id, record, refs in users:
+            f.write(record)
+            index.append((user_id, offset, len(record)))
+            offset += len(record)
+            ref_count += refs
+
+        for digest, blob in blobs:
+            f.write(blob)
+            blob_index.append((digest, offset, len(blob)))
+            offset += len(blob)
+
+        index.sort()
+        index_offset = offset
+        for entry in index:
+            f.write(_INDEX_ENTRY.pack(*entry))
+
+        blob_index.sort()
+        blob_index_offset = index_offset + len(index) * _INDEX_ENTRY.size
+        for entry in blob_index:
+            f.write(_BLOB_ENTRY.pack(*entry))
+
+        f.seek(0)
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(index), index_offset))
+        f.write(_BLOB_HEADER.pack(len(blob_index), blob_index_offset, ref_count))
+        f.flush()
+        os.fsync(f.fileno())
+
+    return len(index)
+
+
+class SnapshotReader:
+    """mmap 기반 스냅샷 읽기
+
+    Args:
+        path: 스냅샷 파일 경로
+
+    Raises:
+        SnapshotError: 헤더가 올바르지 않은 경우
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap 불가
+            self._file.close()
+            raise SnapshotError(f"빈 스냅샷 파일: {self.path}")
+
+        try:
+            magic, version, _flags, count, index_offset = _HEADER.unpack_from(self._mm, 0)
+        except struct.error:
+            self.close()
+            raise SnapshotError(f"잘린 스냅샷 헤더: {self.path}")
+
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise SnapshotError(f"스냅샷 파일이 아닙니다: {self.path}")
+        if version not in (1, SNAPSHOT_VERSION):
+            self.close()
+            raise SnapshotError(f"지원하지 않는 스냅샷 버전: {version}")
+        if index_offset + count * _INDEX_ENTRY.size > len(self._mm):
+            self.close()
+            raise SnapshotError(f"잘린 스냅샷 인덱스: {self.path}")
+
+        # 버전 1은 blob 없이 사용자 레코드에 내용을 직접 저장
+        blob_count, blob_index_offset, ref_count = 0, 0, 0
+        if version >= 2:
+            try:
+                blob_count, blob_index_offset, ref_count = _BLOB_HEADER.unpack_from(self._mm, _HEADER.size)
+            except struct.error:
+                self.close()
+                raise SnapshotError(f"잘린 스냅샷 헤더: {self.path}")
+            if blob_index_offset + blob_count * _BLOB_ENTRY.size > len(self._mm):
+                self.close()
+                raise SnapshotError(f"잘린 스냅샷 blob 인덱스: {self.path}")
+
+        self.version = version
+        self.user_count = count
+        self.blob_count = blob_count
+        self.ref_count = ref_count
+        self._index_offset = index_offset
+        self._blob_index_offset = blob_index_offset
+
+    def __enter__(self) -> SnapshotReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.user_count
+
+    def __contains__(self, user_id: int) -> bool:
+        return self._find(user_id) is not None
+
+    def close(self) -> None:
+        """mmap 및 파일 닫기"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _entry(self, position: int) -> tuple[int, int, int]:
+        """인덱스 항목 읽기"""
+        return _INDEX_ENTRY.unpack_from(self._mm, self._index_offset + position * _INDEX_ENTRY.size)
+
+    def _find(self, user_id: int) -> tuple[int, int] | None:
+        """인덱스 이진 탐색
+
+        Returns:
+            (오프셋, 길이) (없으면 None)
+        """
+        low, high = 0, self.user_count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry_id, offset, length = self._entry(middle)
+            if entry_id == user_id:
+                return offset, length
+            if entry_id < user_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def get_raw(self, user_id: int) -> bytes | None:
+        """인코딩된 사용자 레코드 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            레코드 바이트 (없으면 None)
+        """
+        location = self._find(user_id)
+        if location is None:
+            return None
+        offset, length = location
+        return self._mm[offset:offset + length]
+
+    def get(self, user_id: int) -> dict[str, Any] | None:
+        """사용자 임베드 디코딩
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            임베드 이름 -> 임베드 데이터 (없으면 None)
+        """
+        raw = self.get_raw(user_id)
+        return self._decode_user(raw) if raw is not None else None
+
+    def get_refs(self, user_id: int) -> dict[str, bytes] | None:
+        """사용자 임베드의 내용 해시 조회 (버전 2 이상)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            임베드 이름 -> 내용 해시 (없으면 None)
+        """
+        raw = self.get_raw(user_id)
+        return decode_refs(raw) if raw is not None else None
+
+    def _decode_user(self, raw: bytes) -> dict[str, Any]:
+        """사용자 레코드를 임베드 데이터로 디코딩"""
+        if self.version < 2:
+            return json.loads(raw)
+        return {name: self.get_blob(digest) for name, digest in decode_refs(raw).items()}
+
+    def _find_blob(self, digest: bytes) -> tuple[int, int] | None:
+        """blob 인덱스 이진 탐색
+
+        Returns:
+            (오프셋, 길이) (없으면 None)
+        """
+        low, high = 0, self.blob_count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry_digest, offset, length = _BLOB_ENTRY.unpack_from(
+                self._mm, self._blob_index_offset + middle * _BLOB_ENTRY.size
+            )
+            if entry_digest == digest:
+                return offset, length
+            if entry_digest < digest:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def has_blob(self, digest: bytes) -> bool:
+        """blob 존재 여부"""
+        return self._find_blob(digest) is not None
+
+    def get_blob_raw(self, digest: bytes) -> bytes | None:
+        """인코딩된 blob 조회
+
+        Args:
+            digest: 내용 해시
+
+        Returns:
+            blob 바이트 (없으면 None)
+        """
+        location = self._find_blob(digest)
+        if location is None:
+            return None
+        offset, length = location
+        return self._mm[offset:offset + length]
+
+    def get_blob(self, digest: bytes) -> dict[str, Any]:
+        """blob 디코딩
+
+        Raises:
+            SnapshotError: 참조된 blob이 없는 경우
+        """
+        raw = self.get_blob_raw(digest)
+        if raw is None:
+            raise SnapshotError(f"참조된 blob이 없습니다: {digest.hex()}")
+        return json.loads(raw)
+
+    def iter_raw(self) -> Iterator[tuple[int, bytes]]:
+        """모든 사용자 레코드 순회 (user_id 오름차순)"""
+        for position in range(self.user_count):
+            user_id, offset, length = self._entry(position)
+            yield user_id, self._mm[offset:offset + length]
+
+    def iter_users(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """모든 사용자 임베드 디코딩 순회"""
+        for user_id, raw in self.iter_raw():
+            yield user_id, self._decode_user(raw)
+
+
+def json_to_snapshot(json_path: str | Path, snapshot_path: str | Path) -> int:
+    """JSON 저장 파일을 스냅샷으로 변환
+
+    Args:
+        json_path: `{user_id: {이름: 데이터}}` 형식의 JSON 파일
+        snapshot_path: 기록할 스냅샷 경로
+
+    Returns:
+        변환된 사용자 수
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    blobs: dict[bytes, bytes] = {}
+
+    def users() -> Iterator[tuple[int, bytes, int]]:
+        for user_id, embeds in raw.items():
+            if not embeds:
+                continue
+            refs = {}
+            for name, embed_data in embeds.items():
+                # 이전 형식도 같은 내용이면 같은 blob이 되도록 정규화
+                blob = encode_blob(EmbedDocument.from_dict(embed_data).to_dict())
+                digest = blob_digest(blob)
+                blobs.setdefault(digest, blob)
+                refs[name] = digest
+            yield int(user_id), encode_refs(refs), len(refs)
+
+    def blob_records() -> Iterator[tuple[bytes, bytes]]:
+        # users()를 모두 기록한 뒤에 순회되므로 모든 blob이 모여 있음
+        yield from blobs.items()
+
+    return write_snapshot(snapshot_path, users(), blob_records())
+
+
+def snapshot_to_json(snapshot_path: str | Path, json_path: str | Path) -> int:
+    """스냅샷을 JSON 저장 파일로 변환
+
+    Args:
+        snapshot_path: 스냅샷 경로
+        json_path: 기록할 JSON 파일 경로
+
+    Returns:
+        변환된 사용자 수
+    """
+    with SnapshotReader(snapshot_path) as reader:
+        data = {str(user_id): embeds for user_id, embeds in reader.iter_users()}
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return len(data)
+
+
+def main() -> None:
+    """JSON <-> 스냅샷 변환 CLI"""
+    parser = argparse.ArgumentParser(description="임베드 스냅샷 변환")
+    parser.add_argument("command", choices=["from-json", "to-json"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+
+    if args.command == "from-json":
+        count = json_to_snapshot(args.source, args.destination)
+    else:
+        count = snapshot_to_json(args.source, args.destination)
+    print(f"변환 완료: {count}명")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""SQLite 기반 데이터 관리"""
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, TypeVar
+import discord
+
+from .constants import DATA_DIR, EXPORT_BATCH_SIZE, LIST_PAGE_SIZE
+from .data_manager import DataManager, EmbedPage, JsonDataManager
+from .embed_document import EmbedDocument
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SqliteDataManager"]
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeds (
+    user_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_id, name)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS embeds_name_nocase ON embeds (user_id, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS embeds_recent ON embeds (user_id, updated_at);
+"""
+
+# `PRAGMA user_version` 값 (JSON 저장소 이전을 마친 데이터베이스)
+_VERSION_MIGRATED = 1
+
+
+class SqliteDataManager(DataManager):
+    """SQLite(WAL) 저장소
+
+    모든 쿼리는 전용 스레드 하나에서 실행되므로 이벤트 루프를 막지 않으며,
+    조회는 `(user_id, name)` 기본 키 인덱스를 사용하는 단건 조회입니다.
+    """
+
+    def __init__(self, bot: discord.Bot):
+        super().__init__(bot)
+        self.db_file = DATA_DIR / "embeds.db"
+        self._executor: ThreadPoolExecutor | None = None
+        self._conn: sqlite3.Connection | None = None
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """전용 DB 스레드에서 함수 실행"""
+        if self._executor is None:
+            raise RuntimeError("저장소가 열려 있지 않습니다")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def load_data(self) -> None:
+        """데이터베이스 열기 (최초 실행 시 JSON 데이터 이전)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="seri-sqlite")
+        self._loaded = False
+        await self._run(self._open)
+        self._loaded = True
+
+    async def save_data(self) -> None:
+        """WAL 체크포인트"""
+        if self._conn is None:
+            return
+        await self._run(self._checkpoint, "PASSIVE")
+
+    async def close(self) -> None:
+        """데이터베이스 닫기"""
+        if self._executor is None:
+            return
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """데이터베이스 및 WAL 파일 크기"""
+        wal_file = self.db_file.with_name(f"{self.db_file.name}-wal")
+        return {
+            "database_bytes": self.db_file.stat().st_size if self.db_file.exists() else 0,
+            "wal_bytes": wal_file.stat().st_size if wal_file.exists() else 0,
+        }
+
+    def _open(self) -> None:
+        """연결 생성 및 스키마 준비 (DB 스레드)
+
+        JSON 저장소 이전 여부는 파일 존재가 아니라 `user_version`으로 판단하므로,
+        이전 도중 실패하면 다음 실행 때 다시 시도합니다.
+        """
+        conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        self._conn = conn
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _VERSION_MIGRATED:
+            self._migrate_from_json()
+
+    def _mark_migrated(self) -> None:
+        """이전 완료 기록 (열린 트랜잭션 안에서 호출하면 함께 커밋됨)"""
+        self._conn.execute(f"PRAGMA user_version = {_VERSION_MIGRATED}")
+
+    def _migrate_from_json(self) -> None:
+        """기존 JSON 저장소 데이터를 한 번만 이전 (DB 스레드)"""
+        # 이전 기록이 없던 버전에서 만든 데이터베이스는 이미 이전된 것으로 간주
+        # (다시 이전하면 삭제/수정한 임베드가 JSON 내용으로 되돌아감)
+        if self._conn.execute("SELECT 1 FROM embeds LIMIT 1").fetchone() is not None:
+            with self._conn:
+                self._mark_migrated()
+            return
+
+        json_manager = JsonDataManager(self.bot)
+        if not json_manager.has_data():
+            with self._conn:
+                self._mark_migrated()
+            return
+
+        json_manager._load_embeds()
+        try:
+            now = time.time()
+            rows = [
+                (user_id, name, json.dumps(data, ensure_ascii=False), now)
+                for user_id, embeds in json_manager._iter_user_embeds()
+                for name, data in embeds.items()
+            ]
+        finally:
+            json_manager._close_snapshot()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeds (user_id, name, data, updated_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._mark_migrated()
+        logger.info(f"JSON 저장소 이전 완료: {len(rows)}개")
+
+    def _checkpoint(self, mode: str) -> None:
+        """WAL 체크포인트 (DB 스레드)"""
+        self._conn.execute(f"PRAGMA wal_checkpoint({mode})")
+
+    def _close(self) -> None:
+        """연결 종료 (DB 스레드)"""
+        if self._conn is None:
+            return
+        try:
+            self._checkpoint("TRUNCATE")
+        except sqlite3.Error as e:
+            logger.error(f"체크포인트 실패: {e}")
+        self._conn.close()
+        self._conn = None
+
+    def _put_many(self, user_id: int, records: list[tuple[str, str]]) -> None:
+        """임베드 여러 개를 한 트랜잭션으로 저장 (DB 스레드)"""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeds (user_id, name, data, updated_at) VALUES (?, ?, ?, ?)",
+                [(user_id, embed_name, payload, now) for embed_name, payload in records]
+            )
+
+    def _get(self, user_id: int, embed_name: str) -> str | None:
+        """임베드 조회 (DB 스레드)"""
+        row = self._conn.execute(
+            "SELECT data FROM embeds WHERE user_id = ? AND name = ?",
+            (user_id, embed_name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _delete(self, user_id: int, embed_name: str) -> bool:
+        """임베드 삭제 (DB 스레드)"""
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM embeds WHERE user_id = ? AND name = ?",
+                (user_id, embed_name)
+            )
+        return cursor.rowcount > 0
+
+    def _list(self, user_id: int) -> list[str]:
+        """임베드 이름 조회 (DB 스레드)"""
+        rows = self._conn.execute(
+            "SELECT name FROM embeds WHERE user_id = ? ORDER BY name",
+            (user_id,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _rows_after(self, user_id: int, after: str | None, limit: int) -> list[tuple[str, str]]:
+        """이름순 키셋 배치 조회 (DB 스레드)"""
+        if after is None:
+            return self._conn.execute(
+                "SELECT name, data FROM embeds WHERE user_id = ? ORDER BY name LIMIT ?",
+                (user_id, limit)
+            ).fetchall()
+        return self._conn.execute(
+            "SELECT name, data FROM embeds WHERE user_id = ? AND name > ? ORDER BY name LIMIT ?",
+            (user_id, after, limit)
+        ).fetchall()
+
+    def _exists(self, user_id: int, embed_name: str) -> bool:
+        """임베드 존재 확인 (DB 스레드)"""
+        row = self._conn.execute(
+            "SELECT 1 FROM embeds WHERE user_id = ? AND name = ?",
+            (user_id, embed_name)
+        ).fetchone()
+        return row is not None
+
+    def _search(self, user_id: int, prefix: str, limit: int) -> list[str]:
+        """접두사 범위 검색 (DB 스레드)"""
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rows = self._conn.execute(
+            "SELECT name FROM embeds WHERE user_id = ? AND name LIKE ? ESCAPE '\\' "
+            "ORDER BY name COLLATE NOCASE LIMIT ?",
+            (user_id, f"{escaped}%", limit)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _page(self, user_id: int, sort: str, cursor: str | None, limit: int) -> EmbedPage:
+        """키셋 페이지 조회 (DB 스레드)"""
+        if sort == "recent":
+            query = "SELECT name, updated_at FROM embeds WHERE user_id = ?"
+            params: list[Any] = [user_id]
+            if cursor is not None:
+                updated_at, name = json.loads(cursor)
+                query += " AND (updated_at < ? OR (updated_at = ? AND name > ?))"
+                params += [updated_at, updated_at, name]
+            query += " ORDER BY updated_at DESC, name LIMIT ?"
+        else:
+            query = "SELECT name, NULL FROM embeds WHERE user_id = ?"
+            params = [user_id]
+            if cursor is not None:
+                query += (
+                    " AND (name > ? COLLATE NOCASE"
+                    " OR (name = ? COLLATE NOCASE AND name > ?))"
+                )
+                params += [cursor, cursor, cursor]
+            query += " ORDER BY name COLLATE NOCASE, name LIMIT ?"
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        rows = self._conn.execute(query, (*params, limit + 1)).fetchall()
+        total = self._conn.execute(
+            "SELECT COUNT(*) FROM embeds WHERE user_id = ?", (user_id,)
+        ).fetchone()[0]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_name, last_updated = rows[-1]
+            next_cursor = json.dumps([last_updated, last_name]) if sort == "recent" else last_name
+        return EmbedPage([row[0] for row in rows], next_cursor, total)
+
+    async def save_embed(self, user_id: int, embed_name: str, embed_data: EmbedDocument) -> None:
+        """임베드 저장"""
+        await self.save_embeds(user_id, [(embed_name, embed_data)])
+
+    async def save_embeds(self, user_id: int, embeds: list[tuple[str, EmbedDocument]]) -> None:
+        """여러 임베드를 한 번에 저장"""
+        for _, embed_data in embeds:
+            embed_data.validate()
+        records = [
+            (embed_name, json.dumps(embed_data.to_dict(), ensure_ascii=False, separators=(",", ":")))
+            for embed_name, embed_data in embeds
+        ]
+        await self._run(self._put_many, user_id, records)
+        self._notify_change(user_id)
+
+    async def get_embed(self, user_id: int, embed_name: str) -> EmbedDocument | None:
+        """임베드 조회"""
+        payload = await self._run(self._get, user_id, embed_name)
+        return EmbedDocument.from_dict(json.loads(payload)) if payload is not None else None
+
+    async def delete_embed(self, user_id: int, embed_name: str) -> bool:
+        """임베드 삭제"""
+        deleted = await self._run(self._delete, user_id, embed_name)
+        if deleted:
+            self._notify_change(user_id)
+        return deleted
+
+    async def list_embeds(self, user_id: int) -> list[str]:
+        """사용자의 모든 임베드 이름 조회"""
+        return await self._run(self._list, user_id)
+
+    async def iter_embeds(self, user_id: int) -> AsyncIterator[tuple[str, EmbedDocument]]:
+        """사용자의 모든 임베드를 이름순으로 차례로 조회 (배치 단위 키셋 조회)"""
+        after = None
+        while True:
+            rows = await self._run(self._rows_after, user_id, after, EXPORT_BATCH_SIZE)
+            for embed_name, payload in rows:
+                yield embed_name, EmbedDocument.from_dict(json.loads(payload))
+            if len(rows) < EXPORT_BATCH_SIZE:
+                return
+            after = rows[-1][0]
+
+    async def embed_exists(self, user_id: int, embed_name: str) -> bool:
+        """임베드 존재 여부 확인"""
+        return await self._run(self._exists, user_id, embed_name)
+
+    async def search_embed_names(self, user_id: int, prefix: str, limit: int = 25) -> list[str]:
+        """접두사로 임베드 이름 검색 (NOCASE 인덱스 범위 조회)"""
+        return await self._run(self._search, user_id, prefix, limit)
+
+    async def list_embeds_page(
+        self,
+        user_id: int,
+        sort: str = "name",
+        cursor: str | None = None,
+        limit: int = LIST_PAGE_SIZE
+    ) -> EmbedPage:
+        """커서 기반 임베드 이름 페이지 조회 (인덱스 키셋 페이지네이션)"""
+        return await self._run(self._page, user_id, sort, cursor, limit)
@@ -0,0 +1,187 @@
+"""쓰기 지연(write-behind) 큐
+
+변경 사항은 사용자별 더티 상태로만 기록되고 즉시 반환됩니다.
+단일 writer 태스크가 짧은 시간 동안 변경을 모은 뒤, 더티 상태만
+스레드에서 한 번에 디스크에 반영합니다.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
+from .constants import WRITE_BEHIND_DELAY
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["WriteBehindQueue", "PendingWrites"]
+
+# 사용자 ID -> {임베드 이름: 임베드 데이터 (삭제는 None)}
+PendingWrites = dict[int, dict[str, Any]]
+
+_MISSING = object()
+
+
+class WriteBehindQueue:
+    """사용자 단위 더티 추적 및 병합 쓰기
+
+    Args:
+        flush_func: 더티 상태를 디스크에 반영하는 함수 (스레드에서 실행)
+        delay: 첫 변경 후 병합을 기다리는 시간 (초)
+    """
+
+    def __init__(self, flush_func: Callable[[PendingWrites], None], delay: float = WRITE_BEHIND_DELAY):
+        self.flush_func = flush_func
+        self.delay = delay
+        self.lock = asyncio.Lock()
+
+        self._pending: PendingWrites = {}
+        self._inflight: PendingWrites = {}
+        self._pending_count = 0
+        # 반영 중인 변경이 비워질 때마다 증가 (디스크를 읽는 동안 반영이 끝났는지 확인용)
+        self.flush_generation = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.flush_count = 0
+        self.flushed_writes = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    @property
+    def pending_writes(self) -> int:
+        """반영 대기 중인 변경 수"""
+        return self._pending_count
+
+    def start(self) -> None:
+        """writer 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._writer_loop())
+
+    def mark(self, user_id: int, embed_name: str, embed_data: Any) -> None:
+        """변경 기록 (즉시 반환)
+
+        같은 임베드에 대한 연속 변경은 마지막 값 하나로 병합됩니다.
+
+        Args:
+            user_id: 사용자 ID
+            embed_name: 임베드 이름
+            embed_data: 임베드 데이터 (삭제는 None)
+        """
+        user_pending = self._pending.setdefault(user_id, {})
+        if user_pending.pop(embed_name, _MISSING) is _MISSING:
+            self._pending_count += 1
+        # 기록 순서가 최근 변경 순서가 되도록 항상 끝에 추가
+        user_pending[embed_name] = embed_data
+        self._wakeup.set()
+
+    def pending_for(self, user_id: int) -> list[dict[str, Any]]:
+        """디스크 반영이 끝나지 않은 사용자 변경 (오래된 순서)
+
+        디스크를 읽은 뒤 덮어쓸 때는 읽기 전후의 `flush_generation`이 같아야
+        합니다. 그 사이 반영이 끝났으면 여기서 빠진 변경이 읽은 내용에 없을 수 있습니다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            반영 중인 변경과 대기 중인 변경 목록
+        """
+        return [
+            changes[user_id]
+            for changes in (self._inflight, self._pending)
+            if user_id in changes
+        ]
+
+    async def flush(self) -> None:
+        """대기 중인 변경을 즉시 반영"""
+        async with self.lock:
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            count, self._pending_count = self._pending_count, 0
+            self._inflight = pending
+
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.flush_func, pending)
+            except asyncio.CancelledError:
+                # 스레드 쓰기 완료 여부를 알 수 없으므로 다시 반영 (재적용은 멱등)
+                self._restore(pending)
+                raise
+            except Exception as e:
+                logger.error(f"지연 쓰기 실패: {e}")
+                self.failed_flushes += 1
+                self._restore(pending)
+                return
+            finally:
+                self._inflight = {}
+                self.flush_generation += 1
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.flush_count += 1
+            self.flushed_writes += count
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self.total_flush_ms += elapsed_ms
+
+    def _restore(self, failed: PendingWrites) -> None:
+        """실패한 변경을 다시 대기열에 넣기 (이후 변경 우선)"""
+        for user_id, changes in failed.items():
+            user_pending = self._pending.setdefault(user_id, {})
+            for embed_name, embed_data in changes.items():
+                if embed_name not in user_pending:
+                    user_pending[embed_name] = embed_data
+                    self._pending_count += 1
+        self._wakeup.set()
+
+    async def _writer_loop(self) -> None:
+        """변경을 모아서 주기적으로 반영"""
+        while True:
+            try:
+                await self._wakeup.wait()
+                await asyncio.sleep(self.delay)
+                self._wakeup.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"지연 쓰기 루프 오류: {e}")
+
+    async def close(self, timeout: float) -> None:
+        """writer 태스크 종료 및 마지막 반영
+
+        Args:
+            timeout: 마지막 반영 최대 대기 시간 (초)
+        """
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"종료 시 지연 쓰기 시간 초과: {self._pending_count}건 미반영")
+
+    def get_stats(self) -> dict[str, float]:
+        """쓰기 통계
+
+        Returns:
+            대기 변경 수 및 반영 지연 시간 통계
+        """
+        return {
+            "pending_writes": self._pending_count,
+            "flush_count": self.flush_count,
+            "flushed_writes": self.flushed_writes,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "avg_flush_ms": self.total_flush_ms / self.flush_count if self.flush_count else 0.0,
+        }